@@ -0,0 +1,148 @@
+"""Benchmark shopping list matching against the original nested loop.
+
+Run from the repository root:
+
+    python benchmarks/bench_matcher.py
+"""
+
+from difflib import SequenceMatcher
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.organic_box.const import MATCH_ENGINE_VECTOR  # noqa: E402
+from custom_components.organic_box.models import BasketItem  # noqa: E402
+from custom_components.organic_box.shopping_list_matcher import (  # noqa: E402
+    PreparedShoppingList,
+    ShoppingListMatcher,
+)
+
+# (basket items, shopping list items)
+WORKLOADS = [(100, 200), (40, 500), (300, 300)]
+ROUNDS = 5
+
+_WORDS = [
+    "tomatoes", "cherry", "carrots", "potatoes", "milk", "yoghurt", "butter",
+    "cheese", "apples", "pears", "bananas", "spinach", "lettuce", "onions",
+    "garlic", "bread", "rye", "oats", "eggs", "cucumber", "zucchini", "leek",
+    "kale", "beetroot", "lentils", "beans", "honey", "juice", "quark", "cream",
+]  # fmt: skip
+_DECORATIONS = ["Organic", "Bio", "Fresh", "Regional", "", "", ""]
+_UNITS = ["1kg", "500g", "1 l", "250 ml", "(bunch)", "", ""]
+
+
+def _name(rng: random.Random) -> str:
+    """Return a random product name."""
+    words = " ".join(rng.sample(_WORDS, rng.randint(1, 3)))
+    return f"{rng.choice(_DECORATIONS)} {words} {rng.choice(_UNITS)}".strip()
+
+
+def _naive_normalize(text: str) -> str:
+    """Normalize text the way the matcher did before caching."""
+    text = text.lower()
+    text = re.sub(r"\b(organic|bio|fresh|local|regional)\b", "", text)
+    text = re.sub(r"\d+\s*(kg|g|l|ml|pcs?|pack|bunch)", "", text)
+    text = re.sub(r"[^\w\s]", " ", text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\b(kg|g|l|ml|pcs?|pack|bunch)\b", "", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def _naive_similarity(text1: str, text2: str) -> float:
+    """Score two names the way the matcher did before caching."""
+    norm1 = _naive_normalize(text1)
+    norm2 = _naive_normalize(text2)
+    ratio = SequenceMatcher(None, norm1, norm2).ratio()
+    if norm1 in norm2 or norm2 in norm1:
+        ratio = max(ratio, 0.85)
+    words1 = set(norm1.split())
+    words2 = set(norm2.split())
+    if words1 and words2:
+        word_similarity = len(words1 & words2) / max(len(words1), len(words2))
+        ratio = 0.7 * ratio + 0.3 * word_similarity
+    return ratio
+
+
+def _naive_match(basket_items: list[BasketItem], shopping_items: list[dict]) -> dict:
+    """Match items with the original nested loop."""
+    matches = {}
+    for basket_item in basket_items:
+        best_match = None
+        best_score = 0.0
+        for shop_item in shopping_items:
+            shop_name = shop_item.get("name", "")
+            if not shop_name:
+                continue
+            similarity = _naive_similarity(basket_item.name, shop_name)
+            if similarity > best_score and similarity >= 0.8:
+                best_score = similarity
+                best_match = shop_item
+        if best_match:
+            matches[basket_item.name] = {
+                "shopping_list_item": best_match,
+                "similarity": best_score,
+            }
+    return matches
+
+
+def run(basket_size: int, list_size: int) -> None:
+    """Run one workload and print the timings."""
+    rng = random.Random(42)
+    basket = [
+        BasketItem(name=_name(rng), quantity=1.0, unit="pcs")
+        for _ in range(basket_size)
+    ]
+    shopping = [
+        {"id": str(index), "name": _name(rng), "complete": False}
+        for index in range(list_size)
+    ]
+    matcher = ShoppingListMatcher(None, threshold=0.8)
+
+    def prepared() -> dict:
+        return matcher.match_prepared(basket, PreparedShoppingList(shopping))
+
+    vector_matcher = ShoppingListMatcher(None, 0.8, MATCH_ENGINE_VECTOR)
+    assigning_matcher = ShoppingListMatcher(None, 0.8, one_to_one=True)
+
+    def assigned() -> dict:
+        return assigning_matcher.match_prepared(basket, PreparedShoppingList(shopping))
+
+    def vector() -> dict:
+        return vector_matcher.match_prepared(basket, PreparedShoppingList(shopping))
+
+    expected = _naive_match(basket, shopping)
+    assert prepared() == expected, "results differ"
+    agreeing = sum(
+        match["shopping_list_item"] is expected.get(name, {}).get("shopping_list_item")
+        for name, match in vector().items()
+    )
+
+    naive_time = min(
+        timeit.repeat(lambda: _naive_match(basket, shopping), number=1, repeat=ROUNDS)
+    )
+    prepared_time = min(timeit.repeat(prepared, number=1, repeat=ROUNDS))
+    vector_time = min(timeit.repeat(vector, number=1, repeat=ROUNDS))
+    assigned_time = min(timeit.repeat(assigned, number=1, repeat=ROUNDS))
+    print(f"workload: {basket_size} basket x {list_size} list items")
+    print(f"naive:    {naive_time * 1000:8.1f} ms")
+    print(f"prepared: {prepared_time * 1000:8.1f} ms")
+    print(f"speedup:  {naive_time / prepared_time:8.1f}x")
+    print(f"vector:   {vector_time * 1000:8.1f} ms")
+    print(f"speedup:  {naive_time / vector_time:8.1f}x")
+    print(f"vector matches agreeing with difflib: {agreeing} of {len(expected)}")
+    print(f"one-to-one: {assigned_time * 1000:6.1f} ms")
+
+
+def main() -> None:
+    """Run all workloads."""
+    for basket_size, list_size in WORKLOADS:
+        run(basket_size, list_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark the produce lexicon against the previous regex normalization.
+
+Run from the repository root:
+
+    python benchmarks/bench_normalize.py
+"""
+
+from difflib import SequenceMatcher
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.organic_box.lexicon import PRODUCE_LEXICON  # noqa: E402
+
+NAMES = 20000
+ROUNDS = 5
+THRESHOLD = 0.8
+
+_WORDS = [
+    "Möhren", "Karotten", "Erdäpfel", "Kartoffeln", "Tomaten", "Rote Bete",
+    "Grüne Bohnen", "Zwiebeln", "Lauch", "Spinat", "Äpfel", "Birnen", "Milch",
+    "Käse", "Joghurt", "Eier", "Brot", "tomatoes", "carrots", "potatoes",
+    "spinach", "leek", "milk", "cheese", "eggs", "bread", "festkochend",
+]  # fmt: skip
+_DECORATIONS = ["Organic", "Bio", "Fresh", "Regional", "", "", ""]
+_UNITS = ["1kg", "500g", "1 l", "250 ml", "(bunch)", "", ""]
+
+# Pairs naming the same product, German and English
+_PAIRS = [
+    ("Möhren", "Karotten"),
+    ("Möhren", "Carrots"),
+    ("Erdäpfel", "Kartoffeln"),
+    ("Kartoffeln festkochend", "Potatoes"),
+    ("Rote Bete", "Beetroot"),
+    ("Paradeiser", "Tomaten"),
+    ("Porree", "Lauch"),
+    ("Blumenkohl", "Karfiol"),
+    ("Süßkartoffeln", "Sweet Potatoes"),
+    ("Bio Joghurt 500g", "Yogurt"),
+]
+
+# The normalization chain the lexicon replaces
+_QUALIFIER_RE = re.compile(r"\b(organic|bio|fresh|local|regional)\b")
+_QUANTITY_RE = re.compile(r"\d+\s*(kg|g|l|ml|pcs?|pack|bunch)")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s]")
+_SPACES_RE = re.compile(r"\s+")
+_UNIT_RE = re.compile(r"\b(kg|g|l|ml|pcs?|pack|bunch)\b")
+
+
+def _regex_normalize(text: str) -> str:
+    """Normalize text with the previous regex chain."""
+    text = text.lower()
+    text = _QUALIFIER_RE.sub("", text)
+    text = _QUANTITY_RE.sub("", text)
+    text = _SPECIAL_CHARS_RE.sub(" ", text)
+    text = _SPACES_RE.sub(" ", text)
+    text = _UNIT_RE.sub("", text)
+    text = _SPACES_RE.sub(" ", text)
+    return text.strip()
+
+
+def _similarity(norm1: str, norm2: str) -> float:
+    """Score two normalized names like ShoppingListMatcher.get_similarity."""
+    ratio = SequenceMatcher(None, norm1, norm2).ratio()
+    if norm1 in norm2 or norm2 in norm1:
+        ratio = max(ratio, 0.85)
+    words1 = set(norm1.split())
+    words2 = set(norm2.split())
+    if words1 and words2:
+        word_similarity = len(words1 & words2) / max(len(words1), len(words2))
+        ratio = 0.7 * ratio + 0.3 * word_similarity
+    return ratio
+
+
+def _name(rng: random.Random) -> str:
+    """Return a random product name."""
+    words = " ".join(rng.sample(_WORDS, rng.randint(1, 3)))
+    return f"{rng.choice(_DECORATIONS)} {words} {rng.choice(_UNITS)}".strip()
+
+
+def main() -> None:
+    """Time both normalizations and compare their matches."""
+    rng = random.Random(42)
+    names = [_name(rng) for _ in range(NAMES)]
+
+    def regex() -> None:
+        for name in names:
+            _regex_normalize(name)
+
+    def lexicon() -> None:
+        for name in names:
+            PRODUCE_LEXICON.canonicalize(name)
+
+    regex_time = min(timeit.repeat(regex, number=1, repeat=ROUNDS))
+    lexicon_time = min(timeit.repeat(lexicon, number=1, repeat=ROUNDS))
+    print(f"normalizing {NAMES} names (uncached)")
+    print(f"regex chain: {regex_time * 1000:8.1f} ms")
+    print(f"lexicon:     {lexicon_time * 1000:8.1f} ms")
+    print(f"ratio:       {lexicon_time / regex_time:8.2f}x")
+
+    print(f"synonym pairs reaching the default threshold of {THRESHOLD}:")
+    for name, normalize in (
+        ("regex chain", _regex_normalize),
+        ("lexicon", PRODUCE_LEXICON.canonicalize),
+    ):
+        reached = sum(
+            _similarity(normalize(first), normalize(second)) >= THRESHOLD
+            for first, second in _PAIRS
+        )
+        print(f"{name + ':':12} {reached} of {len(_PAIRS)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,39 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import CONF_PROVIDER, CONF_SHOP_ID, DOMAIN, PROVIDER_OEKOBOX
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .aliases import alias_store_key
+from .const import (
+    CONF_MAX_REQUEST_RATE,
+    CONF_PROVIDER,
+    CONF_SHOP_ID,
+    DEFAULT_MAX_REQUEST_RATE,
+    DOMAIN,
+    PROVIDER_OEKOBOX,
+    STORAGE_VERSION,
+)
 from .coordinator import OrganicBoxDataUpdateCoordinator
+from .ledger import ledger_store_key
 from .oekobox import OekoBoxProvider
+from .pool import async_get_client_pool
 from .provider import OrganicBoxProvider
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Organic Box integration."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Organic Box from a config entry."""
@@ -27,24 +50,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create the appropriate provider
     provider: OrganicBoxProvider
     if provider_type == PROVIDER_OEKOBOX:
-        provider = OekoBoxProvider(hass, username, password, shop_id, entry)
+        # Entries of the same account share one client and session
+        connection = async_get_client_pool(hass).acquire(
+            shop_id,
+            username,
+            entry.options.get(CONF_MAX_REQUEST_RATE, DEFAULT_MAX_REQUEST_RATE),
+        )
+        provider = OekoBoxProvider(
+            hass, username, password, shop_id, entry, connection=connection
+        )
     else:
         _LOGGER.error("Unknown provider type: %s", provider_type)
         return False
 
-    # Authenticate with the provider
     try:
-        if not await provider.authenticate():
-            raise ConfigEntryNotReady("Failed to authenticate with provider")
-    except Exception as err:
-        _LOGGER.error("Error authenticating with provider: %s", err)
-        raise ConfigEntryNotReady from err
-
-    # Create the data update coordinator
-    coordinator = OrganicBoxDataUpdateCoordinator(hass, provider, entry)
-
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+        coordinator = await _async_setup_coordinator(hass, entry, provider)
+    except Exception:
+        await _async_close_provider(hass, entry, provider)
+        raise
 
     # Store the coordinator
     hass.data.setdefault(DOMAIN, {})
@@ -59,15 +82,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_setup_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, provider: OrganicBoxProvider
+) -> OrganicBoxDataUpdateCoordinator:
+    """Create the coordinator of an entry and load its first data.
+
+    Raises:
+        ConfigEntryNotReady: If the provider is not reachable and nothing is stored
+    """
+    coordinator = OrganicBoxDataUpdateCoordinator(hass, provider, entry)
+    await coordinator.completion_ledger.async_load()
+    await coordinator.alias_table.async_load()
+
+    if await coordinator.async_restore_data():
+        # Serve the last good data right away and revalidate it in the background,
+        # so startup does not wait for the provider
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN}_revalidate_{entry.entry_id}",
+        )
+    else:
+        # Authenticate with the provider
+        try:
+            if not await provider.authenticate():
+                raise ConfigEntryNotReady("Failed to authenticate with provider")
+        except Exception as err:
+            _LOGGER.error("Error authenticating with provider: %s", err)
+            raise ConfigEntryNotReady from err
+
+        # Fetch initial data
+        await coordinator.async_config_entry_first_refresh()
+
+    return coordinator
+
+
+async def _async_close_provider(
+    hass: HomeAssistant, entry: ConfigEntry, provider: OrganicBoxProvider
+) -> None:
+    """Close a provider and release its pooled connection."""
+    await provider.close()
+    if entry.data[CONF_PROVIDER] == PROVIDER_OEKOBOX:
+        async_get_client_pool(hass).release(
+            entry.data.get(CONF_SHOP_ID), entry.data[CONF_USERNAME]
+        )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Close the provider connection
+        # Close the provider connection and release it from the client pool
         coordinator: OrganicBoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-        await coordinator.provider.close()
+        await _async_close_provider(hass, entry, coordinator.provider)
 
         # Remove the coordinator from hass.data
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -78,3 +147,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted data of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await Store(hass, STORAGE_VERSION, ledger_store_key(entry.entry_id)).async_remove()
+    await Store(hass, STORAGE_VERSION, alias_store_key(entry.entry_id)).async_remove()
@@ -0,0 +1,203 @@
+"""Learned aliases between basket items and shopping list names."""
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import ALIAS_CONFIRMATIONS, DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .models import BasketItem
+from .shopping_list_matcher import ShoppingListMatcher
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def alias_store_key(entry_id: str) -> str:
+    """Return the storage key of the alias table of a config entry."""
+    return f"{DOMAIN}.{entry_id}.aliases"
+
+
+class AliasTable:
+    """Persisted mapping of basket items to shopping list names.
+
+    Items are keyed by their product id, or by their name if the provider has
+    none. Names are stored as given and normalized on lookup, so the aliases
+    follow changes of the normalization. A basket item with an alias matches
+    the shopping list entry of that name without fuzzy scoring.
+
+    Aliases are learned explicitly, or once the same match was confirmed for
+    ALIAS_CONFIRMATIONS orders.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the alias table.
+
+        Args:
+            hass: Home Assistant instance
+            entry_id: ID of the config entry owning the table
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, alias_store_key(entry_id)
+        )
+        # Key -> shopping list name, and key -> name of the basket item
+        self._aliases: dict[str, str] = {}
+        self._items: dict[str, str] = {}
+        # Key -> [shopping list name, number of orders confirming it]
+        self._confirmations: dict[str, list] = {}
+        # Normalized basket item name -> key, rebuilt on every change
+        self._keys_by_name: dict[str, str] = {}
+        # Bumped on every change so cached matches can be invalidated
+        self.version = 0
+
+    @staticmethod
+    def key(item: BasketItem) -> str:
+        """Return the key of a basket item."""
+        if item.product_id:
+            return f"product:{item.product_id}"
+        return f"name:{item.name}"
+
+    def __len__(self) -> int:
+        """Return the number of aliases."""
+        return len(self._aliases)
+
+    async def async_load(self) -> None:
+        """Load the aliases from storage."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Ignoring unreadable alias table: %s", err)
+            return
+        if stored:
+            self._aliases = stored.get("aliases", {})
+            self._items = stored.get("items", {})
+            self._confirmations = stored.get("confirmations", {})
+            self._reindex()
+            self.version += 1
+
+    def _lookup_key(self, item: BasketItem) -> str | None:
+        """Return the key an item's alias is stored under, if any."""
+        if item.product_id:
+            return self.key(item)
+        return self._keys_by_name.get(ShoppingListMatcher.normalize_text(item.name))
+
+    def get(self, item: BasketItem) -> str | None:
+        """Return the normalized shopping list name learned for a basket item."""
+        key = self._lookup_key(item)
+        if key is None or (name := self._aliases.get(key)) is None:
+            return None
+        return ShoppingListMatcher.normalize_text(name)
+
+    def resolve(self, name: str) -> BasketItem:
+        """Return a basket item by name, with the product id of its alias.
+
+        Args:
+            name: Name of the basket item
+
+        Returns:
+            Item with the product id it was learned with, if any
+        """
+        key = self._keys_by_name.get(ShoppingListMatcher.normalize_text(name), "")
+        product_id = (
+            key.removeprefix("product:") if key.startswith("product:") else None
+        )
+        return BasketItem(name=name, quantity=0, product_id=product_id)
+
+    def learn(self, item: BasketItem, shopping_name: str) -> bool:
+        """Remember the shopping list name a basket item matches.
+
+        Args:
+            item: The basket item
+            shopping_name: Name of the shopping list entry
+
+        Returns:
+            True if the table changed
+        """
+        normalized = ShoppingListMatcher.normalize_text(shopping_name)
+        if not normalized or self.get(item) == normalized:
+            return False
+        key = self.key(item)
+        self._aliases[key] = shopping_name
+        self._items[key] = item.name
+        self._async_changed()
+        _LOGGER.debug("Learned alias %s -> %s", key, shopping_name)
+        return True
+
+    def confirm(self, item: BasketItem, shopping_name: str) -> bool:
+        """Count an order confirming that a basket item matches a list entry.
+
+        A single fuzzy match may be wrong, so it only becomes an alias once
+        ALIAS_CONFIRMATIONS orders confirmed it. Confirming another entry
+        starts counting again.
+
+        Args:
+            item: The basket item
+            shopping_name: Name of the completed shopping list entry
+
+        Returns:
+            True if the match was learned
+        """
+        normalized = ShoppingListMatcher.normalize_text(shopping_name)
+        if not normalized or self.get(item) == normalized:
+            return False
+        key = self.key(item)
+        name, count = self._confirmations.get(key, ("", 0))
+        if ShoppingListMatcher.normalize_text(name) != normalized:
+            count = 0
+        count += 1
+        if count >= ALIAS_CONFIRMATIONS:
+            del self._confirmations[key]
+            return self.learn(item, shopping_name)
+        self._confirmations[key] = [shopping_name, count]
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        return False
+
+    def forget(self, item: BasketItem) -> bool:
+        """Forget the aliases of a basket item.
+
+        Both the alias of the item's product and the alias found by its name
+        are removed, so an item resolved without its product id is forgotten
+        as well.
+
+        Args:
+            item: The basket item
+
+        Returns:
+            True if an alias was removed
+        """
+        keys = {
+            self.key(item),
+            self._keys_by_name.get(ShoppingListMatcher.normalize_text(item.name)),
+        }
+        removed = [key for key in keys if key and self._aliases.pop(key, None)]
+        for key in removed:
+            self._items.pop(key, None)
+            self._confirmations.pop(key, None)
+        if not removed:
+            return False
+        self._async_changed()
+        return True
+
+    def _reindex(self) -> None:
+        """Rebuild the lookup of keys by normalized basket item name."""
+        self._keys_by_name = {}
+        for key in self._aliases:
+            name = self._items.get(key)
+            if name is None and key.startswith("name:"):
+                name = key.removeprefix("name:")
+            if name:
+                self._keys_by_name[ShoppingListMatcher.normalize_text(name)] = key
+
+    def _async_changed(self) -> None:
+        """Invalidate cached matches and schedule a save."""
+        self._reindex()
+        self.version += 1
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the data to persist in storage."""
+        return {
+            "aliases": self._aliases,
+            "items": self._items,
+            "confirmations": self._confirmations,
+        }
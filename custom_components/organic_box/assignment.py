@@ -0,0 +1,153 @@
+"""One-to-one assignment of basket items to shopping list entries."""
+
+from collections import defaultdict
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _hungarian(weights: list[list[float]]) -> list[int]:
+    """Solve a dense maximum-weight assignment with the Hungarian method.
+
+    Args:
+        weights: Row by column weights with no more rows than columns
+
+    Returns:
+        The column assigned to each row
+    """
+    rows = len(weights)
+    cols = len(weights[0])
+    # Potentials and matching are 1-indexed; column 0 is a virtual start
+    row_potential = [0.0] * (rows + 1)
+    col_potential = [0.0] * (cols + 1)
+    col_owner = [0] * (cols + 1)
+    previous = [0] * (cols + 1)
+
+    for row in range(1, rows + 1):
+        col_owner[0] = row
+        current = 0
+        min_slack = [float("inf")] * (cols + 1)
+        visited = [False] * (cols + 1)
+        while True:
+            visited[current] = True
+            owner = col_owner[current]
+            delta = float("inf")
+            next_col = 0
+            for col in range(1, cols + 1):
+                if visited[col]:
+                    continue
+                slack = (
+                    -weights[owner - 1][col - 1]
+                    - row_potential[owner]
+                    - col_potential[col]
+                )
+                if slack < min_slack[col]:
+                    min_slack[col] = slack
+                    previous[col] = current
+                if min_slack[col] < delta:
+                    delta = min_slack[col]
+                    next_col = col
+            for col in range(cols + 1):
+                if visited[col]:
+                    row_potential[col_owner[col]] += delta
+                    col_potential[col] -= delta
+                else:
+                    min_slack[col] -= delta
+            current = next_col
+            if col_owner[current] == 0:
+                break
+        # Flip the augmenting path
+        while current:
+            prior = previous[current]
+            col_owner[current] = col_owner[prior]
+            current = prior
+
+    assignment = [-1] * rows
+    for col in range(1, cols + 1):
+        if col_owner[col]:
+            assignment[col_owner[col] - 1] = col - 1
+    return assignment
+
+
+def _components(
+    edges: dict[tuple[int, int], float],
+) -> list[tuple[list[int], list[int]]]:
+    """Split a bipartite graph into connected components.
+
+    Args:
+        edges: Weights keyed by (row, column)
+
+    Returns:
+        The sorted rows and columns of each component
+    """
+    parent: dict[tuple[str, int], tuple[str, int]] = {}
+
+    def find(node: tuple[str, int]) -> tuple[str, int]:
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for row, col in edges:
+        parent[find(("row", row))] = find(("col", col))
+
+    groups: dict[tuple[str, int], tuple[list[int], list[int]]] = defaultdict(
+        lambda: ([], [])
+    )
+    for node in list(parent):
+        kind, index = node
+        groups[find(node)][0 if kind == "row" else 1].append(index)
+    return [(sorted(rows), sorted(cols)) for rows, cols in groups.values()]
+
+
+def max_weight_assignment(edges: dict[tuple[int, int], float]) -> dict[int, int]:
+    """Assign rows to columns so no column is used twice and the total is maximal.
+
+    The graph is split into connected components. Where every row of a
+    component already has a different best column, those are used as they
+    are; only components with contested columns are solved with the
+    Hungarian method, so sparse candidate sets of a few hundred rows and
+    columns stay cheap.
+
+    Args:
+        edges: Positive weights keyed by (row, column); missing pairs cannot
+            be assigned
+
+    Returns:
+        The column assigned to each row that got one
+    """
+    adjacency: dict[int, list[int]] = defaultdict(list)
+    for row, col in edges:
+        adjacency[row].append(col)
+
+    assignment: dict[int, int] = {}
+    for rows, cols in _components(edges):
+        # Best column per row, earliest column on ties
+        greedy = {
+            row: max(adjacency[row], key=lambda col, row=row: (edges[row, col], -col))
+            for row in rows
+        }
+        if len(set(greedy.values())) == len(greedy):
+            assignment.update(greedy)
+            continue
+
+        _LOGGER.debug(
+            "Solving assignment for %d rows competing for %d columns",
+            len(rows),
+            len(cols),
+        )
+        transpose = len(rows) > len(cols)
+        left, right = (cols, rows) if transpose else (rows, cols)
+        weights = [
+            [edges.get((b, a) if transpose else (a, b), 0.0) for b in right]
+            for a in left
+        ]
+        for left_index, right_index in enumerate(_hungarian(weights)):
+            if right_index < 0 or weights[left_index][right_index] <= 0:
+                continue
+            if transpose:
+                assignment[right[right_index]] = left[left_index]
+            else:
+                assignment[left[left_index]] = right[right_index]
+    return assignment
@@ -8,10 +8,10 @@ from homeassistant.const import CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import OrganicBoxDataUpdateCoordinator
+from .entity import OrganicBoxEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,9 +28,7 @@ async def async_setup_entry(
         async_add_entities([OrganicBoxPauseDeliveryButton(coordinator, entry)])
 
 
-class OrganicBoxPauseDeliveryButton(
-    CoordinatorEntity[OrganicBoxDataUpdateCoordinator], ButtonEntity
-):
+class OrganicBoxPauseDeliveryButton(OrganicBoxEntity, ButtonEntity):
     """One-shot button to pause the next delivery."""
 
     _attr_has_entity_name = True
@@ -66,8 +64,8 @@ class OrganicBoxPauseDeliveryButton(
     async def async_press(self) -> None:
         """Pause the next delivery."""
         _LOGGER.debug("Pausing next delivery")
-        success = await self.coordinator.provider.pause_next_delivery()
-        if success:
-            await self.coordinator.async_request_refresh()
+        record = await self.coordinator.provider.pause_next_delivery()
+        if record is not None:
+            self.coordinator.async_apply_pause_record(record)
         else:
             _LOGGER.error("Failed to pause delivery")
@@ -0,0 +1,67 @@
+"""In-memory caches for the Organic Box integration."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import timedelta
+import time
+from typing import Generic, TypeVar
+
+_KT = TypeVar("_KT", bound=Hashable)
+_VT = TypeVar("_VT")
+
+
+class TTLCache(Generic[_KT, _VT]):
+    """Bounded least-recently-used cache whose entries expire after a TTL."""
+
+    def __init__(self, max_size: int, ttl: timedelta) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before the oldest is evicted
+            ttl: Time after which an entry is no longer returned
+        """
+        self._max_size = max_size
+        self._ttl = ttl.total_seconds()
+        self._entries: OrderedDict[_KT, tuple[float, _VT]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: _KT) -> _VT | None:
+        """Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value or None
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self._ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: _KT, value: _VT) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
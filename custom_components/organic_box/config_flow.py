@@ -10,22 +10,35 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.selector import (
+    EntitySelector,
+    EntitySelectorConfig,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
+    TimeSelector,
 )
 
 from .const import (
     CONF_AUTO_CANCEL_ON_PAUSE_CONFLICT,
     CONF_ENABLE_SHOPPING_LIST_MATCH,
+    CONF_MATCH_ENGINE,
+    CONF_MATCH_ONE_TO_ONE,
     CONF_MATCH_THRESHOLD,
+    CONF_MAX_REQUEST_RATE,
     CONF_PROVIDER,
+    CONF_QUIET_END,
+    CONF_QUIET_START,
     CONF_SHOP_ID,
+    CONF_TODO_ENTITIES,
+    DEFAULT_MATCH_ENGINE,
     DEFAULT_MATCH_THRESHOLD,
+    DEFAULT_MAX_REQUEST_RATE,
     DOMAIN,
+    MATCH_ENGINE_DIFFLIB,
+    MATCH_ENGINE_VECTOR,
     PROVIDER_OEKOBOX,
 )
 from .oekobox import OekoBoxProvider
@@ -36,6 +49,11 @@ PROVIDERS = {
     PROVIDER_OEKOBOX: "OekoBox Online",
 }
 
+MATCH_ENGINES = {
+    MATCH_ENGINE_DIFFLIB: "Exact (difflib)",
+    MATCH_ENGINE_VECTOR: "Fast approximate (NumPy)",
+}
+
 
 class OrganicBoxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Organic Box."""
@@ -282,12 +300,68 @@ class OrganicBoxOptionsFlow(config_entries.OptionsFlow):
                             mode=NumberSelectorMode.SLIDER,
                         )
                     ),
+                    vol.Optional(
+                        CONF_MATCH_ENGINE,
+                        default=self.config_entry.options.get(
+                            CONF_MATCH_ENGINE, DEFAULT_MATCH_ENGINE
+                        ),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[
+                                {"value": key, "label": value}
+                                for key, value in MATCH_ENGINES.items()
+                            ],
+                            mode=SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_MATCH_ONE_TO_ONE,
+                        default=self.config_entry.options.get(
+                            CONF_MATCH_ONE_TO_ONE, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TODO_ENTITIES,
+                        default=self.config_entry.options.get(CONF_TODO_ENTITIES, []),
+                    ): EntitySelector(
+                        EntitySelectorConfig(domain="todo", multiple=True)
+                    ),
                     vol.Optional(
                         CONF_AUTO_CANCEL_ON_PAUSE_CONFLICT,
                         default=self.config_entry.options.get(
                             CONF_AUTO_CANCEL_ON_PAUSE_CONFLICT, False
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_QUIET_START,
+                        description={
+                            "suggested_value": self.config_entry.options.get(
+                                CONF_QUIET_START
+                            )
+                        },
+                    ): TimeSelector(),
+                    vol.Optional(
+                        CONF_QUIET_END,
+                        description={
+                            "suggested_value": self.config_entry.options.get(
+                                CONF_QUIET_END
+                            )
+                        },
+                    ): TimeSelector(),
+                    vol.Optional(
+                        CONF_MAX_REQUEST_RATE,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_REQUEST_RATE, DEFAULT_MAX_REQUEST_RATE
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=120,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="requests/min",
+                        )
+                    ),
                 }
             ),
         )
@@ -4,6 +4,9 @@ from typing import Final
 
 DOMAIN: Final = "organic_box"
 
+# Key of the client pool shared by all config entries in hass.data
+DATA_CLIENT_POOL: Final = f"{DOMAIN}_client_pool"
+
 # Configuration and options
 CONF_PROVIDER: Final = "provider"
 CONF_USERNAME: Final = "username"
@@ -12,12 +15,75 @@ CONF_SHOP_ID: Final = "shop_id"
 CONF_ENABLE_SHOPPING_LIST_MATCH: Final = "enable_shopping_list_match"
 CONF_MATCH_THRESHOLD: Final = "match_threshold"
 CONF_AUTO_CANCEL_ON_PAUSE_CONFLICT: Final = "auto_cancel_on_pause_conflict"
+CONF_QUIET_START: Final = "quiet_start"
+CONF_QUIET_END: Final = "quiet_end"
+CONF_MAX_REQUEST_RATE: Final = "max_request_rate"
+CONF_MATCH_ENGINE: Final = "match_engine"
+CONF_MATCH_ONE_TO_ONE: Final = "match_one_to_one"
+CONF_TODO_ENTITIES: Final = "todo_entities"
 
 # Providers
 PROVIDER_OEKOBOX: Final = "oekobox"
 
 # Update intervals
 DEFAULT_SCAN_INTERVAL: Final = 900  # 15 minutes in seconds
+MIN_SCAN_INTERVAL: Final = 300  # 5 minutes in seconds
+IDLE_SCAN_INTERVAL: Final = 3600  # 1 hour in seconds
+MAX_SCAN_INTERVAL: Final = 21600  # 6 hours in seconds
+DEADLINE_WINDOW: Final = 3600  # poll at MIN_SCAN_INTERVAL this long before the deadline
+PAUSE_CONFIRM_DELAY: Final = 30  # seconds before a pause change is confirmed
+SHOPPING_LIST_REMATCH_DELAY: Final = 1.0  # seconds to batch shopping list edits
+# dates7 is cached per session server-side, so a session is only reused for
+# the requests of one refresh and the pause calls following it, never by the
+# next regular poll
+SESSION_REUSE_WINDOW: Final = 600  # 10 minutes in seconds
+
+# Retries of failed API calls
+RETRY_ATTEMPTS: Final = 3
+RETRY_BASE_DELAY: Final = 1.0  # seconds
+RETRY_MAX_DELAY: Final = 10.0  # seconds
+
+# Circuit breaker around the provider API
+CIRCUIT_FAILURE_THRESHOLD: Final = 3  # consecutive failed calls
+CIRCUIT_RESET_TIMEOUT: Final = 600  # 10 minutes in seconds
+
+# Rate limit shared by all entries talking to the same shop host
+DEFAULT_MAX_REQUEST_RATE: Final = 30  # requests per minute
+RATE_LIMIT_BURST: Final = 5  # requests allowed back to back
+
+# Maximum number of order item requests running in parallel
+MAX_CONCURRENT_ITEM_REQUESTS: Final = 3
+
+# Maximum number of add_pause requests running in parallel
+MAX_CONCURRENT_PAUSE_REQUESTS: Final = 3
+
+# Longest range accepted by the pause_range service
+MAX_PAUSE_RANGE_WEEKS: Final = 26
+
+# Outcomes of pausing a week
+PAUSE_RESULT_PAUSED: Final = "paused"
+PAUSE_RESULT_ALREADY_PAUSED: Final = "already_paused"
+PAUSE_RESULT_CONFLICT: Final = "conflict"
+PAUSE_RESULT_FAILED: Final = "failed"
+
+# Order item cache
+ITEM_CACHE_MAX_SIZE: Final = 16
+ITEM_CACHE_TTL: Final = 3600  # 1 hour in seconds
+
+# Persistent storage
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10  # seconds
+
+# Services
+SERVICE_UPDATE_BASKET: Final = "update_basket"
+SERVICE_PAUSE_RANGE: Final = "pause_range"
+SERVICE_LEARN_MATCH: Final = "learn_match"
+SERVICE_FORGET_MATCH: Final = "forget_match"
+ATTR_FORCE: Final = "force"
+ATTR_START_DATE: Final = "start_date"
+ATTR_END_DATE: Final = "end_date"
+ATTR_BASKET_ITEM: Final = "basket_item"
+ATTR_SHOPPING_ITEM: Final = "shopping_item"
 
 # Attributes
 ATTR_NEXT_DELIVERY: Final = "next_delivery"
@@ -25,6 +91,15 @@ ATTR_BASKET_ITEMS: Final = "basket_items"
 ATTR_PROVIDER: Final = "provider"
 ATTR_LAST_ORDER_CHANGE: Final = "last_order_change"
 ATTR_MATCHED_ITEMS: Final = "matched_shopping_list_items"
+ATTR_CIRCUIT_STATE: Final = "circuit_state"
 
 # Shopping list matching
 DEFAULT_MATCH_THRESHOLD: Final = 80  # 80% similarity threshold
+NORMALIZE_CACHE_SIZE: Final = 4096  # normalized names kept in memory
+MATCH_CANDIDATES: Final = 5  # list entries always rescored per basket item
+MATCH_EXECUTOR_PAIRS: Final = 5000  # basket x list pairs scored in the executor
+TODO_UPDATE_BATCH_SIZE: Final = 10  # todo.update_item calls run at once per list
+ALIAS_CONFIRMATIONS: Final = 3  # orders confirming a match before it is learned
+MATCH_ENGINE_DIFFLIB: Final = "difflib"  # exact SequenceMatcher scores
+MATCH_ENGINE_VECTOR: Final = "vector"  # trigram cosine scores via NumPy
+DEFAULT_MATCH_ENGINE: Final = MATCH_ENGINE_DIFFLIB
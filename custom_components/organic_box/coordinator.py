@@ -1,21 +1,39 @@
 """Data update coordinator for Organic Box integration."""
 
+import dataclasses
 from datetime import timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .aliases import AliasTable
 from .const import (
     CONF_ENABLE_SHOPPING_LIST_MATCH,
+    CONF_MATCH_ENGINE,
+    CONF_MATCH_ONE_TO_ONE,
     CONF_MATCH_THRESHOLD,
+    CONF_QUIET_END,
+    CONF_QUIET_START,
+    CONF_TODO_ENTITIES,
+    DEFAULT_MATCH_ENGINE,
     DEFAULT_MATCH_THRESHOLD,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    PAUSE_CONFIRM_DELAY,
+    SHOPPING_LIST_REMATCH_DELAY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
-from .models import DeliveryInfo
+from .ledger import CompletionLedger
+from .models import DeliveryInfo, PauseRecord
 from .provider import OrganicBoxProvider
+from .resilience import CircuitOpenError
+from .scheduler import compute_update_interval, needs_fresh_data
 from .shopping_list_matcher import ShoppingListMatcher
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +59,18 @@ class OrganicBoxDataUpdateCoordinator(DataUpdateCoordinator[DeliveryInfo]):
         self.entry = entry
         self.matched_items: dict[str, dict] = {}
         self.shopping_list_matcher: ShoppingListMatcher | None = None
+        self._matcher_options: tuple | None = None
+        self._unsub_shopping_list: CALLBACK_TYPE | None = None
+        self._store: Store[dict] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self.completion_ledger = CompletionLedger(hass, entry.entry_id)
+        self.alias_table = AliasTable(hass, entry.entry_id)
+        self.data_fingerprint: str | None = None
+        # Bumped whenever listeners are updated, so entities can cache
+        # everything derived from the coordinator until the next update
+        self.data_version = 0
+        self._listener_extras: tuple | None = None
 
         # Call parent init first to set up self.hass
         super().__init__(
@@ -49,27 +79,240 @@ class OrganicBoxDataUpdateCoordinator(DataUpdateCoordinator[DeliveryInfo]):
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
             config_entry=entry,
+            # Only notify entities when the delivery data actually changed
+            always_update=False,
+        )
+
+        # Confirms optimistic pause updates once the shop has settled
+        self._confirm_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PAUSE_CONFIRM_DELAY,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+        # Rematches after shopping list edits, batching bursts of changes
+        self._rematch_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SHOPPING_LIST_REMATCH_DELAY,
+            immediate=False,
+            function=self._async_rematch_shopping_list,
         )
 
         # Now initialize shopping list matcher (after self.hass is available)
         self._update_shopping_list_matcher()
 
     def _update_shopping_list_matcher(self) -> None:
-        """Update shopping list matcher based on options."""
-        if self.entry.options.get(CONF_ENABLE_SHOPPING_LIST_MATCH, False):
-            threshold = (
-                self.entry.options.get(CONF_MATCH_THRESHOLD, DEFAULT_MATCH_THRESHOLD)
-                / 100.0
+        """Update shopping list matcher based on options.
+
+        The matcher is only replaced when its options changed, so it keeps its
+        memoized matches and shopping list subscription between updates.
+        """
+        options = self.entry.options
+        matcher_options = None
+        if options.get(CONF_ENABLE_SHOPPING_LIST_MATCH, False):
+            matcher_options = (
+                options.get(CONF_MATCH_THRESHOLD, DEFAULT_MATCH_THRESHOLD) / 100.0,
+                options.get(CONF_MATCH_ENGINE, DEFAULT_MATCH_ENGINE),
+                options.get(CONF_MATCH_ONE_TO_ONE, False),
+                tuple(options.get(CONF_TODO_ENTITIES, [])),
+            )
+        if matcher_options == self._matcher_options:
+            return
+        self._matcher_options = matcher_options
+
+        if self._unsub_shopping_list is not None:
+            self._unsub_shopping_list()
+            self._unsub_shopping_list = None
+
+        if matcher_options is not None:
+            threshold, engine, one_to_one, todo_entities = matcher_options
+            self.shopping_list_matcher = ShoppingListMatcher(
+                self.hass,
+                threshold,
+                engine,
+                one_to_one=one_to_one,
+                aliases=self.alias_table,
+                todo_entities=todo_entities,
+            )
+            self._unsub_shopping_list = self.shopping_list_matcher.async_subscribe(
+                self._rematch_debouncer.async_schedule_call
             )
-            self.shopping_list_matcher = ShoppingListMatcher(self.hass, threshold)
             _LOGGER.debug(
-                "Shopping list matcher enabled with threshold %.2f", threshold
+                "Shopping list matcher enabled with threshold %.2f (%s engine)",
+                threshold,
+                self.shopping_list_matcher.engine,
             )
         else:
             self.shopping_list_matcher = None
             self.matched_items = {}
             _LOGGER.debug("Shopping list matcher disabled")
 
+    async def _async_rematch_shopping_list(self) -> None:
+        """Match the current basket against the changed shopping list.
+
+        New matches are pushed to the entities without asking the provider.
+        """
+        matcher = self.shopping_list_matcher
+        if matcher is None or self.data is None or not self.data.items:
+            return
+        try:
+            self.matched_items = await matcher.match_items(self.data.items)
+        except Exception as err:
+            _LOGGER.error("Error matching shopping list items: %s", err)
+            return
+        if self._async_notify_extras_changed():
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    async def _async_complete_matched_items(self, delivery_info: DeliveryInfo) -> None:
+        """Complete matched shopping list items not yet completed for the order.
+
+        Args:
+            delivery_info: The delivery the items were matched against
+        """
+        ledger = self.completion_ledger
+        ledger.prune(dt_util.now().date())
+        order_key = ledger.order_key(delivery_info)
+        done = ledger.completed(order_key) if order_key else set()
+        pending = {
+            name: match
+            for name, match in self.matched_items.items()
+            if match["shopping_list_item"].get("id") not in done
+        }
+        if not pending:
+            _LOGGER.debug("Matched items already completed for order %s", order_key)
+            return
+
+        completed = await self.shopping_list_matcher.mark_items_as_delivered(
+            pending, delivery_info.delivery_date
+        )
+        if order_key:
+            ledger.record(order_key, delivery_info.delivery_date, completed)
+
+        # Matches completed for several orders are remembered as aliases
+        basket = {item.name: item for item in delivery_info.items}
+        completed_ids = set(completed)
+        for name, match in pending.items():
+            shop_item = match["shopping_list_item"]
+            if shop_item.get("id") in completed_ids and name in basket:
+                self.alias_table.confirm(basket[name], shop_item.get("name", ""))
+
+    @callback
+    def async_request_rematch(self) -> None:
+        """Rematch the basket after the learned aliases changed."""
+        if self.shopping_list_matcher is not None:
+            self._rematch_debouncer.async_schedule_call()
+
+    def _update_polling_interval(self, delivery_info: DeliveryInfo) -> None:
+        """Adapt the update interval to the state of the delivery."""
+        quiet_start = quiet_end = None
+        if (start := self.entry.options.get(CONF_QUIET_START)) and (
+            end := self.entry.options.get(CONF_QUIET_END)
+        ):
+            quiet_start = dt_util.parse_time(start)
+            quiet_end = dt_util.parse_time(end)
+
+        self.update_interval = compute_update_interval(
+            delivery_info, dt_util.now(), quiet_start, quiet_end
+        )
+        _LOGGER.debug("Next update in %s", self.update_interval)
+
+    async def async_restore_data(self) -> bool:
+        """Seed the coordinator with the last good data from storage.
+
+        Returns:
+            True if stored data was restored, False otherwise
+        """
+        try:
+            stored = await self._store.async_load()
+            if not stored:
+                return False
+            delivery_info = DeliveryInfo.from_dict(stored["delivery_info"])
+        except Exception as err:
+            _LOGGER.warning("Ignoring unreadable stored delivery data: %s", err)
+            return False
+
+        self.matched_items = stored.get("matched_items", {})
+        self._listener_extras = self._get_listener_extras()
+        self._update_polling_interval(delivery_info)
+        self.async_set_updated_data(delivery_info)
+        _LOGGER.debug(
+            "Restored stored delivery data for %s", delivery_info.delivery_date
+        )
+        return True
+
+    @callback
+    def async_apply_pause_record(self, record: PauseRecord) -> None:
+        """Apply the result of a pause operation without a full refresh.
+
+        The pause state is updated locally right away and a debounced refresh
+        later reconciles it with the shop.
+
+        Args:
+            record: The result of the pause operation
+        """
+        if (
+            self.data is not None
+            and self.data.delivery_date is not None
+            and self.data.delivery_date.date() == record.delivery_date
+        ):
+            self.async_set_updated_data(
+                dataclasses.replace(self.data, is_paused=record.is_paused)
+            )
+        self._confirm_debouncer.async_schedule_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refreshes and shopping list updates and shut down."""
+        self._confirm_debouncer.async_shutdown()
+        self._rematch_debouncer.async_shutdown()
+        if self._unsub_shopping_list is not None:
+            self._unsub_shopping_list()
+            self._unsub_shopping_list = None
+        await super().async_shutdown()
+
+    @callback
+    def async_set_updated_data(self, data: DeliveryInfo) -> None:
+        """Set new data, keeping its fingerprint in sync."""
+        self.data_fingerprint = data.fingerprint()
+        super().async_set_updated_data(data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners with a new data version."""
+        self.data_version += 1
+        super().async_update_listeners()
+
+    def _get_listener_extras(self) -> tuple:
+        """Return entity inputs that live outside of the coordinator data."""
+        return (self.matched_items, self.provider.circuit_state)
+
+    @callback
+    def _async_notify_extras_changed(self) -> bool:
+        """Update listeners if only inputs outside of the data changed.
+
+        With always_update disabled, the coordinator skips listeners when the
+        returned data equals the previous data, which would hide changed
+        shopping list matches or circuit breaker state.
+
+        Returns:
+            True if listeners were updated
+        """
+        extras = self._get_listener_extras()
+        if extras == self._listener_extras:
+            return False
+        self._listener_extras = extras
+        self.async_update_listeners()
+        return True
+
+    def _data_to_store(self) -> dict:
+        """Return the data to persist in storage."""
+        return {
+            "delivery_info": self.data.as_dict(),
+            "matched_items": self.matched_items,
+        }
+
     async def _async_update_data(self) -> DeliveryInfo:
         """Fetch data from the provider.
 
@@ -80,6 +323,8 @@ class OrganicBoxDataUpdateCoordinator(DataUpdateCoordinator[DeliveryInfo]):
             UpdateFailed: If update fails
         """
         try:
+            if needs_fresh_data(self.data, dt_util.now()):
+                self.provider.request_fresh_data()
             _LOGGER.debug("Fetching data from %s", self.provider.name)
             delivery_info = await self.provider.get_next_delivery()
             _LOGGER.debug(
@@ -103,15 +348,33 @@ class OrganicBoxDataUpdateCoordinator(DataUpdateCoordinator[DeliveryInfo]):
                     # editable, so we match for display but don't clean up the shopping
                     # list yet — otherwise items would be ticked off before we shop.
                     if self.matched_items and delivery_info.order_state == 1:
-                        await self.shopping_list_matcher.mark_items_as_delivered(
-                            self.matched_items, delivery_info.delivery_date
-                        )
+                        await self._async_complete_matched_items(delivery_info)
                 except Exception as match_err:
                     _LOGGER.error("Error matching shopping list items: %s", match_err)
                     # Don't fail the whole update if shopping list matching fails
                     self.matched_items = {}
 
+            self._update_polling_interval(delivery_info)
+            fingerprint = delivery_info.fingerprint()
+            if self.data is not None and fingerprint == self.data_fingerprint:
+                _LOGGER.debug("Delivery data unchanged")
+                if self._async_notify_extras_changed():
+                    self._store.async_delay_save(
+                        self._data_to_store, STORAGE_SAVE_DELAY
+                    )
+                return self.data
+
+            self.data_fingerprint = fingerprint
+            self._listener_extras = self._get_listener_extras()
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
             return delivery_info
+        except CircuitOpenError as err:
+            if self.data is None:
+                raise UpdateFailed(f"Provider API unavailable: {err}") from err
+            # Keep serving the last good data while the backend recovers
+            _LOGGER.debug("Serving last known data: %s", err)
+            self._async_notify_extras_changed()
+            return self.data
         except Exception as err:
             _LOGGER.error("Error fetching data from provider: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
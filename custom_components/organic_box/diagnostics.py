@@ -0,0 +1,48 @@
+"""Diagnostics support for the Organic Box integration."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import OrganicBoxDataUpdateCoordinator
+from .pool import async_get_client_pool
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: OrganicBoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "data": coordinator.data.as_dict() if coordinator.data else None,
+        },
+        "shopping_list_matcher": (
+            coordinator.shopping_list_matcher.diagnostics()
+            if coordinator.shopping_list_matcher
+            else None
+        ),
+        "provider": {
+            "name": coordinator.provider.name,
+            "authenticated": coordinator.provider.is_authenticated,
+            **coordinator.provider.diagnostics(),
+        },
+        "client_pool": async_get_client_pool(hass).as_dict(),
+    }
@@ -0,0 +1,54 @@
+"""Base entity for the Organic Box integration."""
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import OrganicBoxDataUpdateCoordinator
+
+
+class OrganicBoxEntity(CoordinatorEntity[OrganicBoxDataUpdateCoordinator]):
+    """Coordinator entity that only writes state when its own state changed.
+
+    A coordinator update touches every entity of the entry, but most updates
+    only change some of them. Comparing the rendered state, attributes and
+    availability against the last written ones skips no-op state writes and
+    recorder entries.
+
+    Home Assistant reads extra_state_attributes on every state write and in
+    other code paths, so the attributes are built lazily once per
+    coordinator data version by _build_extra_state_attributes.
+    """
+
+    _last_written_state: tuple[Any, ...] | None = None
+    _attributes_version: int | None = None
+    _attributes: dict[str, Any] = {}
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes of the current data version."""
+        version = self.coordinator.data_version
+        if version != self._attributes_version:
+            self._attributes = self._build_extra_state_attributes()
+            self._attributes_version = version
+        return self._attributes
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the state attributes from the coordinator."""
+        return {}
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the parts of the entity that end up in the state machine."""
+        if not self.available:
+            return (False,)
+        return (True, self.state, self.extra_state_attributes)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the entity's own state changed."""
+        snapshot = self._state_snapshot()
+        if snapshot == self._last_written_state:
+            return
+        self._last_written_state = snapshot
+        super()._handle_coordinator_update()
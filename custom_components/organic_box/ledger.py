@@ -0,0 +1,122 @@
+"""Ledger of shopping list items completed for a delivery."""
+
+from collections.abc import Iterable
+from datetime import date, datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .models import DeliveryInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def ledger_store_key(entry_id: str) -> str:
+    """Return the storage key of the ledger of a config entry."""
+    return f"{DOMAIN}.{entry_id}.completed"
+
+
+class CompletionLedger:
+    """Persisted record of the shopping list items completed per order.
+
+    Completing an item is a blocking service call followed by a shopping list
+    save, so each item is completed once per order rather than on every poll
+    while the order is in preparation. Orders are forgotten once their
+    delivery date has passed.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the ledger.
+
+        Args:
+            hass: Home Assistant instance
+            entry_id: ID of the config entry owning the ledger
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, ledger_store_key(entry_id)
+        )
+        # Order key -> {"delivery_date": ISO date or None, "items": [item ids]}
+        self._orders: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def order_key(delivery_info: DeliveryInfo) -> str | None:
+        """Return the key of the order of a delivery.
+
+        Falls back to the delivery date for providers without order ids.
+
+        Args:
+            delivery_info: The delivery
+
+        Returns:
+            The order key, or None if the delivery cannot be identified
+        """
+        if delivery_info.order_id is not None:
+            return str(delivery_info.order_id)
+        if delivery_info.delivery_date is not None:
+            return delivery_info.delivery_date.date().isoformat()
+        return None
+
+    async def async_load(self) -> None:
+        """Load the ledger from storage."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Ignoring unreadable completion ledger: %s", err)
+            return
+        if stored:
+            self._orders = stored.get("orders", {})
+
+    def completed(self, order_key: str) -> set[str]:
+        """Return the ids of the items completed for an order."""
+        order = self._orders.get(order_key)
+        return set(order["items"]) if order else set()
+
+    def record(
+        self, order_key: str, delivery_date: datetime | None, item_ids: Iterable[str]
+    ) -> None:
+        """Record items completed for an order and schedule a save.
+
+        Args:
+            order_key: Key of the order
+            delivery_date: Delivery date of the order
+            item_ids: IDs of the completed shopping list items
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return
+        order = self._orders.setdefault(
+            order_key,
+            {
+                "delivery_date": delivery_date.date().isoformat()
+                if delivery_date
+                else None,
+                "items": [],
+            },
+        )
+        order["items"] = sorted({*order["items"], *item_ids})
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    def prune(self, today: date) -> None:
+        """Forget orders delivered before a date.
+
+        Args:
+            today: The current date
+        """
+        expired = [
+            key
+            for key, order in self._orders.items()
+            if order["delivery_date"] is not None
+            and date.fromisoformat(order["delivery_date"]) < today
+        ]
+        for key in expired:
+            del self._orders[key]
+        if expired:
+            _LOGGER.debug("Pruned %d delivered orders from the ledger", len(expired))
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the data to persist in storage."""
+        return {"orders": self._orders}
@@ -0,0 +1,191 @@
+"""Produce lexicon used to canonicalize product names before matching."""
+
+from collections.abc import Iterable, Mapping
+import re
+import unicodedata
+
+# Words dropped from names wherever they appear
+QUALIFIERS = ("organic", "bio", "fresh", "local", "regional")
+UNITS = ("kg", "g", "l", "ml", "pc", "pcs", "pack", "bunch")
+
+# Canonical name -> German, Austrian, Swiss and English variants. Canonical
+# names are given in normalized form, so they are never rewritten again.
+PRODUCE_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "apples": ("äpfel", "apfel"),
+    "aubergines": ("auberginen", "aubergine", "melanzani", "eggplant", "eggplants"),
+    "bananas": ("bananen", "banane"),
+    "basil": ("basilikum",),
+    "beans": ("bohnen",),
+    "beetroot": ("rote bete", "rote beete", "rote rüben", "randen", "beets"),
+    "blueberries": ("heidelbeeren", "blaubeeren"),
+    "bread": ("brot",),
+    "broccoli": ("brokkoli",),
+    "brussels sprouts": ("rosenkohl", "kohlsprossen"),
+    "carrots": (
+        "möhren",
+        "möhre",
+        "karotten",
+        "karotte",
+        "mohrrüben",
+        "mohrrübe",
+        "gelbe rüben",
+    ),
+    "cauliflower": ("blumenkohl", "karfiol"),
+    "celeriac": ("knollensellerie", "sellerie"),
+    "celery": ("staudensellerie", "stangensellerie"),
+    "cheese": ("käse",),
+    "cherry tomatoes": ("kirschtomaten", "cocktailtomaten", "cherrytomaten"),
+    "chives": ("schnittlauch",),
+    "cream": ("sahne", "schlagsahne", "rahm"),
+    "cucumber": ("gurken", "gurke", "salatgurken", "salatgurke"),
+    "eggs": ("eier",),
+    "garlic": ("knoblauch",),
+    "ginger": ("ingwer",),
+    "grapes": ("trauben", "weintrauben"),
+    "green beans": ("grüne bohnen", "prinzessbohnen", "fisolen"),
+    "honey": ("honig",),
+    "juice": ("saft",),
+    "kale": ("grünkohl",),
+    "lambs lettuce": ("feldsalat", "vogerlsalat", "nüsslisalat"),
+    "leek": ("lauch", "porree"),
+    "lemons": ("zitronen", "zitrone"),
+    "lentils": ("linsen",),
+    "lettuce": ("kopfsalat",),
+    "milk": ("milch",),
+    "mushrooms": ("champignons", "pilze"),
+    "oats": ("haferflocken", "hafer"),
+    "onions": ("zwiebeln", "zwiebel"),
+    "oranges": ("orangen", "apfelsinen", "apfelsine"),
+    "parsley": ("petersilie",),
+    "parsnips": ("pastinaken", "pastinake"),
+    "pears": ("birnen", "birne"),
+    "peppers": ("paprikaschoten", "bell peppers", "capsicum"),
+    "plums": ("pflaumen", "zwetschgen", "zwetschken"),
+    "potatoes": ("kartoffeln", "kartoffel", "erdäpfel", "erdapfel", "grundbirnen"),
+    "pumpkin": ("kürbis", "kürbisse"),
+    "quark": ("topfen",),
+    "radishes": ("radieschen",),
+    "raspberries": ("himbeeren",),
+    "red cabbage": ("rotkohl", "rotkraut", "blaukraut"),
+    "rye": ("roggen",),
+    "savoy cabbage": ("wirsing",),
+    "spinach": ("spinat", "blattspinat"),
+    "spring onions": (
+        "frühlingszwiebeln",
+        "lauchzwiebeln",
+        "scallions",
+        "green onions",
+    ),
+    "strawberries": ("erdbeeren",),
+    "sweet potatoes": ("süßkartoffeln", "süßkartoffel"),
+    "tomatoes": ("tomaten", "tomate", "paradeiser"),
+    "white cabbage": ("weißkohl", "weißkraut"),
+    "yoghurt": ("joghurt", "jogurt", "yogurt"),
+    "zucchini": ("zucchetti", "courgettes", "courgette"),
+}
+
+_WORD_RE = re.compile(r"\w+")
+# Combining marks left behind by NFKD decomposition, e.g. the umlaut dots
+_COMBINING_MARKS_RE = re.compile("[\u0300-\u036f]+")
+_DIGITS = "0123456789"
+# Trie key holding the replacement of the token sequence ending at a node
+_END = ""
+
+
+def fold(text: str) -> str:
+    """Casefold a text and strip its accents, so "Möhren" becomes "mohren"."""
+    text = text.casefold()
+    if text.isascii():
+        # Most names have nothing to decompose
+        return text
+    return _COMBINING_MARKS_RE.sub("", unicodedata.normalize("NFKD", text))
+
+
+class Lexicon:
+    """Canonicalizer rewriting product names with a word trie in one pass.
+
+    Names are folded and split into words once. At each word the trie is
+    walked for the longest phrase it knows, which is replaced by its
+    canonical name or dropped. Numbers directly followed by a unit are
+    dropped with it; all other words are kept.
+    """
+
+    def __init__(
+        self,
+        synonyms: Mapping[str, Iterable[str]],
+        dropped: Iterable[str] = (),
+        units: Iterable[str] = (),
+    ) -> None:
+        """Compile the lexicon.
+
+        Args:
+            synonyms: Variants per canonical name
+            dropped: Words and phrases removed from names
+            units: Units removed from names together with a preceding number
+        """
+        self._units = frozenset(fold(unit) for unit in units)
+        self._root: dict[str, dict] = {}
+        for phrase in (*dropped, *self._units):
+            self._add(phrase, "")
+        for canonical, variants in synonyms.items():
+            for variant in variants:
+                self._add(variant, canonical)
+
+    def _add(self, phrase: str, replacement: str) -> None:
+        """Add a phrase and its replacement to the trie."""
+        node = self._root
+        for word in _WORD_RE.findall(fold(phrase)):
+            node = node.setdefault(word, {})
+        node[_END] = replacement
+
+    def _is_quantity(self, words: list[str], position: int) -> bool:
+        """Return whether a number is a quantity, like "500g" or "1 l"."""
+        unit = words[position].lstrip(_DIGITS)
+        if unit:
+            return unit in self._units
+        return position + 1 < len(words) and words[position + 1] in self._units
+
+    def canonicalize(self, text: str) -> str:
+        """Return the canonical form of a product name.
+
+        Args:
+            text: The name to canonicalize
+
+        Returns:
+            The canonical words separated by single spaces
+        """
+        words = _WORD_RE.findall(fold(text))
+        root = self._root
+        result: list[str] = []
+        position = 0
+        count = len(words)
+        while position < count:
+            word = words[position]
+            node = root.get(word)
+            if node is None:
+                # Most words start no known phrase
+                if not word[0].isdigit() or not self._is_quantity(words, position):
+                    result.append(word)
+                position += 1
+                continue
+            # Longest known phrase starting at this word
+            end = position + 1 if _END in node else 0
+            replacement = node.get(_END, "")
+            for index in range(position + 1, count):
+                node = node.get(words[index])
+                if node is None:
+                    break
+                if _END in node:
+                    end = index + 1
+                    replacement = node[_END]
+            if end:
+                if replacement:
+                    result.append(replacement)
+                position = end
+            else:
+                result.append(word)
+                position += 1
+        return " ".join(result)
+
+
+PRODUCE_LEXICON = Lexicon(PRODUCE_SYNONYMS, QUALIFIERS, UNITS)
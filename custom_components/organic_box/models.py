@@ -1,7 +1,10 @@
 """Data models for the Organic Box integration."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+import hashlib
+import json
+from typing import Any
 
 
 @dataclass
@@ -13,6 +16,11 @@ class BasketItem:
     unit: str | None = None
     product_id: str | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BasketItem":
+        """Create a BasketItem from its dictionary representation."""
+        return cls(**data)
+
 
 @dataclass
 class DeliveryInfo:
@@ -27,8 +35,60 @@ class DeliveryInfo:
     order_state: int | None = (
         None  # Raw order state: 0=editable, 1=in preparation, 2=finalized
     )
+    order_id: int | None = None  # Provider order behind the delivery
 
     def __post_init__(self):
         """Calculate total items if not provided."""
         if self.total_items == 0:
             self.total_items = len(self.items)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        data = asdict(self)
+        for key in ("delivery_date", "last_order_change"):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
+        return data
+
+    def fingerprint(self) -> str:
+        """Return a stable hash of the delivery dates, items and pause state."""
+        payload = json.dumps(self.as_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DeliveryInfo":
+        """Create a DeliveryInfo from the representation returned by as_dict()."""
+        data = dict(data)
+        data["items"] = [BasketItem.from_dict(item) for item in data["items"]]
+        for key in ("delivery_date", "last_order_change"):
+            if data.get(key) is not None:
+                data[key] = datetime.fromisoformat(data[key])
+        return cls(**data)
+
+
+@dataclass
+class PauseRecord:
+    """Result of pausing or unpausing a delivery."""
+
+    delivery_date: date
+    is_paused: bool  # Pause state of the delivery after the operation
+    start_date: date | None = None
+    end_date: date | None = None
+    pause_id: int | None = None
+
+
+@dataclass
+class PauseWeekResult:
+    """Outcome of pausing a single Monday to Sunday week."""
+
+    week_start: date
+    week_end: date
+    status: str  # One of the PAUSE_RESULT_* constants
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        data = asdict(self)
+        data["week_start"] = self.week_start.isoformat()
+        data["week_end"] = self.week_end.isoformat()
+        return data
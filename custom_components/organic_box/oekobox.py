@@ -1,10 +1,14 @@
 """OekoBox Online provider implementation."""
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable, Collection
+from dataclasses import dataclass
 from datetime import date as date_type
 from datetime import datetime as dt
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -13,15 +17,70 @@ from pyoekoboxonline import OekoboxClient as OekoBoxOnline
 from pyoekoboxonline.exceptions import OekoboxAPIError, OekoboxAuthenticationError
 from pyoekoboxonline.models import Pause, ShopDate, XUnit
 
-from .const import CONF_AUTO_CANCEL_ON_PAUSE_CONFLICT
-from .models import BasketItem, DeliveryInfo
+from .cache import TTLCache
+from .const import (
+    CONF_AUTO_CANCEL_ON_PAUSE_CONFLICT,
+    ITEM_CACHE_MAX_SIZE,
+    ITEM_CACHE_TTL,
+    MAX_CONCURRENT_ITEM_REQUESTS,
+    MAX_CONCURRENT_PAUSE_REQUESTS,
+    PAUSE_RESULT_ALREADY_PAUSED,
+    PAUSE_RESULT_CONFLICT,
+    PAUSE_RESULT_FAILED,
+    PAUSE_RESULT_PAUSED,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+from .models import BasketItem, DeliveryInfo, PauseRecord, PauseWeekResult
+from .pause_index import PauseIndex, parse_date, week_spans
+from .pool import ClientConnection
 from .provider import OrganicBoxProvider
+from .resilience import (
+    TRANSIENT_ERRORS,
+    UNDELIVERED_ERRORS,
+    CircuitOpenError,
+    ErrorKind,
+    async_call_with_retry,
+    classify_error,
+)
+from .session import SessionManager
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class DatesSnapshot:
+    """A single dates7 response, split into shop dates and pauses."""
+
+    shop_dates: list[ShopDate]
+    pauses: list[Pause]
+
+    @classmethod
+    def from_dates(cls, dates: list) -> "DatesSnapshot":
+        """Build a snapshot from the raw get_dates() result.
+
+        Args:
+            dates: Objects returned by the dates7 endpoint
+
+        Returns:
+            DatesSnapshot holding the ShopDate and Pause objects
+        """
+        return cls(
+            shop_dates=[d for d in dates if isinstance(d, ShopDate)],
+            pauses=[d for d in dates if isinstance(d, Pause)],
+        )
+
+    @cached_property
+    def pause_index(self) -> PauseIndex:
+        """Return the interval index over the pauses, built on first use."""
+        return PauseIndex.from_pauses(self.pauses)
+
 
 class OekoBoxProvider(OrganicBoxProvider):
     """OekoBox Online provider implementation."""
@@ -33,6 +92,7 @@ class OekoBoxProvider(OrganicBoxProvider):
         password: str,
         shop_id: str | None = None,
         config_entry: ConfigEntry | None = None,
+        connection: ClientConnection | None = None,
     ) -> None:
         """Initialize the OekoBox provider.
 
@@ -42,12 +102,25 @@ class OekoBoxProvider(OrganicBoxProvider):
             password: The password for authentication
             shop_id: The shop ID to use for the provider
             config_entry: The config entry for accessing options
+            connection: Connection shared with other entries of the account
         """
         super().__init__(hass, username, password)
-        self._client: OekoBoxOnline | None = None
+        # Client, session, locks and breaker live on the connection, so entries
+        # of the same account share them
+        self._connection = connection or ClientConnection.create()
         self._shop_id = shop_id
         self._config_entry = config_entry
         self._auto_cancel_on_pause_conflict = False
+        self._request_count = 0
+        self._last_refresh_request_count: int | None = None
+        self._session = self._connection.session
+        self._item_cache: TTLCache[tuple, list[BasketItem]] = TTLCache(
+            ITEM_CACHE_MAX_SIZE, timedelta(seconds=ITEM_CACHE_TTL)
+        )
+        # Only one logon may run at a time; concurrent reads share one request
+        self._auth_lock = self._connection.auth_lock
+        self._single_flight = self._connection.single_flight
+        self._breaker = self._connection.breaker
 
         # Load auto_cancel option from config_entry
         if config_entry:
@@ -64,6 +137,135 @@ class OekoBoxProvider(OrganicBoxProvider):
         """Return the name of the provider."""
         return "OekoBox Online"
 
+    @property
+    def _client(self) -> OekoBoxOnline | None:
+        """Return the client of the shared connection."""
+        return self._connection.client
+
+    @_client.setter
+    def _client(self, client: OekoBoxOnline | None) -> None:
+        """Replace the client of the shared connection."""
+        self._connection.client = client
+
+    @property
+    def last_refresh_request_count(self) -> int | None:
+        """Return the number of API requests made by the last refresh."""
+        return self._last_refresh_request_count
+
+    @property
+    def coalesced_request_count(self) -> int:
+        """Return how many calls joined an already running request."""
+        return self._single_flight.coalesced
+
+    @property
+    def session(self) -> SessionManager:
+        """Return the session manager of this provider."""
+        return self._session
+
+    @property
+    def circuit_state(self) -> str:
+        """Return the state of the circuit breaker around the API."""
+        return self._breaker.state.value
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return provider internals for diagnostics."""
+        return {
+            "circuit_breaker": self._breaker.as_dict(),
+            "session": self._session.as_dict(),
+            "connection_users": self._connection.refs,
+            "last_refresh_request_count": self._last_refresh_request_count,
+            "coalesced_request_count": self.coalesced_request_count,
+            "item_cache": {
+                "size": len(self._item_cache),
+                "hits": self._item_cache.hits,
+                "misses": self._item_cache.misses,
+            },
+        }
+
+    async def _async_api_call(
+        self,
+        name: str,
+        call: Callable[[], Awaitable[_T]],
+        retry_on: Collection[ErrorKind] = TRANSIENT_ERRORS,
+    ) -> _T:
+        """Run an API call with retries behind the circuit breaker.
+
+        Args:
+            name: Name of the call for logging
+            call: Callable returning the coroutine to run
+            retry_on: Error kinds that may be retried
+
+        Returns:
+            The result of the call
+        """
+
+        async def _attempt() -> _T:
+            await self._connection.async_throttle()
+            self._request_count += 1
+            return await call()
+
+        return await async_call_with_retry(
+            _attempt,
+            name=name,
+            breaker=self._breaker,
+            attempts=RETRY_ATTEMPTS,
+            base_delay=RETRY_BASE_DELAY,
+            max_delay=RETRY_MAX_DELAY,
+            retry_on=retry_on,
+        )
+
+    async def _async_write(
+        self,
+        name: str,
+        call: Callable[[], Awaitable[Any]],
+        applied: Callable[[DatesSnapshot], bool],
+    ) -> None:
+        """Run an API call that changes data, without ever sending it twice.
+
+        Only attempts that failed before the request was sent are retried.
+        After any other transient failure the request may still have been
+        applied, so a fresh dates payload settles the outcome.
+
+        Args:
+            name: Name of the call for logging
+            call: Callable returning the coroutine to run
+            applied: Returns whether a dates snapshot shows the change
+
+        Raises:
+            Exception: The error of the call if the change was not applied
+        """
+        try:
+            await self._async_api_call(name, call, retry_on=UNDELIVERED_ERRORS)
+        except Exception as err:
+            if classify_error(err) not in TRANSIENT_ERRORS - UNDELIVERED_ERRORS:
+                raise
+            _LOGGER.debug("%s failed (%s), checking whether it was applied", name, err)
+            # The session's cached dates payload cannot show the outcome
+            self._session.invalidate()
+            snapshot = None
+            try:
+                snapshot = await self._fetch_dates_snapshot()
+            except Exception as check_err:
+                _LOGGER.debug("Could not check the outcome of %s: %s", name, check_err)
+            if snapshot is None or not applied(snapshot):
+                raise
+            _LOGGER.info("%s was applied despite the error: %s", name, err)
+        finally:
+            # The session's cached dates payload no longer reflects the change
+            self._session.invalidate()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached data so the next refresh fetches everything again."""
+        self._item_cache.clear()
+        self._session.invalidate()
+
+    def request_fresh_data(self) -> None:
+        """Log on again before the next refresh, as dates7 is cached per session.
+
+        Cached order items are kept; their key follows the fresh dates.
+        """
+        self._session.invalidate()
+
     def supports_pause(self) -> bool:
         """Return whether the provider supports pausing deliveries."""
         # OekoBox Online supports pausing deliveries
@@ -79,58 +281,42 @@ class OekoBoxProvider(OrganicBoxProvider):
         Returns:
             date object
         """
-        if isinstance(date_value, date_type) and not isinstance(date_value, dt):
-            return date_value
-        if isinstance(date_value, dt):
-            return date_value.date()
-        # Parse string
-        return dt.strptime(str(date_value), "%Y-%m-%d").date()
+        return parse_date(date_value)
+
+    async def _get_dates_snapshot(self) -> DatesSnapshot:
+        """Fetch the dates payload once and split it into shop dates and pauses.
 
-    async def _get_shop_dates(self) -> list[ShopDate]:
-        """Get all shop dates from the API.
+        Concurrent callers share a single dates request.
 
         Returns:
-            List of ShopDate objects
+            DatesSnapshot for the current refresh
 
         Raises:
             RuntimeError: If not authenticated
         """
-        if not self._authenticated or self._client is None:
-            if not await self.authenticate():
-                raise RuntimeError("Not authenticated with OekoBox Online")
-
-        try:
-            dates = await self._client.get_dates()
-        except OekoboxAuthenticationError:
-            _LOGGER.debug("Session expired, re-authenticating")
-            self._authenticated = False
-            if not await self.authenticate():
-                raise RuntimeError("Re-authentication failed")
-            dates = await self._client.get_dates()
-        return [d for d in dates if isinstance(d, ShopDate)]
+        return await self._single_flight.run("dates", self._fetch_dates_snapshot)
 
-    async def _get_pauses(self) -> list[Pause]:
-        """Get all pauses from the API.
+    async def _fetch_dates_snapshot(self) -> DatesSnapshot:
+        """Fetch a new dates snapshot from the API.
 
         Returns:
-            List of Pause objects
+            DatesSnapshot built from the dates payload
 
         Raises:
             RuntimeError: If not authenticated
         """
-        if not self._authenticated or self._client is None:
-            if not await self.authenticate():
-                raise RuntimeError("Not authenticated with OekoBox Online")
+        if not await self._async_ensure_session():
+            raise RuntimeError("Not authenticated with OekoBox Online")
 
         try:
-            dates = await self._client.get_dates()
+            dates = await self._async_api_call("get_dates", self._client.get_dates)
         except OekoboxAuthenticationError:
             _LOGGER.debug("Session expired, re-authenticating")
-            self._authenticated = False
-            if not await self.authenticate():
+            self._session.invalidate()
+            if not await self._async_ensure_session():
                 raise RuntimeError("Re-authentication failed")
-            dates = await self._client.get_dates()
-        return [d for d in dates if isinstance(d, Pause)]
+            dates = await self._async_api_call("get_dates", self._client.get_dates)
+        return DatesSnapshot.from_dates(dates)
 
     def _filter_pending_deliveries(
         self, shop_dates: list[ShopDate]
@@ -182,25 +368,31 @@ class OekoBoxProvider(OrganicBoxProvider):
         pending_dates.sort(key=lambda x: x[0])
         return pending_dates
 
-    async def _find_next_delivery(self) -> tuple[date_type | None, ShopDate | None]:
+    def _find_next_delivery(
+        self, snapshot: DatesSnapshot
+    ) -> tuple[date_type | None, ShopDate | None]:
         """Find the next pending delivery.
 
+        Args:
+            snapshot: Dates snapshot of the current refresh
+
         Returns:
             Tuple of (delivery_date, shop_date) or (None, None) if no delivery found
         """
-        shop_dates = await self._get_shop_dates()
-        pending_dates = self._filter_pending_deliveries(shop_dates)
+        pending_dates = self._filter_pending_deliveries(snapshot.shop_dates)
 
         if pending_dates:
             return pending_dates[0]
         return None, None
 
-    def _check_if_paused(self, shop_date: ShopDate | None, pauses: list[Pause]) -> bool:
+    def _check_if_paused(
+        self, shop_date: ShopDate | None, pause_index: PauseIndex
+    ) -> bool:
         """Check if a delivery is paused.
 
         Args:
             shop_date: The ShopDate to check
-            pauses: List of Pause objects from the API
+            pause_index: Pause index of the current dates snapshot
 
         Returns:
             True if the delivery is paused, False otherwise
@@ -212,22 +404,7 @@ class OekoBoxProvider(OrganicBoxProvider):
         if hasattr(shop_date, "is_paused") and shop_date.is_paused:
             return True
 
-        # Check if there's a Pause object matching this delivery
-        delivery_date = self._parse_date(shop_date.delivery_date)
-        for pause in pauses:
-            if hasattr(pause, "delivery_date"):
-                pause_date = self._parse_date(pause.delivery_date)
-                if pause_date == delivery_date:
-                    return True
-            # Pause model uses start_date/end_date for the date range
-            if hasattr(pause, "start_date") and hasattr(pause, "end_date"):
-                if pause.start_date and pause.end_date:
-                    date_from = self._parse_date(pause.start_date)
-                    date_to = self._parse_date(pause.end_date)
-                    if date_from <= delivery_date <= date_to:
-                        return True
-
-        return False
+        return pause_index.is_paused(self._parse_date(shop_date.delivery_date))
 
     async def authenticate(self) -> bool:
         """Authenticate with the OekoBox provider.
@@ -235,6 +412,22 @@ class OekoBoxProvider(OrganicBoxProvider):
         Returns:
             True if authentication was successful, False otherwise
         """
+        async with self._auth_lock:
+            try:
+                return await self._async_logon()
+            except CircuitOpenError as err:
+                _LOGGER.warning("Not authenticating with OekoBox Online: %s", err)
+                return False
+
+    async def _async_logon(self) -> bool:
+        """Create a new client and log on; the caller holds the auth lock.
+
+        Returns:
+            True if authentication was successful, False otherwise
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejected the logon
+        """
         try:
             if not self._shop_id:
                 _LOGGER.error("Cannot authenticate without shop_id")
@@ -245,7 +438,7 @@ class OekoBoxProvider(OrganicBoxProvider):
             session = async_get_clientsession(self._hass)
 
             # Initialize client with shop_id, username, password, and session
-            self._client = OekoBoxOnline(
+            client = OekoBoxOnline(
                 shop_id=self._shop_id,
                 username=self._username,
                 password=self._password,
@@ -253,16 +446,49 @@ class OekoBoxProvider(OrganicBoxProvider):
             )
 
             # Perform login (guest=False for user authentication)
-            await self._client.logon(guest=False)
+            self._connection.bind_url(getattr(client, "base_url", None))
+            await self._session.async_logon(
+                lambda: self._async_api_call("logon", lambda: client.logon(guest=False))
+            )
 
+            # Only replace the client once the new session is usable, so requests
+            # running concurrently never see a client without a session
+            self._client = client
             self._authenticated = True
             _LOGGER.info("Successfully authenticated with OekoBox Online")
             return True
+        except CircuitOpenError:
+            self._authenticated = False
+            raise
         except Exception as err:
             _LOGGER.error("Failed to authenticate with OekoBox Online: %s", err)
             self._authenticated = False
             return False
 
+    def _has_valid_session(self) -> bool:
+        """Return whether the current session can be used."""
+        if self._client is None or self._session.needs_refresh:
+            return False
+        if not self._authenticated and self._session.age is not None:
+            # Another entry of the same account established the session
+            self._authenticated = True
+        return self._authenticated
+
+    async def _async_ensure_session(self) -> bool:
+        """Make sure a usable session exists, logging on only when needed.
+
+        Returns:
+            True if a session is available, False otherwise
+        """
+        if self._has_valid_session():
+            return True
+
+        async with self._auth_lock:
+            # Another caller may have logged on while we waited for the lock
+            if self._has_valid_session():
+                return True
+            return await self._async_logon()
+
     async def test_connection(self) -> bool:
         """Test the connection to the provider.
 
@@ -280,151 +506,380 @@ class OekoBoxProvider(OrganicBoxProvider):
             _LOGGER.error("Connection test failed: %s", err)
             return False
 
+    @staticmethod
+    def _parse_order_items(order_items: list) -> list[BasketItem]:
+        """Convert the objects returned by get_order_items into basket items.
+
+        Args:
+            order_items: Item and XUnit objects of an order
+
+        Returns:
+            List of BasketItem objects
+        """
+        items = []
+
+        # First, separate Items and XUnits, and build a lookup for XUnit overrides
+        item_objects = []
+        xunit_overrides = {}  # item_id -> XUnit
+
+        for order_item in order_items:
+            if isinstance(order_item, XUnit):
+                # XUnit overrides the unit/quantity for an item
+                if hasattr(order_item, "item_id") and order_item.item_id:
+                    xunit_overrides[order_item.item_id] = order_item
+            else:
+                # Regular Item object
+                item_objects.append(order_item)
+
+        # Process Item objects and apply XUnit overrides if present
+        for order_item in item_objects:
+            item_name = "Unknown"
+            quantity = 0.0
+            unit = None
+            item_id = None
+
+            # Get item_id and basic info from the Item
+            if hasattr(order_item, "item_id"):
+                item_id = order_item.item_id
+            if hasattr(order_item, "name"):
+                item_name = order_item.name or "Unknown"
+
+            # Check if there's an XUnit override for this item
+            if item_id and item_id in xunit_overrides:
+                xunit = xunit_overrides[item_id]
+                # XUnit overrides the unit and quantity
+                if hasattr(xunit, "name"):
+                    unit = xunit.name  # XUnit.name is the unit name
+                if hasattr(xunit, "parts"):
+                    # parts indicates the quantity/amount
+                    try:
+                        quantity = float(xunit.parts or 1.0)
+                    except (ValueError, TypeError):
+                        quantity = 1.0
+            else:
+                # No XUnit override, use Item's default values
+                if hasattr(order_item, "unit"):
+                    unit = order_item.unit
+                if hasattr(order_item, "amount_def"):
+                    quantity = float(order_item.amount_def or 1.0)
+                elif hasattr(order_item, "amount"):
+                    quantity = float(order_item.amount or 1.0)
+
+            items.append(
+                BasketItem(
+                    name=item_name,
+                    quantity=quantity,
+                    unit=unit,
+                    product_id=str(item_id) if item_id else None,
+                )
+            )
+
+        return items
+
+    @staticmethod
+    def _item_cache_key(shop_date: ShopDate) -> tuple:
+        """Return the item cache key for the order behind a shop date.
+
+        Besides the order id, the key contains every field of the dates payload
+        that changes when the order is modified, so a changed order misses the
+        cache.
+
+        Args:
+            shop_date: The ShopDate of the order
+
+        Returns:
+            Hashable cache key
+        """
+        return (
+            shop_date.order_id,
+            shop_date.order_state,
+            getattr(shop_date, "last_order_change", None),
+            getattr(shop_date, "last_changed", None),
+            getattr(shop_date, "count", None),
+            getattr(shop_date, "total", None),
+        )
+
+    async def _get_basket_items(self, shop_date: ShopDate) -> list[BasketItem]:
+        """Get the basket items of the order behind a shop date.
+
+        Items of unchanged orders are served from the item cache.
+
+        Args:
+            shop_date: The ShopDate whose order items should be fetched
+
+        Returns:
+            List of BasketItem objects, empty if the items could not be fetched
+        """
+        if not shop_date.order_id or shop_date.order_id <= 0:
+            return []
+
+        cache_key = self._item_cache_key(shop_date)
+        cached_items = self._item_cache.get(cache_key)
+        if cached_items is not None:
+            _LOGGER.debug("Using cached items for order %s", shop_date.order_id)
+            return list(cached_items)
+
+        try:
+            order_items = await self._async_api_call(
+                "get_order_items",
+                lambda: self._client.get_order_items(shop_date.order_id),
+            )
+        except CircuitOpenError:
+            raise
+        except Exception as item_err:
+            _LOGGER.warning(
+                "Failed to get order items for order %s: %s",
+                shop_date.order_id,
+                item_err,
+            )
+            return []
+
+        items = self._parse_order_items(order_items)
+        self._item_cache.set(cache_key, items)
+        return list(items)
+
+    def _build_delivery_info(
+        self,
+        delivery_date: date_type | None,
+        shop_date: ShopDate | None,
+        pause_index: PauseIndex,
+        items: list[BasketItem],
+    ) -> DeliveryInfo:
+        """Build a DeliveryInfo object for a shop date.
+
+        Args:
+            delivery_date: The parsed delivery date
+            shop_date: The ShopDate of the delivery
+            pause_index: Pause index of the current dates snapshot
+            items: Basket items of the delivery
+
+        Returns:
+            DeliveryInfo object for the delivery
+        """
+        # Convert date to datetime if found
+        delivery_datetime = None
+        if delivery_date:
+            delivery_datetime = dt.combine(delivery_date, dt.min.time())
+
+        # Extract last_order_change if available
+        last_order_change = None
+        if shop_date and hasattr(shop_date, "last_order_change"):
+            last_order_change = shop_date.last_order_change
+
+        return DeliveryInfo(
+            delivery_date=delivery_datetime,
+            items=items,
+            last_order_change=last_order_change,
+            is_paused=self._check_if_paused(shop_date, pause_index),
+            can_pause=self.supports_pause(),
+            order_state=shop_date.order_state if shop_date else None,
+            order_id=shop_date.order_id
+            if shop_date and shop_date.order_id and shop_date.order_id > 0
+            else None,
+        )
+
     async def get_next_delivery(self) -> DeliveryInfo:
         """Get information about the next delivery.
 
         Returns:
             DeliveryInfo object containing delivery date and items
         """
-        # Always re-authenticate before fetching to obtain a fresh server session.
-        # The dates7 API endpoint caches responses per session ID server-side, so
-        # reusing the same session across polls returns stale data even after orders
-        # are placed or changed.
-        if not await self.authenticate():
+        deliveries = await self.get_upcoming_deliveries(1)
+        if deliveries:
+            return deliveries[0]
+        return self._build_delivery_info(None, None, PauseIndex([]), [])
+
+    async def get_upcoming_deliveries(self, count: int) -> list[DeliveryInfo]:
+        """Get information about the next deliveries.
+
+        All deliveries are derived from a single dates fetch; the order items of
+        the selected deliveries are fetched concurrently. Concurrent callers
+        share one in-flight refresh.
+
+        Args:
+            count: Maximum number of deliveries to return
+
+        Returns:
+            List of DeliveryInfo objects sorted by delivery date
+        """
+        return await self._single_flight.run(
+            ("deliveries", count), lambda: self._fetch_upcoming_deliveries(count)
+        )
+
+    async def _fetch_upcoming_deliveries(self, count: int) -> list[DeliveryInfo]:
+        """Fetch the next deliveries from the API.
+
+        Args:
+            count: Maximum number of deliveries to return
+
+        Returns:
+            List of DeliveryInfo objects sorted by delivery date
+        """
+        self._request_count = 0
+
+        # The dates7 API endpoint caches responses per session ID server-side, so a
+        # session only serves one refresh and the calls right after it: it is
+        # re-established once it exceeds its reuse window or after we changed data
+        # ourselves (pause/unpause).
+        if not await self._async_ensure_session():
             raise RuntimeError("Not authenticated with OekoBox Online")
 
         try:
-            # Find the next delivery
-            delivery_date, next_shop_date = await self._find_next_delivery()
-
-            # Get pauses to check if delivery is paused
-            pauses = await self._get_pauses()
-            is_paused = self._check_if_paused(next_shop_date, pauses)
-
-            # Get orders to find items for the next delivery
-            items = []
-            if (
-                next_shop_date
-                and next_shop_date.order_id
-                and next_shop_date.order_id > 0
-            ):
-                # Get items for this specific order
-                try:
-                    order_items = await self._client.get_order_items(
-                        next_shop_date.order_id
-                    )
+            snapshot = await self._get_dates_snapshot()
+            pending_dates = self._filter_pending_deliveries(snapshot.shop_dates)[:count]
 
-                    # First, separate Items and XUnits, and build a lookup for XUnit overrides
-                    item_objects = []
-                    xunit_overrides = {}  # item_id -> XUnit
-
-                    for order_item in order_items:
-                        if isinstance(order_item, XUnit):
-                            # XUnit overrides the unit/quantity for an item
-                            if hasattr(order_item, "item_id") and order_item.item_id:
-                                xunit_overrides[order_item.item_id] = order_item
-                        else:
-                            # Regular Item object
-                            item_objects.append(order_item)
-
-                    # Process Item objects and apply XUnit overrides if present
-                    for order_item in item_objects:
-                        item_name = "Unknown"
-                        quantity = 0.0
-                        unit = None
-                        item_id = None
-
-                        # Get item_id and basic info from the Item
-                        if hasattr(order_item, "item_id"):
-                            item_id = order_item.item_id
-                        if hasattr(order_item, "name"):
-                            item_name = order_item.name or "Unknown"
-
-                        # Check if there's an XUnit override for this item
-                        if item_id and item_id in xunit_overrides:
-                            xunit = xunit_overrides[item_id]
-                            # XUnit overrides the unit and quantity
-                            if hasattr(xunit, "name"):
-                                unit = xunit.name  # XUnit.name is the unit name
-                            if hasattr(xunit, "parts"):
-                                # parts indicates the quantity/amount
-                                try:
-                                    quantity = float(xunit.parts or 1.0)
-                                except (ValueError, TypeError):
-                                    quantity = 1.0
-                        else:
-                            # No XUnit override, use Item's default values
-                            if hasattr(order_item, "unit"):
-                                unit = order_item.unit
-                            if hasattr(order_item, "amount_def"):
-                                quantity = float(order_item.amount_def or 1.0)
-                            elif hasattr(order_item, "amount"):
-                                quantity = float(order_item.amount or 1.0)
-
-                        # Create BasketItem
-                        item = BasketItem(
-                            name=item_name,
-                            quantity=quantity,
-                            unit=unit,
-                            product_id=str(item_id) if item_id else None,
-                        )
-                        items.append(item)
-                except Exception as item_err:
-                    _LOGGER.warning(
-                        "Failed to get order items for order %s: %s",
-                        next_shop_date.order_id,
-                        item_err,
-                    )
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ITEM_REQUESTS)
+
+            async def _get_items(shop_date: ShopDate) -> list[BasketItem]:
+                async with semaphore:
+                    return await self._get_basket_items(shop_date)
 
-            # Convert date to datetime if found
-            delivery_datetime = None
-            if delivery_date:
-                delivery_datetime = dt.combine(delivery_date, dt.min.time())
-
-            # Extract last_order_change if available
-            last_order_change = None
-            if next_shop_date and hasattr(next_shop_date, "last_order_change"):
-                last_order_change = next_shop_date.last_order_change
-
-            order_state = next_shop_date.order_state if next_shop_date else None
-
-            return DeliveryInfo(
-                delivery_date=delivery_datetime,
-                items=items,
-                last_order_change=last_order_change,
-                is_paused=is_paused,
-                can_pause=self.supports_pause(),
-                order_state=order_state,
+            items_per_delivery = await asyncio.gather(
+                *(_get_items(shop_date) for _, shop_date in pending_dates)
             )
+
+            self._last_refresh_request_count = self._request_count
+            _LOGGER.debug(
+                "Refresh made %d API requests", self._last_refresh_request_count
+            )
+
+            return [
+                self._build_delivery_info(
+                    delivery_date, shop_date, snapshot.pause_index, items
+                )
+                for (delivery_date, shop_date), items in zip(
+                    pending_dates, items_per_delivery, strict=True
+                )
+            ]
         except Exception as err:
-            _LOGGER.error("Failed to get next delivery: %s", err)
+            _LOGGER.error("Failed to get upcoming deliveries: %s", err)
             raise
 
     async def close(self) -> None:
         """Close any open connections."""
+        self._authenticated = False
+        self._item_cache.clear()
+        if self._connection.refs > 1:
+            # Other entries of the account still use the connection
+            return
         if self._client:
             await self._client.close()
             self._client = None
-        self._authenticated = False
+        self._session.reset()
+
+    async def _async_add_week_pause(
+        self, week_start: date_type, week_end: date_type
+    ) -> PauseWeekResult:
+        """Pause a Monday to Sunday week, resolving basket conflicts if enabled.
+
+        Args:
+            week_start: Monday of the week
+            week_end: Sunday of the week
+
+        Returns:
+            PauseWeekResult with PAUSE_RESULT_PAUSED, _CONFLICT or _FAILED
+
+        Raises:
+            OekoboxAPIError: If add_pause fails with anything but HTTP 409
+        """
+        # Convert to datetime objects
+        from_datetime = dt.combine(week_start, dt.min.time())
+        to_datetime = dt.combine(week_end, dt.max.time())
+
+        def _week_paused(snapshot: DatesSnapshot) -> bool:
+            return snapshot.pause_index.covers(week_start, week_end)
+
+        try:
+            # First attempt without auto_cancel
+            _LOGGER.debug(
+                "Calling add_pause from %s to %s (auto_cancel=False)",
+                week_start,
+                week_end,
+            )
+            await self._async_write(
+                "add_pause",
+                lambda: self._client.add_pause(
+                    from_datetime, to_datetime, auto_cancel=False
+                ),
+                _week_paused,
+            )
+            _LOGGER.info(
+                "Successfully paused delivery week %s to %s", week_start, week_end
+            )
+            return PauseWeekResult(week_start, week_end, PAUSE_RESULT_PAUSED)
+
+        except OekoboxAPIError as api_err:
+            # Re-raise if it's not a HTTP 409 Conflict error
+            if getattr(api_err, "status_code", None) != 409:
+                raise
+
+            _LOGGER.debug(
+                "Received HTTP 409 Conflict when trying to pause delivery week %s to %s: %s",
+                week_start,
+                week_end,
+                api_err,
+            )
+
+            if not self._auto_cancel_on_pause_conflict:
+                _LOGGER.warning(
+                    "HTTP 409 Conflict: A basket is already planned for the week %s to %s. "
+                    "Enable 'Auto-cancel on pause conflict' option to automatically "
+                    "cancel the order when pausing.",
+                    week_start,
+                    week_end,
+                )
+                return PauseWeekResult(
+                    week_start, week_end, PAUSE_RESULT_CONFLICT, str(api_err)
+                )
 
-    async def pause_next_delivery(self) -> bool:
+            # Retry with auto_cancel if the option is enabled
+            _LOGGER.info(
+                "Auto-cancel on pause conflict is enabled, retrying with auto_cancel=True for week %s to %s",
+                week_start,
+                week_end,
+            )
+            try:
+                await self._async_write(
+                    "add_pause",
+                    lambda: self._client.add_pause(
+                        from_datetime, to_datetime, auto_cancel=True
+                    ),
+                    _week_paused,
+                )
+            except Exception as retry_err:
+                _LOGGER.error(
+                    "Failed to pause delivery with auto_cancel=True: %s",
+                    retry_err,
+                )
+                return PauseWeekResult(
+                    week_start, week_end, PAUSE_RESULT_FAILED, str(retry_err)
+                )
+
+            _LOGGER.info(
+                "Successfully paused delivery week %s to %s with auto_cancel=True",
+                week_start,
+                week_end,
+            )
+            return PauseWeekResult(week_start, week_end, PAUSE_RESULT_PAUSED)
+
+    async def pause_next_delivery(self) -> PauseRecord | None:
         """Pause the next delivery.
 
         Returns:
-            True if successful, False otherwise
+            PauseRecord describing the new pause, or None if pausing failed
         """
-        if not self._authenticated or self._client is None:
-            if not await self.authenticate():
-                _LOGGER.error("Not authenticated, cannot pause delivery")
-                return False
+        if not await self._async_ensure_session():
+            _LOGGER.error("Not authenticated, cannot pause delivery")
+            return None
 
         try:
             # Find the next pending delivery
-            delivery_date, next_shop_date = await self._find_next_delivery()
+            snapshot = await self._get_dates_snapshot()
+            delivery_date, next_shop_date = self._find_next_delivery(snapshot)
 
             if not next_shop_date or not delivery_date:
                 _LOGGER.warning("No pending delivery found to pause")
-                return False
+                return None
 
             _LOGGER.debug(
                 "Attempting to pause delivery on %s (order_id %s)",
@@ -434,164 +889,155 @@ class OekoBoxProvider(OrganicBoxProvider):
 
             # Use add_pause method with the delivery date
             # The pause needs to span the entire week (Monday to Sunday) for it to show up in the shop UI
-            if hasattr(self._client, "add_pause"):
-                # Calculate the start (Monday) and end (Sunday) of the week containing the delivery date
-                # weekday() returns 0 for Monday, 6 for Sunday
-                days_to_monday = delivery_date.weekday()  # 0 if Monday, 6 if Sunday
-                week_start = delivery_date - timedelta(days=days_to_monday)
-                week_end = week_start + timedelta(days=6)  # Sunday
+            if not hasattr(self._client, "add_pause"):
+                _LOGGER.warning(
+                    "add_pause method not available in pyoekoboxonline library"
+                )
+                return None
+
+            [(week_start, week_end)] = week_spans(delivery_date, delivery_date)
+            _LOGGER.debug(
+                "Pausing full week: %s to %s (delivery on %s)",
+                week_start,
+                week_end,
+                delivery_date,
+            )
 
-                # Convert to datetime objects
-                from_datetime = dt.combine(week_start, dt.min.time())
-                to_datetime = dt.combine(week_end, dt.max.time())
+            result = await self._async_add_week_pause(week_start, week_end)
+            if result.status != PAUSE_RESULT_PAUSED:
+                return None
 
-                _LOGGER.debug(
-                    "Pausing full week: %s to %s (delivery on %s)",
-                    week_start,
-                    week_end,
-                    delivery_date,
-                )
+            _LOGGER.info(
+                "Paused delivery on %s (order_id %s)",
+                delivery_date,
+                next_shop_date.order_id,
+            )
+            return PauseRecord(
+                delivery_date=delivery_date,
+                is_paused=True,
+                start_date=week_start,
+                end_date=week_end,
+            )
+        except Exception as err:
+            _LOGGER.error("Failed to pause delivery: %s", err)
+            return None
+
+    async def pause_range(
+        self, start_date: date_type, end_date: date_type
+    ) -> list[PauseWeekResult]:
+        """Pause every delivery week overlapping a date range.
+
+        The weeks are derived from a single dates snapshot; weeks that are
+        already fully paused are skipped and the remaining add_pause calls
+        run concurrently.
 
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            One PauseWeekResult per Monday to Sunday week of the range
+        """
+        weeks = week_spans(start_date, end_date)
+        if not await self._async_ensure_session():
+            _LOGGER.error("Not authenticated, cannot pause deliveries")
+            return [
+                PauseWeekResult(start, end, PAUSE_RESULT_FAILED, "Not authenticated")
+                for start, end in weeks
+            ]
+        if not hasattr(self._client, "add_pause"):
+            _LOGGER.warning("add_pause method not available in pyoekoboxonline library")
+            return []
+
+        try:
+            snapshot = await self._get_dates_snapshot()
+        except Exception as err:
+            _LOGGER.error("Failed to fetch pauses: %s", err)
+            return [
+                PauseWeekResult(start, end, PAUSE_RESULT_FAILED, str(err))
+                for start, end in weeks
+            ]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAUSE_REQUESTS)
+
+        async def _pause_week(
+            week_start: date_type, week_end: date_type
+        ) -> PauseWeekResult:
+            if snapshot.pause_index.covers(week_start, week_end):
+                return PauseWeekResult(
+                    week_start, week_end, PAUSE_RESULT_ALREADY_PAUSED
+                )
+            async with semaphore:
                 try:
-                    # First attempt without auto_cancel
-                    _LOGGER.debug(
-                        "Calling add_pause from %s to %s (auto_cancel=False)",
-                        week_start,
-                        week_end,
+                    return await self._async_add_week_pause(week_start, week_end)
+                except Exception as err:
+                    _LOGGER.error(
+                        "Failed to pause week %s to %s: %s", week_start, week_end, err
                     )
-                    await self._client.add_pause(
-                        from_datetime, to_datetime, auto_cancel=False
+                    return PauseWeekResult(
+                        week_start, week_end, PAUSE_RESULT_FAILED, str(err)
                     )
-                    _LOGGER.info(
-                        "Successfully paused delivery week %s to %s (delivery on %s, order_id %s)",
-                        week_start,
-                        week_end,
-                        delivery_date,
-                        next_shop_date.order_id,
-                    )
-                    return True
-
-                except OekoboxAPIError as api_err:
-                    # Check if it's a HTTP 409 Conflict error
-                    if hasattr(api_err, "status_code") and api_err.status_code == 409:
-                        _LOGGER.debug(
-                            "Received HTTP 409 Conflict when trying to pause delivery week %s to %s: %s",
-                            week_start,
-                            week_end,
-                            api_err,
-                        )
-
-                        # Retry with auto_cancel if the option is enabled
-                        if self._auto_cancel_on_pause_conflict:
-                            _LOGGER.info(
-                                "Auto-cancel on pause conflict is enabled, retrying with auto_cancel=True for week %s to %s",
-                                week_start,
-                                week_end,
-                            )
-                            try:
-                                await self._client.add_pause(
-                                    from_datetime, to_datetime, auto_cancel=True
-                                )
-                                _LOGGER.info(
-                                    "Successfully paused delivery week %s to %s with auto_cancel=True (delivery on %s, order_id %s)",
-                                    week_start,
-                                    week_end,
-                                    delivery_date,
-                                    next_shop_date.order_id,
-                                )
-                                return True
-                            except Exception as retry_err:
-                                _LOGGER.error(
-                                    "Failed to pause delivery with auto_cancel=True: %s",
-                                    retry_err,
-                                )
-                                return False
-                        else:
-                            _LOGGER.warning(
-                                "HTTP 409 Conflict: A basket is already planned for the week %s to %s. "
-                                "Enable 'Auto-cancel on pause conflict' option to automatically "
-                                "cancel the order when pausing.",
-                                week_start,
-                                week_end,
-                            )
-                            return False
-                    else:
-                        # Re-raise if it's not a 409 error
-                        raise
 
-            else:
-                _LOGGER.warning(
-                    "add_pause method not available in pyoekoboxonline library"
-                )
-                return False
-        except Exception as err:
-            _LOGGER.error("Failed to pause delivery: %s", err)
-            return False
+        return list(await asyncio.gather(*(_pause_week(*week) for week in weeks)))
 
-    async def unpause_next_delivery(self) -> bool:
+    async def unpause_next_delivery(self) -> PauseRecord | None:
         """Unpause (resume) the next delivery.
 
         Returns:
-            True if successful, False otherwise
+            PauseRecord describing the dropped pause, or None if unpausing failed
         """
-        if not self._authenticated or self._client is None:
-            if not await self.authenticate():
-                _LOGGER.error("Not authenticated, cannot unpause delivery")
-                return False
+        if not await self._async_ensure_session():
+            _LOGGER.error("Not authenticated, cannot unpause delivery")
+            return None
 
         try:
-            # Find the next delivery
-            delivery_date, next_shop_date = await self._find_next_delivery()
+            # Find the next delivery and its pauses from a single dates fetch
+            snapshot = await self._get_dates_snapshot()
+            delivery_date, next_shop_date = self._find_next_delivery(snapshot)
 
             if not next_shop_date:
                 _LOGGER.warning("No delivery found to unpause")
-                return False
+                return None
 
-            # Get pauses and check if delivery is paused
-            pauses = await self._get_pauses()
-            if not self._check_if_paused(next_shop_date, pauses):
+            if not self._check_if_paused(next_shop_date, snapshot.pause_index):
                 _LOGGER.warning(
                     "Delivery on %s is not paused, nothing to unpause", delivery_date
                 )
-                return False
+                return None
 
             # Find the pause ID for this delivery
-            pause_id = None
-            for pause in pauses:
-                if hasattr(pause, "delivery_date"):
-                    pause_date = self._parse_date(pause.delivery_date)
-                    if pause_date == delivery_date and hasattr(pause, "id"):
-                        pause_id = pause.id
-                        break
-                # Check date range pauses
-                elif hasattr(pause, "date_from") and hasattr(pause, "date_to"):
-                    date_from = self._parse_date(pause.date_from)
-                    date_to = self._parse_date(pause.date_to)
-                    if date_from <= delivery_date <= date_to and hasattr(pause, "id"):
-                        pause_id = pause.id
-                        break
+            pause = snapshot.pause_index.find(delivery_date)
+            pause_id = pause.pause_id if pause else None
 
             if pause_id is None:
                 _LOGGER.error(
                     "Could not find pause ID for delivery on %s", delivery_date
                 )
-                return False
+                return None
 
             # Use drop_pause method with the pause ID
             if hasattr(self._client, "drop_pause"):
-                await self._client.drop_pause(pause_id)
+                await self._async_write(
+                    "drop_pause",
+                    lambda: self._client.drop_pause(pause_id),
+                    lambda snapshot: not snapshot.pause_index.is_paused(delivery_date),
+                )
                 _LOGGER.info(
                     "Unpaused delivery on %s (pause_id %s, order_id %s)",
                     delivery_date,
                     pause_id,
                     next_shop_date.order_id,
                 )
-                return True
+                return PauseRecord(
+                    delivery_date=delivery_date,
+                    is_paused=False,
+                    pause_id=pause_id,
+                )
             else:
                 _LOGGER.warning(
                     "drop_pause method not available in pyoekoboxonline library"
                 )
-                return False
+                return None
         except Exception as err:
             _LOGGER.error("Failed to unpause delivery: %s", err)
-            return False
+            return None
@@ -0,0 +1,192 @@
+"""Interval index over subscription pauses."""
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_date(date_value: date | datetime | str) -> date:
+    """Parse a date value to a date object.
+
+    Args:
+        date_value: Date value to parse (can be date, datetime, or string)
+
+    Returns:
+        date object
+    """
+    if isinstance(date_value, date) and not isinstance(date_value, datetime):
+        return date_value
+    if isinstance(date_value, datetime):
+        return date_value.date()
+    # Parse string
+    return datetime.strptime(str(date_value), "%Y-%m-%d").date()
+
+
+def week_spans(start: date, end: date) -> list[tuple[date, date]]:
+    """Return the Monday to Sunday weeks covering a date range.
+
+    Args:
+        start: First date of the range
+        end: Last date of the range (inclusive)
+
+    Returns:
+        List of (monday, sunday) tuples in chronological order
+    """
+    monday = start - timedelta(days=start.weekday())
+    spans = []
+    while monday <= end:
+        spans.append((monday, monday + timedelta(days=6)))
+        monday += timedelta(days=7)
+    return spans
+
+
+@dataclass(frozen=True)
+class PauseInterval:
+    """Inclusive date range covered by a single pause."""
+
+    start: date
+    end: date
+    pause_id: int | None = None
+
+    @classmethod
+    def from_pause(cls, pause: Any) -> "PauseInterval | None":
+        """Build an interval from a pause object.
+
+        Supports the start_date/end_date fields of the Pause model, the
+        date_from/date_to fields of older library versions and single-day
+        pauses with a delivery_date.
+
+        Args:
+            pause: Pause object from the dates payload
+
+        Returns:
+            PauseInterval for the pause, or None if it carries no usable dates
+        """
+        for start_attr, end_attr in (
+            ("start_date", "end_date"),
+            ("date_from", "date_to"),
+            ("delivery_date", "delivery_date"),
+        ):
+            start = getattr(pause, start_attr, None)
+            end = getattr(pause, end_attr, None)
+            if not start or not end:
+                continue
+            try:
+                start_date = parse_date(start)
+                end_date = parse_date(end)
+            except (TypeError, ValueError):
+                _LOGGER.debug("Ignoring pause with unparsable dates: %s", pause)
+                return None
+            if end_date < start_date:
+                return None
+            return cls(start_date, end_date, getattr(pause, "id", None))
+        return None
+
+
+class PauseIndex:
+    """Sorted, merged pause intervals answering date lookups with bisect.
+
+    Overlapping and adjacent pauses are merged into disjoint spans, so finding
+    the span containing a date is a binary search over the span starts. Each
+    span keeps its member pauses to resolve the pause id, with their starts
+    and the running maximum of their ends for a second binary search.
+    """
+
+    def __init__(self, intervals: Iterable[PauseInterval]) -> None:
+        """Initialize the index.
+
+        Args:
+            intervals: Pause intervals in any order
+        """
+        self._starts: list[date] = []
+        self._ends: list[date] = []
+        self._members: list[list[PauseInterval]] = []
+
+        for interval in sorted(intervals, key=lambda i: (i.start, i.end)):
+            if self._ends and interval.start <= self._ends[-1] + timedelta(days=1):
+                self._ends[-1] = max(self._ends[-1], interval.end)
+                self._members[-1].append(interval)
+            else:
+                self._starts.append(interval.start)
+                self._ends.append(interval.end)
+                self._members.append([interval])
+
+        self._member_starts = [
+            [interval.start for interval in members] for members in self._members
+        ]
+        # Latest end among the members up to each position
+        self._member_reach: list[list[date]] = []
+        for members in self._members:
+            reach = [members[0].end]
+            for interval in members[1:]:
+                reach.append(max(reach[-1], interval.end))
+            self._member_reach.append(reach)
+
+    @classmethod
+    def from_pauses(cls, pauses: Iterable[Any]) -> "PauseIndex":
+        """Build an index from the pauses of a dates payload.
+
+        Args:
+            pauses: Pause objects from the API
+
+        Returns:
+            PauseIndex over all pauses with usable dates
+        """
+        intervals = (PauseInterval.from_pause(pause) for pause in pauses)
+        return cls(interval for interval in intervals if interval is not None)
+
+    def __len__(self) -> int:
+        """Return the number of merged spans."""
+        return len(self._starts)
+
+    def _span_index(self, day: date) -> int | None:
+        """Return the index of the merged span containing a date."""
+        index = bisect_right(self._starts, day) - 1
+        if index < 0 or day > self._ends[index]:
+            return None
+        return index
+
+    def find(self, day: date) -> PauseInterval | None:
+        """Return the pause covering a date.
+
+        Args:
+            day: The date to look up
+
+        Returns:
+            The latest starting pause covering the date, or None if not paused
+        """
+        index = self._span_index(day)
+        if index is None:
+            return None
+        members = self._members[index]
+        reach = self._member_reach[index]
+        position = bisect_right(self._member_starts[index], day) - 1
+        # Adjacent pauses never overlap, so the latest starting member usually
+        # covers the date; otherwise walk back while an earlier one reaches it
+        while position >= 0 and reach[position] >= day:
+            if members[position].end >= day:
+                return members[position]
+            position -= 1
+        return None
+
+    def is_paused(self, day: date) -> bool:
+        """Return whether a date is covered by a pause."""
+        return self._span_index(day) is not None
+
+    def covers(self, start: date, end: date) -> bool:
+        """Return whether every date of a range is covered by pauses.
+
+        Args:
+            start: First date of the range
+            end: Last date of the range (inclusive)
+
+        Returns:
+            True if the range lies within a single merged span
+        """
+        index = self._span_index(start)
+        return index is not None and end <= self._ends[index]
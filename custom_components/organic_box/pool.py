@@ -0,0 +1,226 @@
+"""Shared provider connections and request rate limiting."""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from yarl import URL
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    DATA_CLIENT_POOL,
+    DEFAULT_MAX_REQUEST_RATE,
+    RATE_LIMIT_BURST,
+    SESSION_REUSE_WINDOW,
+)
+from .resilience import CircuitBreaker
+from .session import SessionManager
+from .singleflight import SingleFlight
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket limiting the rate of requests to a host.
+
+    Up to capacity requests may run back to back; after that requests are
+    delayed so the long-term rate never exceeds the configured one.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens
+        """
+        self.rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.wait_count = 0
+        self.total_wait = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take a token, waiting until one is available."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self.wait_count += 1
+                self.total_wait += delay
+                _LOGGER.debug("Rate limit reached, delaying request by %.2fs", delay)
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return limiter statistics for diagnostics."""
+        return {
+            "rate_per_minute": self.rate * 60,
+            "wait_count": self.wait_count,
+            "total_wait": self.total_wait,
+        }
+
+
+@dataclass(eq=False)
+class ClientConnection:
+    """Client and session state shared by all config entries of one account."""
+
+    session: SessionManager
+    breaker: CircuitBreaker
+    auth_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    single_flight: SingleFlight = field(default_factory=SingleFlight)
+    client: Any = None
+    rate_limiter: TokenBucket | None = None
+    refs: int = 0
+    max_rate: float = DEFAULT_MAX_REQUEST_RATE  # requests per minute
+    limiter_for_host: Callable[[str], TokenBucket] | None = None
+
+    @classmethod
+    def create(cls) -> "ClientConnection":
+        """Create a connection that is not shared with other entries."""
+        return cls(
+            session=SessionManager(timedelta(seconds=SESSION_REUSE_WINDOW)),
+            breaker=CircuitBreaker(
+                CIRCUIT_FAILURE_THRESHOLD, timedelta(seconds=CIRCUIT_RESET_TIMEOUT)
+            ),
+        )
+
+    def bind_url(self, url: Any) -> None:
+        """Attach the rate limiter of the host the client talks to.
+
+        Args:
+            url: Base URL of the provider API
+        """
+        if not isinstance(url, str) or self.limiter_for_host is None:
+            return
+        if host := URL(url).host:
+            self.rate_limiter = self.limiter_for_host(host)
+
+    async def async_throttle(self) -> None:
+        """Wait until the rate limit allows another request."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+
+class ClientPool:
+    """Registry of connections keyed by (shop_id, username).
+
+    Config entries of the same account share one connection, and all
+    connections talking to the same host share one rate limiter. The limiter
+    uses the lowest request rate configured by any entry in the pool.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pool."""
+        self._connections: dict[tuple[str, str], ClientConnection] = {}
+        self._limiters: dict[str, TokenBucket] = {}
+
+    @property
+    def rate(self) -> float:
+        """Return the request rate per minute enforced by the limiters."""
+        return min(
+            (connection.max_rate for connection in self._connections.values()),
+            default=DEFAULT_MAX_REQUEST_RATE,
+        )
+
+    def _apply_rate(self) -> None:
+        """Update the limiters after the set of connections changed."""
+        for limiter in self._limiters.values():
+            limiter.rate = self.rate / 60
+
+    def acquire(
+        self, shop_id: str, username: str, max_rate: float = DEFAULT_MAX_REQUEST_RATE
+    ) -> ClientConnection:
+        """Return the connection of an account and take a reference to it.
+
+        Args:
+            shop_id: The shop ID of the account
+            username: The username of the account
+            max_rate: Requests per minute allowed by the entry
+
+        Returns:
+            The shared connection of the account
+        """
+        key = (shop_id, username)
+        connection = self._connections.get(key)
+        if connection is None:
+            connection = ClientConnection.create()
+            connection.limiter_for_host = self.rate_limiter
+            self._connections[key] = connection
+        connection.refs += 1
+        connection.max_rate = max_rate
+        self._apply_rate()
+        _LOGGER.debug("Connection for shop %s has %d users", shop_id, connection.refs)
+        return connection
+
+    def release(self, shop_id: str, username: str) -> bool:
+        """Drop a reference to the connection of an account.
+
+        Args:
+            shop_id: The shop ID of the account
+            username: The username of the account
+
+        Returns:
+            True if this was the last reference and the connection was removed
+        """
+        key = (shop_id, username)
+        connection = self._connections.get(key)
+        if connection is None:
+            return True
+        connection.refs -= 1
+        if connection.refs > 0:
+            return False
+        del self._connections[key]
+        self._apply_rate()
+        return True
+
+    def rate_limiter(self, host: str) -> TokenBucket:
+        """Return the rate limiter shared by all connections to a host.
+
+        Args:
+            host: Host name of the provider API
+
+        Returns:
+            The token bucket of the host
+        """
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = TokenBucket(self.rate / 60, RATE_LIMIT_BURST)
+            self._limiters[host] = limiter
+        return limiter
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return pool statistics for diagnostics."""
+        return {
+            "connections": len(self._connections),
+            "rate_limiters": {
+                host: limiter.as_dict() for host, limiter in self._limiters.items()
+            },
+        }
+
+
+@callback
+def async_get_client_pool(hass: HomeAssistant) -> ClientPool:
+    """Return the client pool of the integration, creating it on first use."""
+    pool: ClientPool | None = hass.data.get(DATA_CLIENT_POOL)
+    if pool is None:
+        pool = hass.data[DATA_CLIENT_POOL] = ClientPool()
+    return pool
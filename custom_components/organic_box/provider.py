@@ -1,9 +1,10 @@
 """Abstract base class for organic box providers."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from datetime import date
+from typing import TYPE_CHECKING, Any
 
-from .models import DeliveryInfo
+from .models import DeliveryInfo, PauseRecord, PauseWeekResult
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -41,6 +42,24 @@ class OrganicBoxProvider(ABC):
             DeliveryInfo object containing delivery date and items
         """
 
+    async def get_upcoming_deliveries(self, count: int) -> list[DeliveryInfo]:
+        """Get information about the next deliveries.
+
+        Args:
+            count: Maximum number of deliveries to return
+
+        Returns:
+            List of DeliveryInfo objects sorted by delivery date
+
+        Note:
+            Default implementation only returns the next delivery.
+            Override this method in provider implementations that can look ahead.
+        """
+        delivery_info = await self.get_next_delivery()
+        if count < 1 or delivery_info.delivery_date is None:
+            return []
+        return [delivery_info]
+
     @abstractmethod
     async def test_connection(self) -> bool:
         """Test the connection to the provider.
@@ -63,29 +82,80 @@ class OrganicBoxProvider(ABC):
     async def close(self) -> None:
         """Close any open connections."""
 
-    async def pause_next_delivery(self) -> bool:
+    @property
+    def circuit_state(self) -> str | None:
+        """Return the state of the circuit breaker around the provider API.
+
+        Note:
+            Default implementation returns None (no circuit breaker).
+        """
+        return None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return provider internals for diagnostics.
+
+        Note:
+            Default implementation returns an empty dict.
+        """
+        return {}
+
+    def invalidate_cache(self) -> None:
+        """Drop cached data so the next refresh fetches everything again.
+
+        Note:
+            Default implementation does nothing.
+            Override this method in provider implementations that cache data.
+        """
+
+    def request_fresh_data(self) -> None:
+        """Make the next refresh bypass data cached by the provider's backend.
+
+        Note:
+            Default implementation does nothing.
+            Override this method in providers whose backend caches responses.
+        """
+
+    async def pause_next_delivery(self) -> PauseRecord | None:
         """Pause the next delivery.
 
         Returns:
-            True if successful, False otherwise
+            PauseRecord describing the new pause, or None if pausing failed
 
         Note:
-            Default implementation returns False (not supported).
+            Default implementation returns None (not supported).
             Override this method in provider implementations that support pausing.
         """
-        return False
+        return None
 
-    async def unpause_next_delivery(self) -> bool:
+    async def unpause_next_delivery(self) -> PauseRecord | None:
         """Unpause (resume) the next delivery.
 
         Returns:
-            True if successful, False otherwise
+            PauseRecord describing the dropped pause, or None if unpausing failed
 
         Note:
-            Default implementation returns False (not supported).
+            Default implementation returns None (not supported).
             Override this method in provider implementations that support pausing.
         """
-        return False
+        return None
+
+    async def pause_range(
+        self, start_date: date, end_date: date
+    ) -> list[PauseWeekResult]:
+        """Pause every delivery week overlapping a date range.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            One PauseWeekResult per Monday to Sunday week of the range
+
+        Note:
+            Default implementation returns an empty list (not supported).
+            Override this method in provider implementations that support pausing.
+        """
+        return []
 
     def supports_pause(self) -> bool:
         """Return whether the provider supports pausing deliveries.
@@ -0,0 +1,264 @@
+"""Retry and circuit breaker handling for provider API calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection
+from datetime import timedelta
+from enum import StrEnum
+import logging
+import random
+import time
+from typing import Any, TypeVar
+
+import aiohttp
+from pyoekoboxonline.exceptions import (
+    OekoboxAuthenticationError,
+    OekoboxConnectionError,
+    OekoboxError,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class ErrorKind(StrEnum):
+    """Classification of API errors."""
+
+    AUTH = "auth"
+    CONFLICT = "conflict"
+    SERVER = "server"
+    TIMEOUT = "timeout"
+    # No connection could be established, so the request was never sent
+    CONNECT = "connect"
+    CONNECTION = "connection"
+    CLIENT = "client"
+    UNKNOWN = "unknown"
+
+
+# Errors that indicate an unhealthy backend rather than a bad request
+TRANSIENT_ERRORS: frozenset[ErrorKind] = frozenset(
+    {ErrorKind.SERVER, ErrorKind.TIMEOUT, ErrorKind.CONNECT, ErrorKind.CONNECTION}
+)
+
+# Requests that never reached the backend can be repeated even if they change data
+UNDELIVERED_ERRORS: frozenset[ErrorKind] = frozenset({ErrorKind.CONNECT})
+
+# aiohttp errors raised before any byte of the request was sent
+_UNSENT_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+def classify_error(err: BaseException) -> ErrorKind:
+    """Classify an exception raised by an API call.
+
+    pyoekoboxonline wraps every aiohttp error in OekoboxConnectionError, so
+    the wrapped cause tells whether the request could have reached the
+    backend.
+
+    Args:
+        err: The exception to classify
+
+    Returns:
+        The ErrorKind of the exception
+    """
+    if isinstance(err, _UNSENT_ERRORS) or isinstance(err.__cause__, _UNSENT_ERRORS):
+        return ErrorKind.CONNECT
+    if isinstance(err, OekoboxAuthenticationError):
+        return ErrorKind.AUTH
+    if isinstance(err, TimeoutError):
+        return ErrorKind.TIMEOUT
+    if isinstance(err, (OekoboxConnectionError, aiohttp.ClientConnectionError)):
+        return ErrorKind.CONNECTION
+    status_code = getattr(err, "status_code", None)
+    if status_code is None and isinstance(err, aiohttp.ClientResponseError):
+        status_code = err.status
+    if isinstance(err, (OekoboxError, aiohttp.ClientResponseError)) and status_code:
+        if status_code in (401, 403):
+            return ErrorKind.AUTH
+        if status_code == 409:
+            return ErrorKind.CONFLICT
+        if status_code == 429 or status_code >= 500:
+            return ErrorKind.SERVER
+        return ErrorKind.CLIENT
+    return ErrorKind.UNKNOWN
+
+
+class CircuitBreaker:
+    """Stop calling a backend after repeated transient failures.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    are rejected until the (jittered) reset timeout has passed. The next call
+    is then let through as a trial: success closes the circuit, failure opens
+    it again. Other calls are rejected while the trial is in flight.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: timedelta) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Time the circuit stays open before a trial call
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout.total_seconds()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._retry_after = 0.0
+        self._probing = False
+        self.open_count = 0
+        self.last_error: str | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state, moving to half-open once the timeout passed."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._opened_at is not None
+            and time.monotonic() - self._opened_at >= self._retry_after
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return whether a call may be made.
+
+        While half-open, the first caller is let through as the trial call and
+        others are rejected until record_success, record_failure or release
+        resolved it.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """End a trial call that neither proved nor disproved recovery."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        if self._state is not CircuitState.CLOSED:
+            _LOGGER.info("Provider API recovered, closing circuit")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self, err: BaseException) -> None:
+        """Record a failed call, opening the circuit if the threshold is reached.
+
+        Args:
+            err: The exception the call failed with
+        """
+        self._failures += 1
+        self.last_error = str(err) or type(err).__name__
+        self._probing = False
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            if self._state is not CircuitState.OPEN:
+                self.open_count += 1
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            # Spread recovery attempts of several entries over time
+            self._retry_after = self._reset_timeout * random.uniform(1.0, 1.2)
+            _LOGGER.warning(
+                "Opening circuit after %d failures, next attempt in %.0fs: %s",
+                self._failures,
+                self._retry_after,
+                self.last_error,
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return breaker state for diagnostics."""
+        retry_in = None
+        if self.state is CircuitState.OPEN and self._opened_at is not None:
+            retry_in = max(
+                0.0, self._retry_after - (time.monotonic() - self._opened_at)
+            )
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "open_count": self.open_count,
+            "last_error": self.last_error,
+            "retry_in": retry_in,
+        }
+
+
+async def async_call_with_retry(
+    call: Callable[[], Awaitable[_T]],
+    *,
+    name: str,
+    breaker: CircuitBreaker,
+    attempts: int,
+    base_delay: float,
+    max_delay: float,
+    retry_on: Collection[ErrorKind] = TRANSIENT_ERRORS,
+) -> _T:
+    """Run an API call with retries and circuit breaking.
+
+    Failed attempts of a retryable kind are repeated after an exponentially
+    growing, capped delay with full jitter. The breaker only counts calls that
+    still failed with a transient error after all attempts. A trial call of a
+    half-open breaker gets a single attempt.
+
+    Args:
+        call: Callable returning the coroutine to run
+        name: Name of the call for logging
+        breaker: Circuit breaker guarding the backend
+        attempts: Maximum number of attempts
+        base_delay: Delay before the first retry in seconds
+        max_delay: Upper bound of the delay in seconds
+        retry_on: Error kinds that may be retried
+
+    Returns:
+        The result of the call
+
+    Raises:
+        CircuitOpenError: If the circuit is open
+        Exception: The error of the last attempt
+    """
+    for attempt in range(attempts):
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open, skipping {name}")
+        trial = breaker.state is CircuitState.HALF_OPEN
+        try:
+            result = await call()
+        except Exception as err:
+            kind = classify_error(err)
+            if kind in retry_on and attempt + 1 < attempts and not trial:
+                delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+                _LOGGER.debug(
+                    "%s failed (%s: %s), retrying in %.1fs", name, kind, err, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+            if kind in TRANSIENT_ERRORS:
+                breaker.record_failure(err)
+            elif trial:
+                breaker.release()
+            raise
+        except BaseException:
+            if trial:
+                breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
+    raise RuntimeError(f"{name} was not attempted")
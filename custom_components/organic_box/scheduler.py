@@ -0,0 +1,170 @@
+"""Adaptive polling schedule for the Organic Box coordinator."""
+
+from datetime import datetime, time, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEADLINE_WINDOW,
+    DEFAULT_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
+from .models import DeliveryInfo
+
+# Fraction of the time until the next event used as polling interval
+_EVENT_FRACTION = 4
+
+
+def _as_aware(value: datetime) -> datetime:
+    """Return a timezone aware datetime, assuming local time for naive values."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_util.get_default_time_zone())
+    return value
+
+
+def _clamp(seconds: float, lower: float, upper: float) -> float:
+    """Clamp a number of seconds into a range."""
+    return max(lower, min(seconds, upper))
+
+
+def _base_interval(delivery_info: DeliveryInfo | None, now: datetime) -> float:
+    """Return the polling interval in seconds, ignoring the quiet window.
+
+    Args:
+        delivery_info: The latest delivery information
+        now: The current time
+
+    Returns:
+        Polling interval in seconds
+    """
+    if delivery_info is None or delivery_info.delivery_date is None:
+        # No delivery planned; only a new order can change anything
+        return IDLE_SCAN_INTERVAL
+
+    delivery = _as_aware(delivery_info.delivery_date)
+    if delivery_info.order_state == 1 or delivery - now <= timedelta(days=1):
+        # The order is being prepared or delivered: watch for state transitions
+        return DEFAULT_SCAN_INTERVAL
+
+    if delivery_info.last_order_change is not None:
+        deadline = _as_aware(delivery_info.last_order_change)
+        until_deadline = (deadline - now).total_seconds()
+        if 0 < until_deadline <= DEADLINE_WINDOW:
+            # Changes close to the deadline have to show up quickly
+            return MIN_SCAN_INTERVAL
+        if until_deadline > DEADLINE_WINDOW:
+            interval = _clamp(
+                until_deadline / _EVENT_FRACTION,
+                DEFAULT_SCAN_INTERVAL,
+                MAX_SCAN_INTERVAL,
+            )
+            # Never sleep past the start of the deadline window
+            return max(
+                MIN_SCAN_INTERVAL, min(interval, until_deadline - DEADLINE_WINDOW)
+            )
+
+    # Past the deadline nothing changes until the delivery approaches
+    until_delivery = (delivery - now).total_seconds()
+    return _clamp(
+        until_delivery / _EVENT_FRACTION, DEFAULT_SCAN_INTERVAL, MAX_SCAN_INTERVAL
+    )
+
+
+def needs_fresh_data(delivery_info: DeliveryInfo | None, now: datetime) -> bool:
+    """Return whether a poll has to bypass provider-side caches.
+
+    Shortly before the order deadline and while the order is being prepared
+    or delivered, polls exist to show changes quickly, so they must not read
+    data the provider cached for an earlier poll.
+
+    Args:
+        delivery_info: The latest delivery information
+        now: The current time
+
+    Returns:
+        True if the next poll needs fresh data
+    """
+    if delivery_info is None or delivery_info.delivery_date is None:
+        return False
+
+    delivery = _as_aware(delivery_info.delivery_date)
+    if delivery_info.order_state == 1 or delivery - now <= timedelta(days=1):
+        return True
+
+    if delivery_info.last_order_change is None:
+        return False
+    deadline = _as_aware(delivery_info.last_order_change)
+    return 0 < (deadline - now).total_seconds() <= DEADLINE_WINDOW
+
+
+def _quiet_window_end(
+    moment: datetime, quiet_start: time, quiet_end: time
+) -> datetime | None:
+    """Return the end of the quiet window containing a moment.
+
+    Args:
+        moment: The moment to check
+        quiet_start: Local start time of the quiet window
+        quiet_end: Local end time of the quiet window
+
+    Returns:
+        The end of the quiet window, or None if the moment is outside of it
+    """
+    local = dt_util.as_local(moment)
+    current = local.timetz().replace(tzinfo=None)
+    end = local.replace(
+        hour=quiet_end.hour,
+        minute=quiet_end.minute,
+        second=quiet_end.second,
+        microsecond=0,
+    )
+
+    if quiet_start <= quiet_end:
+        if quiet_start <= current < quiet_end:
+            return end
+        return None
+
+    # The window wraps around midnight
+    if current >= quiet_start:
+        return end + timedelta(days=1)
+    if current < quiet_end:
+        return end
+    return None
+
+
+def compute_update_interval(
+    delivery_info: DeliveryInfo | None,
+    now: datetime,
+    quiet_start: time | None = None,
+    quiet_end: time | None = None,
+) -> timedelta:
+    """Compute the next coordinator update interval.
+
+    Polls rarely while nothing can change, tightens around the order deadline
+    and while the order is being prepared, and defers polls that would fall
+    into the quiet window to its end unless the order deadline lies within it.
+
+    Args:
+        delivery_info: The latest delivery information
+        now: The current time
+        quiet_start: Local start time of the quiet window
+        quiet_end: Local end time of the quiet window
+
+    Returns:
+        The interval until the next update
+    """
+    interval = _base_interval(delivery_info, now)
+
+    if quiet_start is not None and quiet_end is not None and quiet_start != quiet_end:
+        next_poll = now + timedelta(seconds=interval)
+        window_end = _quiet_window_end(next_poll, quiet_start, quiet_end)
+        if window_end is not None:
+            deadline = None
+            if delivery_info is not None and delivery_info.last_order_change:
+                deadline = _as_aware(delivery_info.last_order_change)
+            if deadline is None or not now < deadline <= window_end:
+                interval = (window_end - now).total_seconds()
+
+    return timedelta(seconds=interval)
@@ -9,15 +9,16 @@ from homeassistant.const import CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTR_BASKET_ITEMS,
+    ATTR_CIRCUIT_STATE,
     ATTR_MATCHED_ITEMS,
     ATTR_PROVIDER,
     DOMAIN,
 )
 from .coordinator import OrganicBoxDataUpdateCoordinator
+from .entity import OrganicBoxEntity
 from .models import DeliveryInfo
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,9 +41,7 @@ async def async_setup_entry(
     )
 
 
-class OrganicBoxSensorBase(
-    CoordinatorEntity[OrganicBoxDataUpdateCoordinator], SensorEntity
-):
+class OrganicBoxSensorBase(OrganicBoxEntity, SensorEntity):
     """Base class for Organic Box sensors."""
 
     _attr_has_entity_name = True
@@ -95,16 +94,18 @@ class OrganicBoxNextDeliverySensor(OrganicBoxSensorBase):
             return self.delivery_info.delivery_date
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
+    def _build_extra_state_attributes(self) -> dict:
+        """Build the state attributes."""
         if not self.delivery_info:
             return {}
 
-        return {
+        attributes = {
             ATTR_PROVIDER: self.coordinator.provider.name,
             "total_items": self.delivery_info.total_items,
         }
+        if (circuit_state := self.coordinator.provider.circuit_state) is not None:
+            attributes[ATTR_CIRCUIT_STATE] = circuit_state
+        return attributes
 
 
 class OrganicBoxBasketItemsSensor(OrganicBoxSensorBase):
@@ -131,9 +132,8 @@ class OrganicBoxBasketItemsSensor(OrganicBoxSensorBase):
             return self.delivery_info.total_items
         return 0
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
+    def _build_extra_state_attributes(self) -> dict:
+        """Build the state attributes."""
         if not self.delivery_info or not self.delivery_info.items:
             return {}
 
@@ -199,9 +199,8 @@ class OrganicBoxLastOrderChangeSensor(OrganicBoxSensorBase):
             and self.delivery_info.last_order_change is not None
         )
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
+    def _build_extra_state_attributes(self) -> dict:
+        """Build the state attributes."""
         if not self.delivery_info:
             return {}
 
@@ -0,0 +1,199 @@
+"""Services for the Organic Box integration."""
+
+from datetime import timedelta
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BASKET_ITEM,
+    ATTR_END_DATE,
+    ATTR_FORCE,
+    ATTR_SHOPPING_ITEM,
+    ATTR_START_DATE,
+    DOMAIN,
+    MAX_PAUSE_RANGE_WEEKS,
+    PAUSE_RESULT_PAUSED,
+    SERVICE_FORGET_MATCH,
+    SERVICE_LEARN_MATCH,
+    SERVICE_PAUSE_RANGE,
+    SERVICE_UPDATE_BASKET,
+)
+from .coordinator import OrganicBoxDataUpdateCoordinator
+from .models import BasketItem
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_BASKET_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+    }
+)
+
+PAUSE_RANGE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Required(ATTR_END_DATE): cv.date,
+    }
+)
+
+LEARN_MATCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_BASKET_ITEM): cv.string,
+        vol.Required(ATTR_SHOPPING_ITEM): cv.string,
+    }
+)
+
+FORGET_MATCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_BASKET_ITEM): cv.string,
+    }
+)
+
+
+def _get_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[OrganicBoxDataUpdateCoordinator]:
+    """Return the coordinators targeted by a service call.
+
+    Args:
+        hass: Home Assistant instance
+        call: The service call
+
+    Returns:
+        Coordinators of the entities in the call, or all if none were given
+    """
+    coordinators: dict[str, OrganicBoxDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    entity_ids = call.data.get(ATTR_ENTITY_ID)
+    if not entity_ids:
+        return list(coordinators.values())
+
+    entity_registry = er.async_get(hass)
+    entry_ids = set()
+    for entity_id in entity_ids:
+        entity_entry = entity_registry.async_get(entity_id)
+        if entity_entry is None or entity_entry.config_entry_id not in coordinators:
+            _LOGGER.warning("%s is not an Organic Box entity", entity_id)
+            continue
+        entry_ids.add(entity_entry.config_entry_id)
+
+    return [coordinators[entry_id] for entry_id in entry_ids]
+
+
+async def _async_update_basket(call: ServiceCall) -> None:
+    """Refresh basket and delivery data."""
+    for coordinator in _get_coordinators(call.hass, call):
+        if call.data[ATTR_FORCE]:
+            # Bypass cached data and the refresh debouncer
+            coordinator.provider.invalidate_cache()
+            await coordinator.async_refresh()
+        else:
+            await coordinator.async_request_refresh()
+
+
+async def _async_pause_range(call: ServiceCall) -> ServiceResponse:
+    """Pause all delivery weeks overlapping a date range."""
+    start_date = call.data[ATTR_START_DATE]
+    end_date = call.data[ATTR_END_DATE]
+    today = dt_util.now().date()
+    if start_date < today - timedelta(days=today.weekday()):
+        raise ServiceValidationError(
+            f"Start date {start_date} is before the current delivery week"
+        )
+    if end_date < start_date:
+        raise ServiceValidationError(
+            f"End date {end_date} is before start date {start_date}"
+        )
+    if (end_date - start_date).days >= MAX_PAUSE_RANGE_WEEKS * 7:
+        raise ServiceValidationError(
+            f"Cannot pause more than {MAX_PAUSE_RANGE_WEEKS} weeks at once"
+        )
+
+    response = {}
+    for coordinator in _get_coordinators(call.hass, call):
+        results = await coordinator.provider.pause_range(start_date, end_date)
+        if any(result.status == PAUSE_RESULT_PAUSED for result in results):
+            await coordinator.async_request_refresh()
+        response[coordinator.entry.entry_id] = {
+            "weeks": [result.as_dict() for result in results]
+        }
+    return response
+
+
+def _basket_item(coordinator: OrganicBoxDataUpdateCoordinator, name: str) -> BasketItem:
+    """Return the basket item of a name, with its product id if it is known.
+
+    Args:
+        coordinator: Coordinator of the entry
+        name: Name of the basket item
+
+    Returns:
+        The item from the current basket, or else an item with the product id
+        its alias was learned with
+    """
+    if coordinator.data is not None:
+        for item in coordinator.data.items:
+            if item.name == name:
+                return item
+    return coordinator.alias_table.resolve(name)
+
+
+async def _async_learn_match(call: ServiceCall) -> None:
+    """Remember which shopping list entry a basket item matches."""
+    for coordinator in _get_coordinators(call.hass, call):
+        item = _basket_item(coordinator, call.data[ATTR_BASKET_ITEM])
+        if coordinator.alias_table.learn(item, call.data[ATTR_SHOPPING_ITEM]):
+            coordinator.async_request_rematch()
+
+
+async def _async_forget_match(call: ServiceCall) -> None:
+    """Forget the learned shopping list entry of a basket item."""
+    for coordinator in _get_coordinators(call.hass, call):
+        item = _basket_item(coordinator, call.data[ATTR_BASKET_ITEM])
+        if coordinator.alias_table.forget(item):
+            coordinator.async_request_rematch()
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Organic Box services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UPDATE_BASKET,
+        _async_update_basket,
+        schema=UPDATE_BASKET_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PAUSE_RANGE,
+        _async_pause_range,
+        schema=PAUSE_RANGE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LEARN_MATCH,
+        _async_learn_match,
+        schema=LEARN_MATCH_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FORGET_MATCH,
+        _async_forget_match,
+        schema=FORGET_MATCH_SCHEMA,
+    )
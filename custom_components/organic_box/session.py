@@ -0,0 +1,91 @@
+"""Session lifecycle tracking for Organic Box providers."""
+
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SessionManager:
+    """Track the lifetime of an authenticated provider session.
+
+    The manager decides when a session has to be re-established and records
+    how often and how long logons took, so the requests of a refresh and the
+    calls following it share one logon instead of logging on for every
+    request. Providers whose backend caches responses per session keep
+    max_age below their polling interval.
+    """
+
+    def __init__(self, max_age: timedelta) -> None:
+        """Initialize the session manager.
+
+        Args:
+            max_age: Time a session may be reused before it is considered stale
+        """
+        self._max_age = max_age
+        self._started_at: float | None = None
+        self._stale = False
+        self.logon_count = 0
+        self.last_logon_latency: float | None = None
+        self.total_logon_latency = 0.0
+
+    @property
+    def age(self) -> float | None:
+        """Return the age of the current session in seconds."""
+        if self._started_at is None:
+            return None
+        return time.monotonic() - self._started_at
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Return whether the session must be re-established before use."""
+        if self._stale:
+            return True
+        age = self.age
+        return age is not None and age >= self._max_age.total_seconds()
+
+    def invalidate(self) -> None:
+        """Mark the session as stale so the next request logs on again."""
+        self._stale = True
+
+    def reset(self) -> None:
+        """Forget the current session, e.g. after the client was closed."""
+        self._started_at = None
+        self._stale = False
+
+    async def async_logon(self, logon: Callable[[], Awaitable[Any]]) -> None:
+        """Run a logon and record its latency.
+
+        Args:
+            logon: Callable returning the logon coroutine
+
+        Raises:
+            Exception: Whatever the logon raises; the session is reset
+        """
+        start = time.monotonic()
+        self.logon_count += 1
+        try:
+            await logon()
+        except Exception:
+            self.reset()
+            raise
+        finally:
+            self.last_logon_latency = time.monotonic() - start
+            self.total_logon_latency += self.last_logon_latency
+
+        self._started_at = time.monotonic()
+        self._stale = False
+        _LOGGER.debug("Logon #%d took %.3fs", self.logon_count, self.last_logon_latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return session statistics for diagnostics."""
+        return {
+            "logon_count": self.logon_count,
+            "last_logon_latency": self.last_logon_latency,
+            "total_logon_latency": self.total_logon_latency,
+            "session_age": self.age,
+            "max_age": self._max_age.total_seconds(),
+        }
@@ -1,64 +1,295 @@
 """Shopping list matcher for Organic Box integration."""
 
-import logging
-import re
+import asyncio
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import TYPE_CHECKING
-
-from homeassistant.components.shopping_list import DOMAIN as SHOPPING_LIST_DOMAIN
-from homeassistant.core import HomeAssistant
-
+from functools import lru_cache
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.shopping_list import (
+    DOMAIN as SHOPPING_LIST_DOMAIN,
+    ShoppingData,
+)
+from homeassistant.components.shopping_list.const import EVENT_SHOPPING_LIST_UPDATED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .assignment import max_weight_assignment
+from .const import (
+    MATCH_CANDIDATES,
+    MATCH_ENGINE_DIFFLIB,
+    MATCH_ENGINE_VECTOR,
+    MATCH_EXECUTOR_PAIRS,
+    NORMALIZE_CACHE_SIZE,
+)
+from .lexicon import PRODUCE_LEXICON
 from .models import BasketItem
+from .todo_source import TodoListSource
+from .vector_matcher import HAS_NUMPY, best_matches, scored_pairs
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from .aliases import AliasTable
+
 _LOGGER = logging.getLogger(__name__)
 
+# Highest score of two names sharing no trigram (no word-level bonus)
+_UNSHARED_SCORE_BOUND = 0.7
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(text: str) -> str:
+    """Normalize text for comparison; see ShoppingListMatcher.normalize_text."""
+    return PRODUCE_LEXICON.canonicalize(text)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _tokens(normalized: str) -> frozenset[str]:
+    """Return the word set of a normalized text."""
+    return frozenset(normalized.split())
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _trigrams(normalized: str) -> frozenset[str]:
+    """Return the character trigrams of a normalized text.
+
+    The text is padded with spaces, so two texts sharing a word of any length
+    also share a trigram.
+    """
+    padded = f" {normalized} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedText:
+    """A name with its normalized form, word set and trigrams computed once."""
+
+    text: str
+    normalized: str
+    tokens: frozenset[str]
+    trigrams: frozenset[str]
+
+    @classmethod
+    def from_text(cls, text: str) -> "PreparedText":
+        """Prepare a name for scoring."""
+        normalized = _normalize(text)
+        return cls(text, normalized, _tokens(normalized), _trigrams(normalized))
+
+
+class PreparedShoppingList:
+    """Shopping list entries normalized and indexed once for a whole basket.
+
+    An inverted index maps each trigram to the entries containing it, so the
+    entries resembling a basket item can be found without scoring the whole
+    list. Each entry keeps a SequenceMatcher with the entry as its second
+    sequence, whose analysis difflib caches between comparisons.
+    """
+
+    def __init__(self, items: Iterable[dict]) -> None:
+        """Initialize the prepared list.
+
+        Args:
+            items: Active shopping list items; items without a name are skipped
+        """
+        self.entries: list[tuple[dict, PreparedText]] = [
+            (item, PreparedText.from_text(name))
+            for item in items
+            if (name := item.get("name", ""))
+        ]
+        self.matchers = [
+            SequenceMatcher(None, "", text.normalized) for _, text in self.entries
+        ]
+        self._index: dict[str, list[int]] = defaultdict(list)
+        # Names that normalize to nothing get the substring bonus against
+        # every basket item, so they are candidates for all of them
+        self._unindexed: list[int] = []
+        # First entry per normalized name, for learned aliases
+        self.by_normalized: dict[str, int] = {}
+        for position, (_, text) in enumerate(self.entries):
+            self.by_normalized.setdefault(text.normalized, position)
+            if not text.normalized:
+                self._unindexed.append(position)
+            for trigram in text.trigrams:
+                self._index[trigram].append(position)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.entries)
+
+    def candidates(self, basket: PreparedText, include_all: bool) -> list[int]:
+        """Return entry positions ranked by the trigrams shared with a name.
+
+        Args:
+            basket: The prepared basket item name
+            include_all: Also return entries sharing no trigram with the name
+
+        Returns:
+            Entry positions, most shared trigrams first, then in list order
+        """
+        if include_all or not basket.normalized:
+            shared = Counter({position: 0 for position in range(len(self.entries))})
+        else:
+            shared = Counter({position: 0 for position in self._unindexed})
+        for trigram in basket.trigrams:
+            shared.update(self._index.get(trigram, ()))
+        return sorted(shared, key=lambda position: (-shared[position], position))
+
+
+def score_prepared(basket: PreparedText, shop: PreparedText) -> float:
+    """Score two prepared names; see ShoppingListMatcher.get_similarity.
+
+    Args:
+        basket: The prepared basket item name
+        shop: The prepared shopping list item name
+
+    Returns:
+        Similarity score (0.0-1.0)
+    """
+    return _blend(
+        SequenceMatcher(None, basket.normalized, shop.normalized).ratio(),
+        basket,
+        shop,
+    )
+
+
+def _blend(ratio: float, basket: PreparedText, shop: PreparedText) -> float:
+    """Combine the character-level ratio with substring and word bonuses."""
+    norm1 = basket.normalized
+    norm2 = shop.normalized
+
+    # Bonus for substring matches
+    if norm1 in norm2 or norm2 in norm1:
+        ratio = max(ratio, 0.85)
+
+    # Bonus for word-level matches
+    words1 = basket.tokens
+    words2 = shop.tokens
+    if words1 and words2:
+        word_similarity = len(words1 & words2) / max(len(words1), len(words2))
+        # Weighted average: 70% character-level, 30% word-level
+        ratio = 0.7 * ratio + 0.3 * word_similarity
+
+    return ratio
+
+
+def _can_save(shopping_data: ShoppingData) -> bool:
+    """Return True if the shopping list data can be saved in one go."""
+    return callable(getattr(shopping_data, "save", None)) and callable(
+        getattr(shopping_data, "_async_notify", None)
+    )
+
 
 class ShoppingListMatcher:
     """Match delivery items with Home Assistant shopping list."""
 
-    def __init__(self, hass: HomeAssistant, threshold: float = 0.80) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        threshold: float = 0.80,
+        engine: str = MATCH_ENGINE_DIFFLIB,
+        one_to_one: bool = False,
+        aliases: "AliasTable | None" = None,
+        todo_entities: Iterable[str] = (),
+    ) -> None:
         """Initialize the matcher.
 
         Args:
             hass: Home Assistant instance
             threshold: Similarity threshold (0.0-1.0) for matching
+            engine: MATCH_ENGINE_DIFFLIB for exact difflib scores or
+                MATCH_ENGINE_VECTOR for approximate scores from one NumPy
+                matrix product
+            one_to_one: Match each shopping list entry to at most one basket
+                item, maximizing the total similarity
+            aliases: Learned aliases that are matched before fuzzy scoring
+            todo_entities: To-do list entities to match against instead of
+                the shopping list
         """
         self._hass = hass
         self._threshold = threshold
-
-    @staticmethod
-    def normalize_text(text: str) -> str:
-        """Normalize text for comparison.
+        self.one_to_one = one_to_one
+        self.aliases = aliases
+        self._todo_source = (
+            TodoListSource(hass, todo_entities) if todo_entities else None
+        )
+        # Bumped on every shopping list update while subscribed
+        self.revision = 0
+        self._subscribed = False
+        self._memo_key: tuple[tuple[str, ...], int, int] | None = None
+        self._memo: dict[str, dict] = {}
+        # Inputs and results of the last run, for incremental rematching
+        self._last_basket: tuple[str, ...] | None = None
+        self._last_list: PreparedShoppingList | None = None
+        self._last_best: list[tuple[dict, float] | None] = []
+        # Serializes scoring, which may run in the executor
+        self._lock = asyncio.Lock()
+        self._stats: dict[str, Any] = {
+            "runs": 0,
+            "executor_runs": 0,
+            "last_pairs": None,
+            "last_duration": None,
+        }
+        if engine == MATCH_ENGINE_VECTOR and not HAS_NUMPY:
+            _LOGGER.warning("NumPy is not available, using the difflib matcher")
+            engine = MATCH_ENGINE_DIFFLIB
+        self.engine = engine
+
+    @callback
+    def async_subscribe(self, on_change: Callable[[], None]) -> CALLBACK_TYPE:
+        """Follow shopping list or to-do list updates.
+
+        While subscribed, match_items returns the memoized matches as long as
+        neither the basket nor the shopping list changed.
 
         Args:
-            text: Text to normalize
+            on_change: Called after every shopping list update
 
         Returns:
-            Normalized text
+            Callback that ends the subscription
         """
-        # Convert to lowercase
-        text = text.lower()
 
-        # Remove common prefixes/suffixes
-        text = re.sub(r"\b(organic|bio|fresh|local|regional)\b", "", text)
+        @callback
+        def _async_handle_update(event: Event) -> None:
+            self.revision += 1
+            on_change()
 
-        # Remove numbers followed by units (e.g., 1kg, 250g)
-        text = re.sub(r"\d+\s*(kg|g|l|ml|pcs?|pack|bunch)", "", text)
+        if self._todo_source is not None:
+            unsub = self._todo_source.async_subscribe(_async_handle_update)
+        else:
+            unsub = self._hass.bus.async_listen(
+                EVENT_SHOPPING_LIST_UPDATED, _async_handle_update
+            )
+        self._subscribed = True
 
-        # Remove special characters and extra spaces
-        text = re.sub(r"[^\w\s]", " ", text)
-        text = re.sub(r"\s+", " ", text)
+        @callback
+        def _async_unsubscribe() -> None:
+            self._subscribed = False
+            self._memo_key = None
+            unsub()
 
-        # Remove standalone common units
-        text = re.sub(r"\b(kg|g|l|ml|pcs?|pack|bunch)\b", "", text)
+        return _async_unsubscribe
 
-        # Clean up extra spaces again
-        text = re.sub(r"\s+", " ", text)
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text for comparison.
 
-        return text.strip()
+        Names are casefolded and stripped of accents, qualifiers such as
+        "organic" and quantities, and German and English produce names are
+        replaced by one canonical name, so "Möhren" and "Karotten" both
+        become "carrots". Results are cached, so repeated names are only
+        normalized once.
+
+        Args:
+            text: Text to normalize
+
+        Returns:
+            Normalized text
+        """
+        return _normalize(text)
 
     @staticmethod
     def get_similarity(text1: str, text2: str) -> float:
@@ -71,26 +302,9 @@ class ShoppingListMatcher:
         Returns:
             Similarity score (0.0-1.0)
         """
-        # Normalize both texts
-        norm1 = ShoppingListMatcher.normalize_text(text1)
-        norm2 = ShoppingListMatcher.normalize_text(text2)
-
-        # Use SequenceMatcher for basic similarity
-        base_similarity = SequenceMatcher(None, norm1, norm2).ratio()
-
-        # Bonus for substring matches
-        if norm1 in norm2 or norm2 in norm1:
-            base_similarity = max(base_similarity, 0.85)
-
-        # Bonus for word-level matches
-        words1 = set(norm1.split())
-        words2 = set(norm2.split())
-        if words1 and words2:
-            word_similarity = len(words1 & words2) / max(len(words1), len(words2))
-            # Weighted average: 70% character-level, 30% word-level
-            base_similarity = 0.7 * base_similarity + 0.3 * word_similarity
-
-        return base_similarity
+        return score_prepared(
+            PreparedText.from_text(text1), PreparedText.from_text(text2)
+        )
 
     async def is_shopping_list_available(self) -> bool:
         """Check if shopping list integration is available.
@@ -98,6 +312,8 @@ class ShoppingListMatcher:
         Returns:
             True if shopping list is available
         """
+        if self._todo_source is not None:
+            return self._todo_source.is_available()
         # Use the services registry — more reliable than checking hass.data directly
         # since hass.data[DOMAIN] is only set after async_setup_entry completes.
         return self._hass.services.has_service(SHOPPING_LIST_DOMAIN, "complete_item")
@@ -112,6 +328,9 @@ class ShoppingListMatcher:
             _LOGGER.debug("Shopping list integration not available")
             return []
 
+        if self._todo_source is not None:
+            return await self._todo_source.async_get_items()
+
         try:
             # Get shopping list data
             shopping_list_data = self._hass.data.get(SHOPPING_LIST_DOMAIN)
@@ -168,122 +387,520 @@ class ShoppingListMatcher:
             _LOGGER.error("Error getting shopping list items: %s", err)
             return []
 
+    def match_prepared(
+        self, basket_items: list[BasketItem], shopping_list: PreparedShoppingList
+    ) -> dict[str, dict]:
+        """Match basket items against a prepared shopping list.
+
+        Args:
+            basket_items: Items from the delivery basket
+            shopping_list: The prepared shopping list
+
+        Returns:
+            Dictionary mapping basket item names to matched shopping list items
+        """
+        basket = [PreparedText.from_text(item.name) for item in basket_items]
+        return self._to_matches(basket_items, self._match_best(basket, shopping_list))
+
+    def _match_best(
+        self, basket: list[PreparedText], shopping_list: PreparedShoppingList
+    ) -> list[tuple[dict, float] | None]:
+        """Return the matched shopping list item and score per basket item."""
+        if self.one_to_one:
+            return self._assign(basket, shopping_list)
+        if self.engine == MATCH_ENGINE_VECTOR:
+            return [
+                None
+                if result is None
+                else (shopping_list.entries[result[0]][0], result[1])
+                for result in best_matches(
+                    basket,
+                    [text for _, text in shopping_list.entries],
+                    self._threshold,
+                )
+            ]
+        return [
+            self._best_match(
+                prepared,
+                shopping_list,
+                shopping_list.candidates(prepared, self._include_all),
+            )
+            for prepared in basket
+        ]
+
+    def _rematch(
+        self, basket: list[PreparedText], shopping_list: PreparedShoppingList
+    ) -> list[tuple[dict, float] | None] | None:
+        """Update the last matches after the shopping list changed.
+
+        Entries keep their score while their normalized name is unchanged, so
+        a basket item only needs to be compared with added and renamed
+        entries, unless its own match was removed or renamed. Requires the
+        same basket as the last run and list items with unique ids.
+
+        Args:
+            basket: The prepared basket item names of the last run
+            shopping_list: The prepared current shopping list
+
+        Returns:
+            The best match per basket item, or None if a full run is needed
+        """
+        previous = self._last_list
+        if previous is None or self.one_to_one or self.engine != MATCH_ENGINE_DIFFLIB:
+            return None
+        old_ids = [item.get("id") for item, _ in previous.entries]
+        new_ids = [item.get("id") for item, _ in shopping_list.entries]
+        if (
+            None in old_ids
+            or None in new_ids
+            or len(set(old_ids)) != len(old_ids)
+            or len(set(new_ids)) != len(new_ids)
+        ):
+            return None
+
+        old_names = {item["id"]: text.normalized for item, text in previous.entries}
+        positions = {item_id: position for position, item_id in enumerate(new_ids)}
+        kept = {
+            item["id"]
+            for item, text in shopping_list.entries
+            if old_names.get(item["id"]) == text.normalized
+        }
+        # Ties go to the earliest entry, so a reordered list needs a full run
+        if [i for i in old_ids if i in kept] != [i for i in new_ids if i in kept]:
+            return None
+        fresh = [positions[i] for i in new_ids if i not in kept]
+
+        best: list[tuple[dict, float] | None] = []
+        for prepared, last in zip(basket, self._last_best, strict=True):
+            if last is None:
+                candidates = fresh
+            elif last[0].get("id") in kept:
+                candidates = [positions[last[0]["id"]], *fresh]
+            else:
+                candidates = shopping_list.candidates(prepared, self._include_all)
+            best.append(self._best_match(prepared, shopping_list, candidates))
+        _LOGGER.debug("Rematched against %d new or changed entries", len(fresh))
+        return best
+
+    def _to_matches(
+        self,
+        basket_items: list[BasketItem],
+        best: list[tuple[dict, float] | None],
+    ) -> dict[str, dict]:
+        """Build the match dictionary from the best match per basket item."""
+        matches = {}
+        for basket_item, match in zip(basket_items, best, strict=True):
+            if match is None:
+                continue
+            best_match, best_score = match
+            matches[basket_item.name] = {
+                "shopping_list_item": best_match,
+                "similarity": best_score,
+            }
+            _LOGGER.debug(
+                "Matched '%s' with '%s' (similarity: %.2f)",
+                basket_item.name,
+                best_match.get("name"),
+                best_score,
+            )
+        return matches
+
+    @property
+    def _include_all(self) -> bool:
+        """Return whether entries sharing no trigram can reach the threshold.
+
+        A pair sharing no trigram shares no word either, so its score is at
+        most 0.7 times the character ratio; above that threshold such pairs
+        can never match and only indexed candidates need scoring.
+        """
+        return self._threshold <= _UNSHARED_SCORE_BOUND
+
+    def _assign(
+        self, basket: list[PreparedText], shopping_list: PreparedShoppingList
+    ) -> list[tuple[dict, float] | None]:
+        """Match basket items so each list entry is used at most once.
+
+        All pairs at or above the threshold form a sparse bipartite graph,
+        and the assignment with the highest total similarity is chosen.
+
+        Args:
+            basket: The prepared basket item names
+            shopping_list: The prepared shopping list
+
+        Returns:
+            Per basket item, the matched shopping list item and its score
+        """
+        if self.engine == MATCH_ENGINE_VECTOR:
+            edges = scored_pairs(
+                basket, [text for _, text in shopping_list.entries], self._threshold
+            )
+        else:
+            edges = {}
+            for row, prepared in enumerate(basket):
+                for position in shopping_list.candidates(prepared, self._include_all):
+                    shop = shopping_list.entries[position][1]
+                    matcher = shopping_list.matchers[position]
+                    matcher.set_seq1(prepared.normalized)
+                    # Skip pairs whose cheap upper bound is below the threshold
+                    if (
+                        _blend(matcher.real_quick_ratio(), prepared, shop)
+                        < self._threshold
+                        or _blend(matcher.quick_ratio(), prepared, shop)
+                        < self._threshold
+                    ):
+                        continue
+                    score = _blend(matcher.ratio(), prepared, shop)
+                    if score >= self._threshold:
+                        edges[row, position] = score
+
+        assignment = max_weight_assignment(edges)
+        return [
+            (shopping_list.entries[assignment[row]][0], edges[row, assignment[row]])
+            if row in assignment
+            else None
+            for row in range(len(basket))
+        ]
+
+    def _best_match(
+        self,
+        basket: PreparedText,
+        shopping_list: PreparedShoppingList,
+        candidates: list[int],
+    ) -> tuple[dict, float] | None:
+        """Return the best scoring candidate for a basket item.
+
+        The top MATCH_CANDIDATES candidates are scored directly. Later ones are
+        only scored if difflib's cheap upper bounds of the ratio show they could
+        still beat the best match so far, so the result is the same as scoring
+        every entry: the highest score at or above the threshold, with the
+        earliest list entry winning ties.
+
+        Args:
+            basket: The prepared basket item name
+            shopping_list: The prepared shopping list
+            candidates: Entry positions in the order to score them
+
+        Returns:
+            Tuple of the matched shopping list item and its score, or None
+        """
+        best_position = -1
+        best_score = 0.0
+
+        def beats_best(score: float, position: int) -> bool:
+            if score < self._threshold:
+                return False
+            if best_position < 0 or score > best_score:
+                return True
+            return score == best_score and position < best_position
+
+        for rank, position in enumerate(candidates):
+            shop = shopping_list.entries[position][1]
+            matcher = shopping_list.matchers[position]
+            matcher.set_seq1(basket.normalized)
+            if rank >= MATCH_CANDIDATES and not (
+                beats_best(_blend(matcher.real_quick_ratio(), basket, shop), position)
+                and beats_best(_blend(matcher.quick_ratio(), basket, shop), position)
+            ):
+                continue
+            score = _blend(matcher.ratio(), basket, shop)
+            if beats_best(score, position):
+                best_position = position
+                best_score = score
+
+        if best_position < 0:
+            return None
+        return shopping_list.entries[best_position][0], best_score
+
     async def match_items(self, basket_items: list[BasketItem]) -> dict[str, dict]:
         """Match basket items with shopping list items.
 
+        While subscribed to shopping list updates, the matches are memoized by
+        basket and list revision, and a changed list is rematched
+        incrementally where possible. Nothing is memoized while the shopping
+        list is unavailable, as no update announces when it becomes ready.
+
         Args:
             basket_items: Items from the delivery basket
 
         Returns:
             Dictionary mapping basket item names to matched shopping list items
         """
+        basket_key = tuple(item.name for item in basket_items)
+        alias_version = self.aliases.version if self.aliases is not None else 0
+        memo_key = (basket_key, self.revision, alias_version)
+        if self._subscribed and memo_key == self._memo_key:
+            _LOGGER.debug("Basket and shopping list unchanged, reusing matches")
+            return self._memo
+
         if not await self.is_shopping_list_available():
             _LOGGER.debug("Shopping list not available, skipping matching")
+            self._last_list = None
             return {}
 
+        matches = await self._async_match(basket_key, basket_items)
+        if self._subscribed:
+            self._memo_key = memo_key
+            self._memo = matches
+        return matches
+
+    async def _async_match(
+        self, basket_key: tuple[str, ...], basket_items: list[BasketItem]
+    ) -> dict[str, dict]:
+        """Match basket items, reusing the last run if only the list changed."""
         shopping_items = await self.get_shopping_list_items()
         if not shopping_items:
             _LOGGER.debug("No active shopping list items to match")
+            self._last_list = None
             return {}
 
-        matches = {}
+        # Score plain copies, so the live shopping list may change meanwhile
+        snapshot = tuple(dict(item) for item in shopping_items)
+        aliases = {}
+        if self.aliases is not None:
+            for row, item in enumerate(basket_items):
+                if target := self.aliases.get(item):
+                    aliases[row] = target
+        pairs = len(basket_key) * len(snapshot)
+        in_executor = pairs >= MATCH_EXECUTOR_PAIRS
+        start = time.monotonic()
+        async with self._lock:
+            if in_executor:
+                best = await self._hass.async_add_executor_job(
+                    self._score, basket_key, snapshot, aliases
+                )
+            else:
+                best = self._score(basket_key, snapshot, aliases)
+        duration = time.monotonic() - start
+        self._stats.update(
+            runs=self._stats["runs"] + 1,
+            executor_runs=self._stats["executor_runs"] + in_executor,
+            last_pairs=pairs,
+            last_duration=duration,
+        )
+        _LOGGER.debug(
+            "Scored %d pairs in %.3fs%s",
+            pairs,
+            duration,
+            " in the executor" if in_executor else "",
+        )
+
+        matches = self._to_matches(basket_items, best)
+        _LOGGER.info("Matched %d of %d basket items", len(matches), len(basket_items))
+        return matches
 
-        for basket_item in basket_items:
-            best_match = None
-            best_score = 0.0
+    def _score(
+        self,
+        basket_key: tuple[str, ...],
+        shopping_items: tuple[dict, ...],
+        aliases: dict[int, str],
+    ) -> list[tuple[dict, float] | None]:
+        """Find the best match per basket item name.
 
-            for shop_item in shopping_items:
-                shop_item_name = shop_item.get("name", "")
-                if not shop_item_name:
-                    continue
+        Only touches the given snapshot and the matcher's own state, so it
+        can run in the executor. Basket items with a learned alias present in
+        the list match it directly with a similarity of 1.0; the others are
+        scored fuzzily.
 
-                similarity = self.get_similarity(basket_item.name, shop_item_name)
-
-                if similarity > best_score and similarity >= self._threshold:
-                    best_score = similarity
-                    best_match = shop_item
-
-            if best_match:
-                matches[basket_item.name] = {
-                    "shopping_list_item": best_match,
-                    "similarity": best_score,
-                }
-                _LOGGER.debug(
-                    "Matched '%s' with '%s' (similarity: %.2f)",
-                    basket_item.name,
-                    best_match.get("name"),
-                    best_score,
-                )
+        Args:
+            basket_key: Names of the basket items
+            shopping_items: Copies of the active shopping list items
+            aliases: Learned normalized shopping list name per basket row
 
-        _LOGGER.info("Matched %d of %d basket items", len(matches), len(basket_items))
-        return matches
+        Returns:
+            The matched shopping list item and score per basket item
+        """
+        shopping_list = PreparedShoppingList(shopping_items)
+        best: list[tuple[dict, float] | None] = [None] * len(basket_key)
+        claimed: set[int] = set()
+        for row, target in aliases.items():
+            position = shopping_list.by_normalized.get(target)
+            if position is None or (self.one_to_one and position in claimed):
+                continue
+            claimed.add(position)
+            best[row] = (shopping_list.entries[position][0], 1.0)
+
+        rows = [row for row, match in enumerate(best) if match is None]
+        if self.one_to_one and claimed:
+            # Entries taken by aliases are not available to other items
+            shopping_list = PreparedShoppingList(
+                item
+                for position, (item, _) in enumerate(shopping_list.entries)
+                if position not in claimed
+            )
+        fuzzy_key = tuple(basket_key[row] for row in rows)
+        for row, match in zip(
+            rows, self._score_fuzzy(fuzzy_key, shopping_list), strict=True
+        ):
+            best[row] = match
+        return best
+
+    def _score_fuzzy(
+        self, basket_key: tuple[str, ...], shopping_list: PreparedShoppingList
+    ) -> list[tuple[dict, float] | None]:
+        """Score basket item names, rematching incrementally where possible."""
+        basket = [PreparedText.from_text(name) for name in basket_key]
+        best = None
+        if basket_key == self._last_basket:
+            best = self._rematch(basket, shopping_list)
+        if best is None:
+            best = self._match_best(basket, shopping_list)
+        self._last_basket = basket_key
+        self._last_list = shopping_list
+        self._last_best = best
+        return best
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return matcher settings and statistics for diagnostics."""
+        return {
+            "engine": self.engine,
+            "threshold": self._threshold,
+            "one_to_one": self.one_to_one,
+            "revision": self.revision,
+            "aliases": len(self.aliases) if self.aliases is not None else 0,
+            "todo_entities": list(self._todo_source.entity_ids)
+            if self._todo_source is not None
+            else [],
+            **self._stats,
+        }
 
     async def mark_items_as_delivered(
         self, matches: dict[str, dict], delivery_date: "datetime | None"
-    ) -> None:
+    ) -> list[str]:
         """Mark matched shopping list items as delivered.
 
-        This will mark items as complete and add a note about the delivery.
+        Items are completed by id through the shopping list data, which is
+        saved once. If the data cannot be accessed directly, the
+        complete_item service is called concurrently, once per name. Items
+        of to-do lists are completed with todo.update_item.
 
         Args:
             matches: Dictionary of matched items from match_items()
-            delivery_date: Delivery date to include in the note
+            delivery_date: Delivery date to include in the log
+
+        Returns:
+            IDs of the shopping list items that were completed
         """
         if not matches:
             _LOGGER.debug("No matches to mark as delivered")
-            return
+            return []
 
         if not await self.is_shopping_list_available():
             _LOGGER.warning("Shopping list not available, cannot mark items")
-            return
+            return []
 
         try:
-            # Get the shopping list component
-            shopping_list = self._hass.data.get(SHOPPING_LIST_DOMAIN)
-            if shopping_list is None:
-                _LOGGER.error("Shopping list data not found")
-                return
-
-            # Format delivery date for note
-            date_str = "upcoming delivery"
-            if delivery_date:
-                date_str = delivery_date.strftime("%Y-%m-%d")
-
-            # Mark each matched item
+            # Collect each shopping list item once, even if matched repeatedly
+            targets: dict[str, tuple[dict, str]] = {}
             for basket_name, match_data in matches.items():
                 shop_item = match_data["shopping_list_item"]
                 item_id = shop_item.get("id")
-
                 if not item_id:
                     _LOGGER.warning("Shopping list item has no ID, skipping")
                     continue
+                targets.setdefault(item_id, (shop_item, basket_name))
 
-                # Update the item: mark as complete and add note
-                try:
-                    # Call the shopping list service to update the item
-                    await self._hass.services.async_call(
-                        SHOPPING_LIST_DOMAIN,
-                        "complete_item",
-                        {"name": shop_item.get("name")},
-                        blocking=True,
-                    )
-
-                    # Add a note about the delivery
-                    # Note: The shopping list component may not support notes directly
-                    # We'll just complete the item for now
-                    _LOGGER.info(
-                        "Marked shopping list item '%s' as complete (matched with '%s' from delivery on %s)",
-                        shop_item.get("name"),
-                        basket_name,
-                        date_str,
-                    )
-
-                except Exception as item_err:
-                    _LOGGER.error(
-                        "Error updating shopping list item '%s': %s",
-                        shop_item.get("name"),
-                        item_err,
-                    )
+            shopping_list = self._hass.data.get(SHOPPING_LIST_DOMAIN)
+            if self._todo_source is not None:
+                completed = await self._todo_source.async_complete(targets)
+            elif shopping_list is None:
+                _LOGGER.error("Shopping list data not found")
+                return []
+            elif isinstance(shopping_list, ShoppingData) and _can_save(shopping_list):
+                completed = await self._async_complete_items(shopping_list, targets)
+            else:
+                completed = await self._async_call_complete_item(targets)
 
         except Exception as err:
             _LOGGER.error("Error marking items as delivered: %s", err)
+            return []
+
+        date_str = "upcoming delivery"
+        if delivery_date:
+            date_str = delivery_date.strftime("%Y-%m-%d")
+        for item_id in completed:
+            shop_item, basket_name = targets[item_id]
+            _LOGGER.info(
+                "Marked shopping list item '%s' as complete (matched with '%s' from delivery on %s)",
+                shop_item.get("name"),
+                basket_name,
+                date_str,
+            )
+        return completed
+
+    async def _async_complete_items(
+        self, shopping_data: ShoppingData, targets: dict[str, tuple[dict, str]]
+    ) -> list[str]:
+        """Complete items by id through the shopping list data.
+
+        The items are marked complete in place and the list is saved once,
+        then listeners are notified and an event fires per completed item,
+        as ShoppingData does when completing items by name.
+
+        Args:
+            shopping_data: The shopping list data
+            targets: Shopping list items to complete, keyed by id
+
+        Returns:
+            IDs of the completed items, including items completed already
+        """
+        completed_ids: list[str] = []
+        changed: list[dict] = []
+        for item in shopping_data.items:
+            item_id = item.get("id")
+            if item_id not in targets:
+                continue
+            if not item.get("complete"):
+                item["complete"] = True
+                changed.append(item)
+            completed_ids.append(item_id)
+
+        if changed:
+            await self._hass.async_add_executor_job(shopping_data.save)
+            shopping_data._async_notify()
+            for item in changed:
+                self._hass.bus.async_fire(
+                    EVENT_SHOPPING_LIST_UPDATED, {"action": "complete", "item": item}
+                )
+        _LOGGER.debug("Completed %d shopping list items by id", len(changed))
+        return completed_ids
+
+    async def _async_call_complete_item(
+        self, targets: dict[str, tuple[dict, str]]
+    ) -> list[str]:
+        """Complete items through the complete_item service.
+
+        The service completes all items with a name, so it is called once per
+        name, and the calls run concurrently.
+
+        Args:
+            targets: Shopping list items to complete, keyed by id
+
+        Returns:
+            IDs of the items whose service call succeeded
+        """
+        ids_by_name: dict[str, list[str]] = defaultdict(list)
+        for item_id, (shop_item, _) in targets.items():
+            ids_by_name[shop_item.get("name")].append(item_id)
+
+        results = await asyncio.gather(
+            *(
+                self._hass.services.async_call(
+                    SHOPPING_LIST_DOMAIN,
+                    "complete_item",
+                    {"name": name},
+                    blocking=True,
+                )
+                for name in ids_by_name
+            ),
+            return_exceptions=True,
+        )
+
+        completed: list[str] = []
+        for (name, item_ids), result in zip(ids_by_name.items(), results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Error updating shopping list item '%s': %s", name, result
+                )
+                continue
+            completed.extend(item_ids)
+        return completed
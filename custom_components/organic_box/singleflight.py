@@ -0,0 +1,55 @@
+"""Request coalescing for the Organic Box integration."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import logging
+from typing import Any, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers of the same key.
+
+    The first caller of a key starts the call; callers arriving while it is
+    still running wait for the same result instead of issuing their own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Drop a finished call and retrieve its exception."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Waiters may all have been cancelled; avoid unretrieved exceptions
+            task.exception()
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a call, or join the call already running for the key.
+
+        Args:
+            key: Identifies calls that return the same data
+            call: Callable returning the coroutine to run
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+            _LOGGER.debug("Joining in-flight request %s", key)
+
+        # Shield the shared call so a cancelled caller does not cancel the others
+        return await asyncio.shield(task)
@@ -8,10 +8,10 @@ from homeassistant.const import CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import OrganicBoxDataUpdateCoordinator
+from .entity import OrganicBoxEntity
 from .models import DeliveryInfo
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,9 +35,7 @@ async def async_setup_entry(
         )
 
 
-class OrganicBoxDeliveryPauseSwitch(
-    CoordinatorEntity[OrganicBoxDataUpdateCoordinator], SwitchEntity
-):
+class OrganicBoxDeliveryPauseSwitch(OrganicBoxEntity, SwitchEntity):
     """Switch to pause/unpause the next delivery."""
 
     _attr_has_entity_name = True
@@ -90,28 +88,25 @@ class OrganicBoxDeliveryPauseSwitch(
     async def async_turn_on(self, **kwargs) -> None:
         """Pause the next delivery."""
         _LOGGER.debug("Pausing next delivery")
-        success = await self.coordinator.provider.pause_next_delivery()
+        record = await self.coordinator.provider.pause_next_delivery()
 
-        if success:
-            # Request a data refresh to update the state
-            await self.coordinator.async_request_refresh()
+        if record is not None:
+            self.coordinator.async_apply_pause_record(record)
         else:
             _LOGGER.error("Failed to pause delivery")
 
     async def async_turn_off(self, **kwargs) -> None:
         """Unpause (resume) the next delivery."""
         _LOGGER.debug("Unpausing next delivery")
-        success = await self.coordinator.provider.unpause_next_delivery()
+        record = await self.coordinator.provider.unpause_next_delivery()
 
-        if success:
-            # Request a data refresh to update the state
-            await self.coordinator.async_request_refresh()
+        if record is not None:
+            self.coordinator.async_apply_pause_record(record)
         else:
             _LOGGER.error("Failed to unpause delivery")
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
+    def _build_extra_state_attributes(self) -> dict:
+        """Build the state attributes."""
         if not self.delivery_info:
             return {}
 
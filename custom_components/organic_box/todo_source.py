@@ -0,0 +1,180 @@
+"""To-do list entities as a source of shopping list items."""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+import logging
+from typing import Any
+
+from homeassistant.components.todo import (
+    DOMAIN as TODO_DOMAIN,
+    TodoItemStatus,
+    TodoServices,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_state_report_event,
+)
+
+from .const import TODO_UPDATE_BATCH_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TodoListSource:
+    """Open items of one or more to-do list entities.
+
+    Items are read with the todo.get_items service and completed with
+    todo.update_item, so any to-do platform can be matched against. The
+    lists are read concurrently and merged into one list of items shaped
+    like legacy shopping list items, whose id combines the entity and the
+    item uid so they stay unique across lists.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_ids: Iterable[str]) -> None:
+        """Initialize the source.
+
+        Args:
+            hass: Home Assistant instance
+            entity_ids: The to-do list entities to read
+        """
+        self._hass = hass
+        self.entity_ids = tuple(entity_ids)
+
+    def is_available(self) -> bool:
+        """Return whether the to-do integration is set up."""
+        return self._hass.services.has_service(TODO_DOMAIN, TodoServices.GET_ITEMS)
+
+    @callback
+    def async_subscribe(self, on_change: Callable[[Event], None]) -> CALLBACK_TYPE:
+        """Follow updates of the to-do lists.
+
+        A to-do entity writes its state after every item change. Renames keep
+        the number of open items, so unchanged writes are followed as well.
+
+        Args:
+            on_change: Called after every write of a list's state
+
+        Returns:
+            Callback that ends the subscription
+        """
+        unsubs = [
+            async_track_state_change_event(self._hass, self.entity_ids, on_change),
+            async_track_state_report_event(self._hass, self.entity_ids, on_change),
+        ]
+
+        @callback
+        def _async_unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _async_unsubscribe
+
+    async def async_get_items(self) -> list[dict]:
+        """Return the open items of all lists.
+
+        Returns:
+            Items of the lists that could be read, in list order
+        """
+        results = await asyncio.gather(
+            *(self._async_get_list_items(entity_id) for entity_id in self.entity_ids),
+            return_exceptions=True,
+        )
+        items: list[dict] = []
+        for entity_id, result in zip(self.entity_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.error("Error reading to-do list %s: %s", entity_id, result)
+                continue
+            items.extend(result)
+        _LOGGER.debug(
+            "Found %d open items in %d to-do lists", len(items), len(self.entity_ids)
+        )
+        return items
+
+    async def _async_get_list_items(self, entity_id: str) -> list[dict]:
+        """Return the open items of one list."""
+        response = await self._hass.services.async_call(
+            TODO_DOMAIN,
+            TodoServices.GET_ITEMS,
+            {"status": [TodoItemStatus.NEEDS_ACTION]},
+            target={ATTR_ENTITY_ID: entity_id},
+            blocking=True,
+            return_response=True,
+        )
+        todo_items: list[dict[str, Any]] = (
+            (response or {}).get(entity_id, {}).get("items", [])
+        )
+        items = []
+        for todo_item in todo_items:
+            # update_item accepts the uid, or the summary if there is none
+            key = todo_item.get("uid") or todo_item.get("summary")
+            if not key:
+                continue
+            items.append(
+                {
+                    "id": f"{entity_id}/{key}",
+                    "name": todo_item.get("summary", ""),
+                    "complete": False,
+                    ATTR_ENTITY_ID: entity_id,
+                    "item": key,
+                }
+            )
+        return items
+
+    async def async_complete(self, targets: dict[str, tuple[dict, str]]) -> list[str]:
+        """Complete items with the todo.update_item service.
+
+        Lists are updated concurrently; within a list, up to
+        TODO_UPDATE_BATCH_SIZE items are updated at once.
+
+        Args:
+            targets: Items from async_get_items to complete, keyed by id
+
+        Returns:
+            IDs of the items whose update succeeded
+        """
+        by_list: dict[str, list[dict]] = defaultdict(list)
+        for shop_item, _ in targets.values():
+            by_list[shop_item[ATTR_ENTITY_ID]].append(shop_item)
+
+        results = await asyncio.gather(
+            *(
+                self._async_complete_list_items(entity_id, items)
+                for entity_id, items in by_list.items()
+            )
+        )
+        return [item_id for completed in results for item_id in completed]
+
+    async def _async_complete_list_items(
+        self, entity_id: str, items: list[dict]
+    ) -> list[str]:
+        """Complete items of one list in batches."""
+        completed: list[str] = []
+        for start in range(0, len(items), TODO_UPDATE_BATCH_SIZE):
+            batch = items[start : start + TODO_UPDATE_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(
+                    self._hass.services.async_call(
+                        TODO_DOMAIN,
+                        TodoServices.UPDATE_ITEM,
+                        {"item": item["item"], "status": TodoItemStatus.COMPLETED},
+                        target={ATTR_ENTITY_ID: entity_id},
+                        blocking=True,
+                    )
+                    for item in batch
+                ),
+                return_exceptions=True,
+            )
+            for item, result in zip(batch, results, strict=True):
+                if isinstance(result, BaseException):
+                    _LOGGER.error(
+                        "Error completing '%s' on %s: %s",
+                        item.get("name"),
+                        entity_id,
+                        result,
+                    )
+                    continue
+                completed.append(item["id"])
+        return completed
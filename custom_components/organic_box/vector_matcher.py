@@ -0,0 +1,173 @@
+"""NumPy similarity matrix engine for the shopping list matcher."""
+
+from collections import Counter
+import logging
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with Home Assistant
+    np = None
+
+if TYPE_CHECKING:
+    from .shopping_list_matcher import PreparedText
+
+_LOGGER = logging.getLogger(__name__)
+
+HAS_NUMPY = np is not None
+
+
+def _trigram_counts(normalized: str) -> Counter[str]:
+    """Return the trigram frequencies of a normalized text."""
+    padded = f" {normalized} "
+    return Counter(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _encode(counts: list[Counter[str]], vocabulary: dict[str, int], grow: bool) -> Any:
+    """Encode trigram counts as L2-normalized term frequency rows.
+
+    Args:
+        counts: Trigram frequencies per text
+        vocabulary: Column of each trigram
+        grow: Add unknown trigrams to the vocabulary instead of dropping them
+
+    Returns:
+        Matrix with one unit row per text (zero rows for empty texts)
+    """
+    rows: list[int] = []
+    cols: list[int] = []
+    values: list[float] = []
+    norms = np.zeros(len(counts))
+    for row, text_counts in enumerate(counts):
+        # The norm covers all trigrams, including those missing from the list
+        norms[row] = sum(count * count for count in text_counts.values()) ** 0.5
+        for trigram, count in text_counts.items():
+            col = vocabulary.get(trigram)
+            if col is None:
+                if not grow:
+                    continue
+                col = vocabulary[trigram] = len(vocabulary)
+            rows.append(row)
+            cols.append(col)
+            values.append(count)
+
+    matrix = np.zeros((len(counts), len(vocabulary)))
+    np.add.at(matrix, (rows, cols), values)
+    norms[norms == 0] = 1.0
+    return matrix / norms[:, None]
+
+
+def _word_matrix(
+    tokens: list[frozenset[str]], vocabulary: dict[str, int], grow: bool
+) -> Any:
+    """Encode word sets as binary rows."""
+    for words in tokens if grow else ():
+        for word in words:
+            vocabulary.setdefault(word, len(vocabulary))
+    matrix = np.zeros((len(tokens), len(vocabulary)))
+    for row, words in enumerate(tokens):
+        cols = [vocabulary[word] for word in words if word in vocabulary]
+        matrix[row, cols] = 1.0
+    return matrix
+
+
+def similarity_matrix(
+    basket: list["PreparedText"], shop: list["PreparedText"], threshold: float
+) -> Any:
+    """Score every basket name against every shopping list name at once.
+
+    The character-level SequenceMatcher ratio is replaced by the cosine
+    similarity of trigram frequency vectors, computed for all pairs with one
+    matrix product. Word overlap and the substring bonus are blended in with
+    the same 70/30 weighting as ShoppingListMatcher.get_similarity. The
+    substring bonus is only checked for pairs it could lift to the threshold.
+
+    Args:
+        basket: Prepared basket item names
+        shop: Prepared shopping list names
+        threshold: Minimum score of a match
+
+    Returns:
+        Matrix of scores with one row per basket name and one column per
+        shopping list name
+    """
+    trigrams: dict[str, int] = {}
+    shop_vectors = _encode(
+        [_trigram_counts(text.normalized) for text in shop], trigrams, grow=True
+    )
+    basket_vectors = _encode(
+        [_trigram_counts(text.normalized) for text in basket], trigrams, grow=False
+    )
+    # Round away float noise so identical names score exactly 1.0
+    ratio = np.minimum(np.round(basket_vectors @ shop_vectors.T, 9), 1.0)
+
+    words: dict[str, int] = {}
+    shop_words = _word_matrix([text.tokens for text in shop], words, grow=True)
+    basket_words = _word_matrix([text.tokens for text in basket], words, grow=False)
+    shop_sizes = np.array([len(text.tokens) for text in shop], dtype=float)
+    basket_sizes = np.array([len(text.tokens) for text in basket], dtype=float)
+    overlap = basket_words @ shop_words.T
+    has_words = np.outer(basket_sizes > 0, shop_sizes > 0)
+    word_similarity = np.divide(
+        overlap,
+        np.maximum.outer(basket_sizes, shop_sizes),
+        out=np.zeros_like(overlap),
+        where=has_words,
+    )
+
+    # Apply the substring bonus where it could matter
+    bonus_score = np.where(has_words, 0.7 * 0.85 + 0.3 * word_similarity, 0.85)
+    for row, col in np.argwhere((ratio < 0.85) & (bonus_score >= threshold)):
+        norm1 = basket[row].normalized
+        norm2 = shop[col].normalized
+        if norm1 in norm2 or norm2 in norm1:
+            ratio[row, col] = 0.85
+
+    return np.where(has_words, 0.7 * ratio + 0.3 * word_similarity, ratio)
+
+
+def best_matches(
+    basket: list["PreparedText"], shop: list["PreparedText"], threshold: float
+) -> list[tuple[int, float] | None]:
+    """Return the best shopping list entry per basket name.
+
+    Args:
+        basket: Prepared basket item names
+        shop: Prepared shopping list names
+        threshold: Minimum score of a match
+
+    Returns:
+        Per basket name, the column and score of its best match, or None.
+        Ties go to the earliest list entry.
+    """
+    if not basket or not shop:
+        return [None] * len(basket)
+    scores = similarity_matrix(basket, shop, threshold)
+    columns = scores.argmax(axis=1)
+    results: list[tuple[int, float] | None] = []
+    for row, col in enumerate(columns):
+        score = float(scores[row, col])
+        results.append((int(col), score) if score >= threshold else None)
+    return results
+
+
+def scored_pairs(
+    basket: list["PreparedText"], shop: list["PreparedText"], threshold: float
+) -> dict[tuple[int, int], float]:
+    """Return every pair scoring at or above the threshold.
+
+    Args:
+        basket: Prepared basket item names
+        shop: Prepared shopping list names
+        threshold: Minimum score of a match
+
+    Returns:
+        Scores keyed by (basket row, shopping list column)
+    """
+    if not basket or not shop:
+        return {}
+    scores = similarity_matrix(basket, shop, threshold)
+    return {
+        (int(row), int(col)): float(scores[row, col])
+        for row, col in np.argwhere(scores >= threshold)
+    }
@@ -68,8 +68,8 @@ def mock_coordinator_fixture():
     mock_coordinator.provider = MagicMock()
     mock_coordinator.provider.name = "Test Provider"
     mock_coordinator.provider.supports_pause = MagicMock(return_value=False)
-    mock_coordinator.provider.pause_next_delivery = AsyncMock(return_value=False)
-    mock_coordinator.provider.unpause_next_delivery = AsyncMock(return_value=False)
+    mock_coordinator.provider.pause_next_delivery = AsyncMock(return_value=None)
+    mock_coordinator.provider.unpause_next_delivery = AsyncMock(return_value=None)
     mock_coordinator.async_request_refresh = AsyncMock()
     mock_coordinator.async_set_updated_data = MagicMock()
     return mock_coordinator
@@ -0,0 +1,156 @@
+"""Tests for the learned alias table."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.organic_box.aliases import AliasTable, alias_store_key
+from custom_components.organic_box.const import ALIAS_CONFIRMATIONS
+from custom_components.organic_box.models import BasketItem
+from custom_components.organic_box.shopping_list_matcher import ShoppingListMatcher
+
+
+@pytest.mark.unit
+def test_alias_key_prefers_product_id():
+    """Test that items are keyed by product id, or by name."""
+    with_id = BasketItem(name="Bio Möhren", quantity=1.0, product_id="123")
+    without_id = BasketItem(name="Bio Möhren 500g", quantity=1.0)
+
+    assert AliasTable.key(with_id) == "product:123"
+    assert AliasTable.key(without_id) == "name:Bio Möhren 500g"
+
+
+@pytest.mark.integration
+async def test_learn_and_forget(hass: HomeAssistant) -> None:
+    """Test that learning and forgetting bump the version only on changes."""
+    aliases = AliasTable(hass, "entry")
+    item = BasketItem(name="Möhren Bund", quantity=1.0, product_id="123")
+
+    assert aliases.learn(item, "Organic Carrots")
+    version = aliases.version
+    assert aliases.get(item) == "carrots"
+    # The same product under another name shares the alias
+    assert aliases.get(BasketItem(name="Möhren", quantity=2.0, product_id="123"))
+
+    assert not aliases.learn(item, "carrots")
+    assert not aliases.learn(item, "Bio")
+    assert aliases.version == version
+
+    assert aliases.forget(item)
+    assert not aliases.forget(item)
+    assert aliases.get(item) is None
+    assert aliases.version == version + 1
+
+
+@pytest.mark.integration
+async def test_confirmed_matches_are_learned_after_recurring(
+    hass: HomeAssistant,
+) -> None:
+    """Test that only a match confirmed for several orders becomes an alias."""
+    aliases = AliasTable(hass, "entry")
+    item = BasketItem(name="Kartoffeln festkochend 2kg", quantity=1.0, product_id="1")
+
+    assert not aliases.confirm(item, "Kartoffeln")
+    # Confirming another entry starts counting again
+    assert not aliases.confirm(item, "Süßkartoffeln")
+    for _ in range(ALIAS_CONFIRMATIONS - 1):
+        assert not aliases.confirm(item, "Kartoffeln")
+        assert aliases.get(item) is None
+
+    assert aliases.confirm(item, "Kartoffeln")
+    assert aliases.get(item) == "potatoes"
+    assert aliases.version == 1
+
+
+@pytest.mark.integration
+async def test_resolve_and_forget_by_name(hass: HomeAssistant) -> None:
+    """Test that a name finds the product an alias was learned for."""
+    aliases = AliasTable(hass, "entry")
+    chard = BasketItem(name="Mangold Bund", quantity=1.0, product_id="123")
+    aliases.learn(chard, "Swiss Chard")
+
+    assert aliases.resolve("Mangold Bund").product_id == "123"
+    assert aliases.resolve("Spinat").product_id is None
+
+    assert aliases.forget(BasketItem(name="Mangold Bund", quantity=0))
+    assert aliases.get(chard) is None
+    assert len(aliases) == 0
+
+
+@pytest.mark.integration
+async def test_aliases_are_persisted(hass: HomeAssistant, hass_storage: dict) -> None:
+    """Test that the aliases survive a restart."""
+    hass_storage[alias_store_key("entry")] = {
+        "version": 1,
+        "key": alias_store_key("entry"),
+        "data": {"aliases": {"product:123": "carrots"}},
+    }
+
+    aliases = AliasTable(hass, "entry")
+    await aliases.async_load()
+
+    assert len(aliases) == 1
+    assert aliases.get(BasketItem(name="Möhren", quantity=1.0, product_id="123")) == (
+        "carrots"
+    )
+
+
+@pytest.mark.integration
+async def test_aliases_are_normalized_on_lookup(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    """Test that names are stored as given and normalized when looked up."""
+    hass_storage[alias_store_key("entry")] = {
+        "version": 1,
+        "key": alias_store_key("entry"),
+        "data": {"aliases": {"name:Bio Möhren 500g": "Organic Carrots"}},
+    }
+
+    aliases = AliasTable(hass, "entry")
+    await aliases.async_load()
+
+    # Another name of the same produce finds the alias by its normalized form
+    assert aliases.get(BasketItem(name="Karotten 1kg", quantity=1.0)) == "carrots"
+
+    aliases.learn(BasketItem(name="Lauch", quantity=1.0), "Porree Stangen")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+
+    assert hass_storage[alias_store_key("entry")]["data"]["aliases"] == {
+        "name:Bio Möhren 500g": "Organic Carrots",
+        "name:Lauch": "Porree Stangen",
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("one_to_one", [False, True])
+async def test_matcher_uses_aliases(hass: HomeAssistant, one_to_one: bool) -> None:
+    """Test that aliased items match directly and invalidate memoized matches."""
+    hass.data["shopping_list"] = {
+        "items": [
+            {"id": "1", "name": "Swiss Chard", "complete": False},
+            {"id": "2", "name": "Möhrensaft", "complete": False},
+        ]
+    }
+    hass.services.async_register("shopping_list", "complete_item", AsyncMock())
+    aliases = AliasTable(hass, "entry")
+    matcher = ShoppingListMatcher(
+        hass, threshold=0.6, one_to_one=one_to_one, aliases=aliases
+    )
+    matcher.async_subscribe(lambda: None)
+    chard = BasketItem(name="Mangold Bund", quantity=1.0, product_id="123")
+    juice = BasketItem(name="Bio Möhrensaft", quantity=1.0, product_id="456")
+
+    matches = await matcher.match_items([chard, juice])
+    assert "Mangold Bund" not in matches
+    assert matches["Bio Möhrensaft"]["shopping_list_item"]["id"] == "2"
+
+    aliases.learn(chard, "Swiss Chard")
+    matches = await matcher.match_items([chard, juice])
+    assert matches["Mangold Bund"]["shopping_list_item"]["id"] == "1"
+    assert matches["Mangold Bund"]["similarity"] == 1.0
+    assert matches["Bio Möhrensaft"]["shopping_list_item"]["id"] == "2"
@@ -0,0 +1,69 @@
+"""Tests for the one-to-one assignment."""
+
+from itertools import permutations
+import random
+
+import pytest
+
+from custom_components.organic_box.assignment import max_weight_assignment
+
+
+def _brute_force_total(edges, rows, cols):
+    """Return the best total weight by trying every assignment."""
+    best = 0.0
+    padded = [*cols, *([None] * len(rows))]
+    for choice in set(permutations(padded, len(rows))):
+        best = max(
+            best,
+            sum(edges.get((row, col), 0.0) for row, col in zip(rows, choice)),
+        )
+    return best
+
+
+@pytest.mark.unit
+def test_uncontested_rows_keep_their_best_column():
+    """Test rows with different best columns are assigned greedily."""
+    edges = {(0, 0): 0.9, (0, 1): 0.8, (1, 1): 0.95, (2, 3): 0.85}
+    assert max_weight_assignment(edges) == {0: 0, 1: 1, 2: 3}
+
+
+@pytest.mark.unit
+def test_contested_column_is_used_once():
+    """Test two rows wanting the same column are resolved by total weight."""
+    edges = {(0, 0): 0.9, (1, 0): 0.95, (1, 1): 0.85}
+    assert max_weight_assignment(edges) == {0: 0, 1: 1}
+
+
+@pytest.mark.unit
+def test_more_rows_than_columns():
+    """Test rows left without a column are not assigned."""
+    edges = {(0, 0): 0.9, (1, 0): 0.95, (2, 0): 0.8}
+    assert max_weight_assignment(edges) == {1: 0}
+
+
+@pytest.mark.unit
+def test_empty_graph():
+    """Test no edges give no assignment."""
+    assert max_weight_assignment({}) == {}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("seed", range(20))
+def test_assignment_is_optimal(seed):
+    """Test the assignment reaches the brute force optimum."""
+    rng = random.Random(seed)
+    rows = list(range(rng.randint(1, 5)))
+    cols = list(range(rng.randint(1, 5)))
+    edges = {
+        (row, col): round(rng.uniform(0.5, 1.0), 2)
+        for row in rows
+        for col in cols
+        if rng.random() < 0.6
+    }
+
+    assignment = max_weight_assignment(edges)
+
+    assert len(set(assignment.values())) == len(assignment)
+    assert all((row, col) in edges for row, col in assignment.items())
+    total = sum(edges[row, col] for row, col in assignment.items())
+    assert total == pytest.approx(_brute_force_total(edges, rows, cols))
@@ -1,16 +1,18 @@
 """Test the button platform."""
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
-from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from pyoekoboxonline.models import ShopDate
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.organic_box.models import PauseRecord
+
 
 @pytest.mark.integration
 async def test_button_setup_with_pause_support(
@@ -51,7 +53,7 @@ async def test_button_pause_delivery(
 ) -> None:
     """Test pausing delivery via button press."""
     shop_date = ShopDate(
-        delivery_date=datetime(2025, 11, 15).date(),
+        delivery_date=date.today() + timedelta(days=7),
         order_id=123,
         order_state=0,
     )
@@ -66,15 +68,20 @@ async def test_button_pause_delivery(
     entries = er.async_entries_for_config_entry(
         entity_registry, mock_config_entry.entry_id
     )
-    button_entries = [e for e in entries if e.domain == "button" and "pause" in e.unique_id]
+    button_entries = [
+        e for e in entries if e.domain == "button" and "pause" in e.unique_id
+    ]
 
     assert len(button_entries) == 1
     entity_id = button_entries[0].entity_id
 
+    dates_calls = mock_oekobox_client.get_dates.call_count
+    record = PauseRecord(delivery_date=shop_date.delivery_date, is_paused=True)
+
     with patch(
         "custom_components.organic_box.oekobox.OekoBoxProvider.pause_next_delivery",
         new_callable=AsyncMock,
-        return_value=True,
+        return_value=record,
     ):
         await hass.services.async_call(
             BUTTON_DOMAIN,
@@ -83,3 +90,9 @@ async def test_button_pause_delivery(
             blocking=True,
         )
         await hass.async_block_till_done()
+
+    # The pause is applied locally; the confirmation refresh is still pending
+    coordinator = hass.data["organic_box"][mock_config_entry.entry_id]
+    assert coordinator.data.is_paused is True
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+    assert mock_oekobox_client.get_dates.call_count == dates_calls
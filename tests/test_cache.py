@@ -0,0 +1,59 @@
+"""Tests for the in-memory caches."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.organic_box.cache import TTLCache
+
+
+@pytest.mark.unit
+def test_ttl_cache_get_and_set():
+    """Test storing and retrieving values."""
+    cache: TTLCache[str, int] = TTLCache(4, timedelta(minutes=5))
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+@pytest.mark.unit
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted when full."""
+    cache: TTLCache[str, int] = TTLCache(2, timedelta(minutes=5))
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch "a" so "b" becomes the least recently used entry
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@pytest.mark.unit
+def test_ttl_cache_expires_entries():
+    """Test that entries are not returned after the TTL."""
+    cache: TTLCache[str, int] = TTLCache(2, timedelta(seconds=10))
+
+    with patch(
+        "custom_components.organic_box.cache.time.monotonic", return_value=100.0
+    ):
+        cache.set("a", 1)
+    with patch(
+        "custom_components.organic_box.cache.time.monotonic", return_value=109.0
+    ):
+        assert cache.get("a") == 1
+    with patch(
+        "custom_components.organic_box.cache.time.monotonic", return_value=110.0
+    ):
+        assert cache.get("a") is None
+
+    assert len(cache) == 0
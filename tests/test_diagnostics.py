@@ -0,0 +1,31 @@
+"""Test the organic_box diagnostics."""
+
+import pytest
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.organic_box.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+@pytest.mark.integration
+async def test_config_entry_diagnostics(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_online,
+) -> None:
+    """Test diagnostics redact credentials and expose the circuit breaker."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["entry"]["data"]["password"] == REDACTED
+    assert diagnostics["entry"]["data"]["username"] == REDACTED
+    assert diagnostics["coordinator"]["last_update_success"] is True
+    assert diagnostics["provider"]["circuit_breaker"]["state"] == "closed"
+    assert diagnostics["provider"]["session"]["logon_count"] == 1
+    assert diagnostics["shopping_list_matcher"] is None
@@ -0,0 +1,119 @@
+"""Test state write suppression of Organic Box entities."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pyoekoboxonline.models import ShopDate
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.organic_box.const import DOMAIN
+
+
+def _item(name: str) -> MagicMock:
+    item = MagicMock()
+    item.item_id = name
+    item.name = name
+    item.unit = "kg"
+    item.amount_def = 1.0
+    return item
+
+
+@pytest.mark.integration
+async def test_unchanged_refresh_writes_no_state(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that entities only write state when their own state changed."""
+    shop_date = ShopDate(
+        delivery_date=date.today() + timedelta(days=7),
+        order_id=123,
+        order_state=0,
+        last_order_change=datetime.now() + timedelta(days=5),
+        count=1,
+    )
+    mock_oekobox_client.get_dates.return_value = [shop_date]
+    mock_oekobox_client.get_order_items.return_value = [_item("Potatoes")]
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    basket = "sensor.organic_box_test_example_com_basket_items"
+    deadline = "sensor.organic_box_test_example_com_last_order_change_time"
+    basket_state = hass.states.get(basket)
+    deadline_state = hass.states.get(deadline)
+    fingerprint = coordinator.data_fingerprint
+
+    # Same payload: nothing is written
+    coordinator.provider.invalidate_cache()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.data_fingerprint == fingerprint
+    assert hass.states.get(basket) is basket_state
+    assert hass.states.get(deadline) is deadline_state
+
+    # A new item only changes the basket related entities
+    mock_oekobox_client.get_order_items.return_value = [
+        _item("Potatoes"),
+        _item("Carrots"),
+    ]
+    coordinator.provider.invalidate_cache()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.data_fingerprint != fingerprint
+    assert hass.states.get(basket).state == "2"
+    assert hass.states.get(deadline) is deadline_state
+
+
+@pytest.mark.integration
+async def test_attributes_cached_per_data_version(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that attributes are only rebuilt after a coordinator update."""
+    shop_date = ShopDate(
+        delivery_date=date.today() + timedelta(days=7),
+        order_id=123,
+        order_state=0,
+        last_order_change=datetime.now() + timedelta(days=5),
+        count=1,
+    )
+    mock_oekobox_client.get_dates.return_value = [shop_date]
+    mock_oekobox_client.get_order_items.return_value = [_item("Potatoes")]
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    basket = "sensor.organic_box_test_example_com_basket_items"
+    entity = hass.data["entity_components"]["sensor"].get_entity(basket)
+    attributes = entity.extra_state_attributes
+    assert entity.extra_state_attributes is attributes
+
+    # Matches alone change nothing until listeners are updated
+    coordinator.matched_items = {
+        "Potatoes": {
+            "shopping_list_item": {"id": "1", "name": "Kartoffeln"},
+            "similarity": 1.0,
+        }
+    }
+    assert entity.extra_state_attributes is attributes
+
+    version = coordinator.data_version
+    assert coordinator._async_notify_extras_changed()
+    await hass.async_block_till_done()
+
+    assert coordinator.data_version == version + 1
+    item = entity.extra_state_attributes["basket_items"][0]
+    assert item["matched_shopping_item"] == "Kartoffeln"
+    assert hass.states.get(basket).attributes["basket_items"][0] == item
@@ -1,11 +1,27 @@
 """Test the organic_box __init__.py setup/unload."""
 
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
 import pytest
 from homeassistant import config_entries
+from homeassistant.components.shopping_list.const import EVENT_SHOPPING_LIST_UPDATED
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.organic_box.const import DOMAIN
+from custom_components.organic_box.const import (
+    CONF_ENABLE_SHOPPING_LIST_MATCH,
+    CONF_PROVIDER,
+    CONF_SHOP_ID,
+    DOMAIN,
+    PROVIDER_OEKOBOX,
+)
+from custom_components.organic_box.models import BasketItem, DeliveryInfo
 
 
 @pytest.mark.integration
@@ -89,3 +105,259 @@ async def test_reload_entry(
     assert mock_config_entry.state == config_entries.ConfigEntryState.LOADED
     # Close should be called at least once during unload
     assert mock_oekobox_client.close.call_count >= 1
+
+
+@pytest.mark.integration
+async def test_setup_entry_restores_stored_data(
+    hass: HomeAssistant,
+    hass_storage: dict,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that stored data is served when the provider is unreachable."""
+    key = f"{DOMAIN}.{mock_config_entry.entry_id}"
+    hass_storage[key] = {
+        "version": 1,
+        "key": key,
+        "data": {
+            "delivery_info": DeliveryInfo(
+                delivery_date=datetime(2025, 11, 15),
+                items=[BasketItem(name="Apples", quantity=1.0)],
+            ).as_dict(),
+            "matched_items": {},
+        },
+    }
+    mock_config_entry.add_to_hass(hass)
+    mock_oekobox_client.logon.side_effect = Exception("Auth failed")
+
+    result = await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert result is True
+    assert mock_config_entry.state == config_entries.ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.data.delivery_date == datetime(2025, 11, 15)
+    assert coordinator.data.items[0].name == "Apples"
+    # The background revalidation was attempted
+    mock_oekobox_client.logon.assert_called()
+
+
+@pytest.mark.integration
+async def test_remove_entry_removes_stored_data(
+    hass: HomeAssistant,
+    hass_storage: dict,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_online,
+) -> None:
+    """Test that removing the entry deletes its stored data."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+
+    key = f"{DOMAIN}.{mock_config_entry.entry_id}"
+    assert key in hass_storage
+
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert key not in hass_storage
+
+
+@pytest.mark.integration
+async def test_open_circuit_serves_last_data(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that the coordinator keeps its data while the circuit is open."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    data = coordinator.data
+    for _ in range(3):
+        coordinator.provider._breaker.record_failure(TimeoutError())
+    coordinator.provider.invalidate_cache()
+    calls_before = mock_oekobox_client.get_dates.call_count
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert coordinator.data is data
+    assert mock_oekobox_client.get_dates.call_count == calls_before
+    assert coordinator.provider.circuit_state == "open"
+
+
+@pytest.mark.integration
+async def test_entries_of_one_account_share_connection(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that entries of the same account share one client session."""
+    second_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Second Organic Box",
+        data=dict(mock_config_entry.data),
+        unique_id="second",
+    )
+    for entry in (mock_config_entry, second_entry):
+        entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    first = hass.data[DOMAIN][mock_config_entry.entry_id].provider
+    second = hass.data[DOMAIN][second_entry.entry_id].provider
+    assert first.session is second.session
+    assert first.diagnostics()["connection_users"] == 2
+
+    # Unloading one entry keeps the session of the other
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert second.diagnostics()["connection_users"] == 1
+    assert second.session.age is not None
+    assert mock_oekobox_client.close.await_count == 0
+
+
+@pytest.mark.integration
+async def test_shopping_list_update_rematches_without_provider_call(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that shopping list edits update the matches without polling."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Organic Box",
+        data={
+            CONF_USERNAME: "test@example.com",
+            CONF_PASSWORD: "test_password",
+            CONF_PROVIDER: PROVIDER_OEKOBOX,
+            CONF_SHOP_ID: "test_shop_id",
+        },
+        options={CONF_ENABLE_SHOPPING_LIST_MATCH: True},
+        unique_id="test@example.com",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_set_updated_data(
+        DeliveryInfo(
+            delivery_date=datetime(2025, 11, 15),
+            items=[BasketItem(name="Organic Milk", quantity=1.0)],
+        )
+    )
+    hass.services.async_register("shopping_list", "complete_item", lambda call: None)
+    hass.data["shopping_list"] = {
+        "items": [{"id": "1", "name": "Milk", "complete": False}]
+    }
+    calls_before = mock_oekobox_client.get_dates.call_count
+
+    hass.bus.async_fire(EVENT_SHOPPING_LIST_UPDATED, {"action": "add"})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert coordinator.matched_items["Organic Milk"]["shopping_list_item"]["id"] == "1"
+    assert mock_oekobox_client.get_dates.call_count == calls_before
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.integration
+async def test_matched_items_completed_once_per_order(
+    hass: HomeAssistant,
+    mock_oekobox_online,
+) -> None:
+    """Test that polls during preparation do not complete items again."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Organic Box",
+        data={
+            CONF_USERNAME: "test@example.com",
+            CONF_PASSWORD: "test_password",
+            CONF_PROVIDER: PROVIDER_OEKOBOX,
+            CONF_SHOP_ID: "test_shop_id",
+        },
+        options={CONF_ENABLE_SHOPPING_LIST_MATCH: True},
+        unique_id="test@example.com",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    completed = []
+    hass.services.async_register(
+        "shopping_list", "complete_item", lambda call: completed.append(call.data)
+    )
+    hass.data["shopping_list"] = {
+        "items": [{"id": "1", "name": "Milk", "complete": False}]
+    }
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.provider.get_next_delivery = AsyncMock(
+        return_value=DeliveryInfo(
+            delivery_date=datetime(2099, 11, 15),
+            items=[BasketItem(name="Organic Milk", quantity=1.0)],
+            order_state=1,
+            order_id=42,
+        )
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert completed == [{"name": "Milk"}]
+    assert coordinator.completion_ledger.completed("42") == {"1"}
+    # A single confirmed match is not learned as an alias yet
+    assert (
+        coordinator.alias_table.get(BasketItem(name="Organic Milk", quantity=1.0))
+        is None
+    )
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("deadline_in", "logons"), [(timedelta(minutes=30), 2), (timedelta(days=3), 1)]
+)
+async def test_deadline_window_refresh_logs_on_again(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+    deadline_in: timedelta,
+    logons: int,
+) -> None:
+    """Test that refreshes close to the deadline skip the session cache."""
+    from pyoekoboxonline.models import ShopDate
+
+    now = dt_util.now().replace(tzinfo=None)
+    mock_oekobox_client.get_dates.return_value = [
+        ShopDate(
+            delivery_date=(now + timedelta(days=5)).date(),
+            order_id=123,
+            order_state=0,
+            last_order_change=now + deadline_in,
+        )
+    ]
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert mock_oekobox_client.logon.await_count == 1
+
+    await coordinator.async_refresh()
+
+    assert mock_oekobox_client.logon.await_count == logons
+    assert mock_oekobox_client.get_dates.await_count == 2
@@ -0,0 +1,57 @@
+"""Tests for the completion ledger."""
+
+from datetime import date, datetime
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.organic_box.ledger import CompletionLedger, ledger_store_key
+from custom_components.organic_box.models import DeliveryInfo
+
+
+@pytest.mark.unit
+def test_order_key_falls_back_to_delivery_date():
+    """Test that deliveries without an order id are keyed by date."""
+    with_order = DeliveryInfo(
+        delivery_date=datetime(2025, 11, 15), items=[], order_id=42
+    )
+    without_order = DeliveryInfo(delivery_date=datetime(2025, 11, 15), items=[])
+    unknown = DeliveryInfo(delivery_date=None, items=[])
+
+    assert CompletionLedger.order_key(with_order) == "42"
+    assert CompletionLedger.order_key(without_order) == "2025-11-15"
+    assert CompletionLedger.order_key(unknown) is None
+
+
+@pytest.mark.integration
+async def test_ledger_records_and_prunes(hass: HomeAssistant) -> None:
+    """Test that completed items are kept until the delivery has passed."""
+    ledger = CompletionLedger(hass, "entry")
+    ledger.record("42", datetime(2025, 11, 15), ["a", "b"])
+    ledger.record("42", datetime(2025, 11, 15), ["b", "c"])
+    ledger.record("43", datetime(2025, 11, 22), ["d"])
+
+    assert ledger.completed("42") == {"a", "b", "c"}
+    assert ledger.completed("44") == set()
+
+    ledger.prune(date(2025, 11, 15))
+    assert ledger.completed("42") == {"a", "b", "c"}
+
+    ledger.prune(date(2025, 11, 16))
+    assert ledger.completed("42") == set()
+    assert ledger.completed("43") == {"d"}
+
+
+@pytest.mark.integration
+async def test_ledger_is_persisted(hass: HomeAssistant, hass_storage: dict) -> None:
+    """Test that the ledger survives a restart."""
+    hass_storage[ledger_store_key("entry")] = {
+        "version": 1,
+        "key": ledger_store_key("entry"),
+        "data": {"orders": {"42": {"delivery_date": "2025-11-15", "items": ["a"]}}},
+    }
+
+    ledger = CompletionLedger(hass, "entry")
+    await ledger.async_load()
+
+    assert ledger.completed("42") == {"a"}
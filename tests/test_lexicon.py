@@ -0,0 +1,48 @@
+"""Tests for the produce lexicon."""
+
+import pytest
+
+from custom_components.organic_box.lexicon import PRODUCE_LEXICON, Lexicon, fold
+
+
+@pytest.mark.unit
+def test_fold_strips_case_and_accents():
+    """Test that folding casefolds and removes umlauts."""
+    assert fold("Möhren") == "mohren"
+    assert fold("Süßkartoffel") == "susskartoffel"
+    assert fold("Crème Fraîche") == "creme fraiche"
+    assert fold("Mo\u0308hren") == "mohren"
+    assert fold("Carrots") == "carrots"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Möhren", "carrots"),
+        ("Bio Karotten (Bund)", "carrots bund"),
+        ("Erdäpfel festkochend 2 kg", "potatoes festkochend"),
+        ("Grüne Bohnen", "green beans"),
+        ("Bohnen", "beans"),
+        ("Rote Zwiebeln", "rote onions"),
+        ("Rote Bete vorgegart", "beetroot vorgegart"),
+        ("Eier 10 Stück", "eggs 10 stuck"),
+        ("Fresh Milk 1kg", "milk"),
+        ("Organic Cherry Tomatoes 250 g", "cherry tomatoes"),
+        ("Rote Paprikaschoten", "rote peppers"),
+        # Paprika alone is usually the spice
+        ("Paprika edelsüß", "paprika edelsuss"),
+    ],
+)
+def test_canonicalize(text, expected):
+    """Test synonyms, qualifiers and quantities are rewritten in one pass."""
+    assert PRODUCE_LEXICON.canonicalize(text) == expected
+
+
+@pytest.mark.unit
+def test_longest_phrase_wins():
+    """Test a longer phrase is preferred over its prefix."""
+    lexicon = Lexicon({"a b": ("x y",), "a": ("x",)}, dropped=("z",))
+
+    assert lexicon.canonicalize("X Y X z") == "a b a"
+    assert lexicon.canonicalize("X Z Y") == "a y"
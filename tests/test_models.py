@@ -66,3 +66,35 @@ def test_delivery_info_empty_items():
 
     assert delivery_info.total_items == 0
     assert len(delivery_info.items) == 0
+
+
+@pytest.mark.unit
+def test_delivery_info_dict_round_trip():
+    """Test that DeliveryInfo survives serialization to a dictionary."""
+    delivery_info = DeliveryInfo(
+        delivery_date=datetime(2025, 11, 10),
+        items=[BasketItem(name="Apples", quantity=5.0, unit="kg", product_id="1")],
+        last_order_change=datetime.fromisoformat("2025-11-08T12:00:00+01:00"),
+        is_paused=True,
+        can_pause=True,
+        order_state=0,
+    )
+
+    data = delivery_info.as_dict()
+
+    assert data["delivery_date"] == "2025-11-10T00:00:00"
+    assert DeliveryInfo.from_dict(data) == delivery_info
+
+
+@pytest.mark.unit
+def test_delivery_info_fingerprint():
+    """Test that the fingerprint is stable and tracks content changes."""
+    delivery_date = datetime(2025, 3, 5, 8, 0)
+    first = DeliveryInfo(delivery_date, [BasketItem("Potatoes", 1.0, "kg")])
+    same = DeliveryInfo(delivery_date, [BasketItem("Potatoes", 1.0, "kg")])
+    paused = DeliveryInfo(
+        delivery_date, [BasketItem("Potatoes", 1.0, "kg")], is_paused=True
+    )
+
+    assert first.fingerprint() == same.fingerprint()
+    assert first.fingerprint() != paused.fingerprint()
@@ -1,12 +1,14 @@
 """Tests for OekoBox provider implementation."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 
+from custom_components.organic_box.const import DEFAULT_SCAN_INTERVAL
 from custom_components.organic_box.models import DeliveryInfo
 from custom_components.organic_box.oekobox import OekoBoxProvider
+from custom_components.organic_box.session import SessionManager
 
 
 @pytest.mark.unit
@@ -123,6 +125,7 @@ async def test_oekobox_provider_get_next_delivery_with_dates(
     assert isinstance(delivery_info, DeliveryInfo)
     assert delivery_info.delivery_date is not None
     assert delivery_info.delivery_date.date() == future_date
+    assert delivery_info.order_id == 123
 
 
 @pytest.mark.unit
@@ -476,3 +479,377 @@ async def test_oekobox_provider_get_next_delivery_with_xunit_override(
     assert delivery_info.items[0].unit == "bag"
     assert delivery_info.items[0].quantity == 3.5
     assert delivery_info.items[0].product_id == "456"
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_get_next_delivery_single_dates_fetch(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that a refresh fetches the dates payload only once."""
+    import datetime
+    from datetime import date, timedelta
+    from pyoekoboxonline.models import Pause, ShopDate
+
+    future_date = date.today() + timedelta(days=7)
+
+    mock_shop_date = MagicMock(spec=ShopDate)
+    mock_shop_date.order_state = 0
+    mock_shop_date.delivery_date = future_date
+    mock_shop_date.order_id = 123
+    mock_shop_date.last_order_change = None
+
+    mock_pause = MagicMock(spec=Pause)
+    mock_pause.start_date = datetime.datetime.combine(future_date, datetime.time())
+    mock_pause.end_date = datetime.datetime.combine(future_date, datetime.time())
+    del mock_pause.delivery_date
+
+    mock_oekobox_client.get_dates.return_value = [mock_shop_date, mock_pause]
+    mock_oekobox_client.get_order_items.return_value = []
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+
+    delivery_info = await provider.get_next_delivery()
+
+    assert delivery_info.is_paused is True
+    mock_oekobox_client.get_dates.assert_called_once()
+    # logon + dates + order items
+    assert provider.last_refresh_request_count == 3
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_reuses_session_for_follow_up_calls(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that calls right after a refresh share its logon until invalidated."""
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+
+    await provider.get_next_delivery()
+    await provider.get_next_delivery()
+
+    assert mock_oekobox_client.logon.call_count == 1
+    assert provider.session.logon_count == 1
+
+    provider.session.invalidate()
+    await provider.get_next_delivery()
+
+    assert mock_oekobox_client.logon.call_count == 2
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_pause_after_refresh_reuses_session(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that a pause right after a refresh needs no logon of its own."""
+    from datetime import date, timedelta
+    from pyoekoboxonline.models import ShopDate
+
+    mock_oekobox_client.get_dates.return_value = [
+        ShopDate(
+            delivery_date=date.today() + timedelta(days=7), order_id=123, order_state=0
+        )
+    ]
+    mock_oekobox_client.add_pause = AsyncMock(return_value=None)
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+
+    await provider.get_next_delivery()
+    assert await provider.pause_next_delivery() is not None
+    assert mock_oekobox_client.logon.await_count == 1
+
+    # The pause changed the dates, so the next refresh logs on again
+    await provider.get_next_delivery()
+    assert mock_oekobox_client.logon.await_count == 2
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_session_expires_before_next_poll(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that a regular poll never reads dates7 cached by the previous one."""
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+    await provider.get_next_delivery()
+
+    with patch.object(
+        SessionManager,
+        "age",
+        new_callable=PropertyMock,
+        return_value=float(DEFAULT_SCAN_INTERVAL),
+    ):
+        assert provider.session.needs_refresh is True
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_relogs_on_authentication_error(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that an expired session triggers a new logon."""
+    from pyoekoboxonline.exceptions import OekoboxAuthenticationError
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+    await provider.get_next_delivery()
+
+    mock_oekobox_client.get_dates.side_effect = [
+        OekoboxAuthenticationError("expired"),
+        [],
+    ]
+    delivery_info = await provider.get_next_delivery()
+
+    assert delivery_info.delivery_date is None
+    assert mock_oekobox_client.logon.call_count == 2
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_get_upcoming_deliveries(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test getting several upcoming deliveries from one dates fetch."""
+    from datetime import date, timedelta
+    from pyoekoboxonline.models import ShopDate
+
+    first_date = date.today() + timedelta(days=2)
+    shop_dates = []
+    for week, order_id in enumerate((301, 302, 303)):
+        shop_date = MagicMock(spec=ShopDate)
+        shop_date.order_state = 0
+        shop_date.delivery_date = first_date + timedelta(weeks=week)
+        shop_date.order_id = order_id
+        shop_date.last_order_change = None
+        shop_dates.append(shop_date)
+
+    def _order_items(order_id):
+        item = MagicMock()
+        item.item_id = order_id * 10
+        item.name = f"Item {order_id}"
+        item.unit = "kg"
+        item.amount_def = 1.0
+        return [item]
+
+    # Newest delivery first to make sure the result is sorted
+    mock_oekobox_client.get_dates.return_value = list(reversed(shop_dates))
+    mock_oekobox_client.get_order_items.side_effect = _order_items
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+
+    deliveries = await provider.get_upcoming_deliveries(2)
+
+    assert [d.delivery_date.date() for d in deliveries] == [
+        first_date,
+        first_date + timedelta(weeks=1),
+    ]
+    assert [d.items[0].name for d in deliveries] == ["Item 301", "Item 302"]
+    mock_oekobox_client.get_dates.assert_called_once()
+    assert mock_oekobox_client.get_order_items.call_count == 2
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_caches_order_items(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that order items are only fetched again when the order changed."""
+    from datetime import date, timedelta
+    from pyoekoboxonline.models import ShopDate
+
+    shop_date = ShopDate(
+        delivery_date=date.today() + timedelta(days=7),
+        order_id=123,
+        order_state=0,
+        count=1,
+    )
+    mock_item = MagicMock()
+    mock_item.item_id = 456
+    mock_item.name = "Apples"
+    mock_item.unit = "kg"
+    mock_item.amount_def = 2.0
+
+    mock_oekobox_client.get_dates.return_value = [shop_date]
+    mock_oekobox_client.get_order_items.return_value = [mock_item]
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+
+    first = await provider.get_next_delivery()
+    second = await provider.get_next_delivery()
+
+    assert first.items == second.items
+    assert mock_oekobox_client.get_order_items.call_count == 1
+    # dates only, the session and the items are reused
+    assert provider.last_refresh_request_count == 1
+
+    # A changed order state misses the cache
+    shop_date.order_state = 1
+    await provider.get_next_delivery()
+    assert mock_oekobox_client.get_order_items.call_count == 2
+
+    # Invalidating the cache forces a new fetch
+    provider.invalidate_cache()
+    await provider.get_next_delivery()
+    assert mock_oekobox_client.get_order_items.call_count == 3
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_item_cache_follows_last_changed(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that swapped items with the same count and total miss the cache."""
+    from datetime import date, datetime, timedelta
+    from pyoekoboxonline.models import ShopDate
+
+    shop_date = ShopDate(
+        delivery_date=date.today() + timedelta(days=7),
+        order_id=123,
+        order_state=0,
+        count=1,
+        total=4.5,
+        last_changed=datetime(2025, 11, 3, 9, 0),
+    )
+    apples = MagicMock(item_id=456, unit="kg", amount_def=1.0)
+    apples.name = "Apples"
+    pears = MagicMock(item_id=789, unit="kg", amount_def=1.0)
+    pears.name = "Pears"
+
+    mock_oekobox_client.get_dates.return_value = [shop_date]
+    mock_oekobox_client.get_order_items.return_value = [apples]
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+    first = await provider.get_next_delivery()
+
+    mock_oekobox_client.get_order_items.return_value = [pears]
+    shop_date.last_changed = datetime(2025, 11, 3, 9, 30)
+    second = await provider.get_next_delivery()
+
+    assert [item.name for item in first.items] == ["Apples"]
+    assert [item.name for item in second.items] == ["Pears"]
+    assert mock_oekobox_client.get_order_items.call_count == 2
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_coalesces_concurrent_refreshes(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that concurrent refreshes share one logon and one dates request."""
+    import asyncio
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+
+    results = await asyncio.gather(
+        provider.get_next_delivery(), provider.get_next_delivery()
+    )
+
+    assert results[0] == results[1]
+    mock_oekobox_client.logon.assert_called_once()
+    mock_oekobox_client.get_dates.assert_called_once()
+    assert provider.coalesced_request_count == 1
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_unpause_resolves_pause_id_from_date_range(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that unpausing finds the start_date/end_date pause it reports."""
+    from datetime import date, timedelta
+    from pyoekoboxonline.models import Pause, ShopDate
+
+    future_date = date.today() + timedelta(days=7)
+    shop_date = ShopDate(delivery_date=future_date, order_id=123, order_state=0)
+    pause = Pause(
+        id=42,
+        start_date=future_date - timedelta(days=2),
+        end_date=future_date + timedelta(days=2),
+    )
+
+    mock_oekobox_client.get_dates.return_value = [shop_date, pause]
+    mock_oekobox_client.drop_pause = AsyncMock(return_value=None)
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+
+    record = await provider.unpause_next_delivery()
+
+    assert record is not None
+    assert record.is_paused is False
+    assert record.pause_id == 42
+    mock_oekobox_client.drop_pause.assert_awaited_once_with(42)
+
+
+def _wrapped(err: Exception) -> Exception:
+    """Return an aiohttp error wrapped like pyoekoboxonline does."""
+    from pyoekoboxonline.exceptions import OekoboxConnectionError
+
+    wrapped = OekoboxConnectionError(f"Request failed: {err}")
+    wrapped.__cause__ = err
+    return wrapped
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("applied", "status"), [(True, "paused"), (False, "failed")])
+async def test_oekobox_provider_does_not_resend_timed_out_pause(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+    applied: bool,
+    status: str,
+):
+    """Test that a pause that may have been sent is settled by re-reading dates."""
+    from datetime import date, timedelta
+
+    import aiohttp
+    from pyoekoboxonline.models import Pause
+
+    today = date.today()
+    monday = today + timedelta(days=7 - today.weekday())
+    pause = Pause(id=7, start_date=monday, end_date=monday + timedelta(days=6))
+    mock_oekobox_client.get_dates.side_effect = [[], [pause] if applied else []]
+    mock_oekobox_client.add_pause = AsyncMock(
+        side_effect=_wrapped(aiohttp.ServerTimeoutError("Timeout on reading data"))
+    )
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+    results = await provider.pause_range(monday, monday)
+
+    assert [result.status for result in results] == [status]
+    mock_oekobox_client.add_pause.assert_awaited_once()
+    # The outcome is read with a new session, as dates7 is cached per session
+    assert mock_oekobox_client.get_dates.await_count == 2
+    assert mock_oekobox_client.logon.await_count == 2
+
+
+@pytest.mark.unit
+async def test_oekobox_provider_resends_unsent_pause(
+    hass: HomeAssistant,
+    mock_oekobox_client,
+    mock_oekobox_online,
+):
+    """Test that a pause that failed to connect is sent again."""
+    from datetime import date, timedelta
+
+    import aiohttp
+
+    today = date.today()
+    monday = today + timedelta(days=7 - today.weekday())
+    mock_oekobox_client.add_pause = AsyncMock(
+        side_effect=[_wrapped(aiohttp.ConnectionTimeoutError()), None]
+    )
+
+    provider = OekoBoxProvider(hass, "test@example.com", "password", "shop123")
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        results = await provider.pause_range(monday, monday)
+
+    assert [result.status for result in results] == ["paused"]
+    assert mock_oekobox_client.add_pause.await_count == 2
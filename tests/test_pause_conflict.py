@@ -110,7 +110,7 @@ async def test_pause_conflict_with_auto_cancel_enabled(
     result = await provider.pause_next_delivery()
 
     # Should succeed after retry
-    assert result is True
+    assert result is not None
 
     # Verify add_pause was called twice
     assert mock_client.add_pause.call_count == 2
@@ -170,7 +170,7 @@ async def test_pause_conflict_without_auto_cancel(
     result = await provider.pause_next_delivery()
 
     # Should fail without retry
-    assert result is False
+    assert result is None
 
     # Verify add_pause was only called once
     assert mock_client.add_pause.call_count == 1
@@ -222,8 +222,11 @@ async def test_pause_success_without_conflict(
     # Call pause_next_delivery
     result = await provider.pause_next_delivery()
 
-    # Should succeed
-    assert result is True
+    # Should succeed and describe the paused week
+    assert result is not None
+    assert result.is_paused is True
+    assert result.delivery_date == delivery_date
+    assert (result.start_date, result.end_date) == (week_start, week_end)
 
     # Verify add_pause was only called once
     assert mock_client.add_pause.call_count == 1
@@ -273,7 +276,7 @@ async def test_pause_conflict_retry_fails(
     result = await provider.pause_next_delivery()
 
     # Should fail
-    assert result is False
+    assert result is None
 
     # Verify add_pause was called twice
     assert mock_client.add_pause.call_count == 2
@@ -315,7 +318,7 @@ async def test_pause_non_409_error(
     result = await provider.pause_next_delivery()
 
     # Should fail
-    assert result is False
+    assert result is None
 
     # Verify add_pause was only called once (no retry for non-409 errors)
     assert mock_client.add_pause.call_count == 1
@@ -0,0 +1,130 @@
+"""Tests for the pause interval index."""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from pyoekoboxonline.models import Pause
+
+from custom_components.organic_box.pause_index import (
+    PauseIndex,
+    PauseInterval,
+    week_spans,
+)
+
+
+@pytest.mark.unit
+def test_pause_interval_from_pause_variants():
+    """Test that all pause date layouts produce the same kind of interval."""
+    model = Pause(id=1, start_date=date(2025, 3, 3), end_date=date(2025, 3, 9))
+    legacy = SimpleNamespace(id=2, date_from="2025-03-03", date_to="2025-03-09")
+    single = SimpleNamespace(id=3, delivery_date=datetime(2025, 3, 5, 8, 0))
+
+    assert PauseInterval.from_pause(model) == PauseInterval(
+        date(2025, 3, 3), date(2025, 3, 9), 1
+    )
+    assert PauseInterval.from_pause(legacy) == PauseInterval(
+        date(2025, 3, 3), date(2025, 3, 9), 2
+    )
+    assert PauseInterval.from_pause(single) == PauseInterval(
+        date(2025, 3, 5), date(2025, 3, 5), 3
+    )
+    assert PauseInterval.from_pause(Pause(id=4)) is None
+
+
+@pytest.mark.unit
+def test_pause_index_merges_overlapping_and_adjacent_pauses():
+    """Test that overlapping and adjacent pauses form one span."""
+    index = PauseIndex(
+        [
+            PauseInterval(date(2025, 3, 10), date(2025, 3, 16), 2),
+            PauseInterval(date(2025, 3, 3), date(2025, 3, 9), 1),
+            PauseInterval(date(2025, 3, 14), date(2025, 3, 20), 3),
+            PauseInterval(date(2025, 4, 7), date(2025, 4, 13), 4),
+        ]
+    )
+
+    assert len(index) == 2
+    assert index.is_paused(date(2025, 3, 3))
+    assert index.is_paused(date(2025, 3, 20))
+    assert not index.is_paused(date(2025, 3, 21))
+    assert not index.is_paused(date(2025, 3, 2))
+    assert index.is_paused(date(2025, 4, 10))
+    assert not index.is_paused(date(2025, 4, 14))
+
+
+@pytest.mark.unit
+def test_pause_index_find_resolves_pause_id():
+    """Test that lookups return the pause covering the date."""
+    index = PauseIndex.from_pauses(
+        [
+            Pause(id=1, start_date=date(2025, 3, 3), end_date=date(2025, 3, 9)),
+            Pause(id=2, start_date=date(2025, 3, 10), end_date=date(2025, 3, 16)),
+            Pause(id=3, start_date=date(2025, 3, 14), end_date=date(2025, 3, 15)),
+        ]
+    )
+
+    assert index.find(date(2025, 3, 5)).pause_id == 1
+    assert index.find(date(2025, 3, 12)).pause_id == 2
+    assert index.find(date(2025, 3, 16)).pause_id == 2
+    # The most specific (latest starting) pause wins
+    assert index.find(date(2025, 3, 14)).pause_id == 3
+    assert index.find(date(2025, 3, 17)) is None
+
+
+@pytest.mark.unit
+def test_pause_index_find_in_long_merged_span():
+    """Test lookups in a span of adjacent weekly and overlapping pauses."""
+    weeks = [
+        PauseInterval(monday, monday + timedelta(days=6), number)
+        for number, monday in enumerate(
+            date(2025, 1, 6) + timedelta(weeks=week) for week in range(26)
+        )
+    ]
+    index = PauseIndex(
+        [*weeks, PauseInterval(date(2025, 1, 1), date(2025, 2, 28), 100)]
+    )
+
+    assert len(index) == 1
+    assert index.find(date(2025, 1, 3)).pause_id == 100
+    assert index.find(date(2025, 1, 6)).pause_id == 0
+    assert index.find(date(2025, 7, 6)).pause_id == 25
+    assert index.find(date(2025, 3, 12)).pause_id == 9
+    assert index.find(date(2025, 7, 7)) is None
+
+
+@pytest.mark.unit
+def test_pause_index_empty():
+    """Test lookups on an index without pauses."""
+    index = PauseIndex.from_pauses([])
+
+    assert len(index) == 0
+    assert index.find(date(2025, 3, 5)) is None
+    assert not index.is_paused(date(2025, 3, 5))
+
+
+@pytest.mark.unit
+def test_pause_index_covers():
+    """Test range coverage across merged pauses."""
+    index = PauseIndex(
+        [
+            PauseInterval(date(2025, 3, 3), date(2025, 3, 9), 1),
+            PauseInterval(date(2025, 3, 10), date(2025, 3, 16), 2),
+        ]
+    )
+
+    assert index.covers(date(2025, 3, 3), date(2025, 3, 16))
+    assert not index.covers(date(2025, 3, 10), date(2025, 3, 17))
+    assert not index.covers(date(2025, 3, 1), date(2025, 3, 5))
+
+
+@pytest.mark.unit
+def test_week_spans():
+    """Test that a range maps to the Monday to Sunday weeks overlapping it."""
+    assert week_spans(date(2025, 3, 5), date(2025, 3, 5)) == [
+        (date(2025, 3, 3), date(2025, 3, 9))
+    ]
+    assert week_spans(date(2025, 3, 9), date(2025, 3, 10)) == [
+        (date(2025, 3, 3), date(2025, 3, 9)),
+        (date(2025, 3, 10), date(2025, 3, 16)),
+    ]
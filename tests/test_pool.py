@@ -0,0 +1,60 @@
+"""Tests for the shared client pool and rate limiter."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.organic_box.pool import ClientPool, TokenBucket
+
+
+@pytest.mark.unit
+async def test_token_bucket_allows_burst_then_waits():
+    """Test that requests beyond the burst are delayed to the configured rate."""
+    with (
+        patch("custom_components.organic_box.pool.time.monotonic", return_value=0.0),
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        bucket = TokenBucket(rate=0.5, capacity=2)
+        await bucket.acquire()
+        await bucket.acquire()
+        mock_sleep.assert_not_awaited()
+
+        await bucket.acquire()
+
+    mock_sleep.assert_awaited_once_with(2.0)
+    assert bucket.wait_count == 1
+
+
+@pytest.mark.unit
+def test_pool_shares_connection_per_account():
+    """Test reference counting of connections keyed by shop and username."""
+    pool = ClientPool()
+
+    first = pool.acquire("shop", "user")
+    second = pool.acquire("shop", "user")
+    other = pool.acquire("shop", "other")
+
+    assert first is second
+    assert other is not first
+    assert first.refs == 2
+
+    assert pool.release("shop", "user") is False
+    assert pool.release("shop", "user") is True
+    assert pool.acquire("shop", "user") is not first
+
+
+@pytest.mark.unit
+def test_pool_shares_rate_limiter_per_host():
+    """Test that connections to one host share a limiter with the lowest rate."""
+    pool = ClientPool()
+    first = pool.acquire("shop1", "user", max_rate=60)
+    second = pool.acquire("shop2", "user", max_rate=12)
+
+    first.bind_url("https://oekobox-online.de/v3/shop/shop1")
+    second.bind_url("https://oekobox-online.de/v3/shop/shop2")
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter.rate == pytest.approx(12 / 60)
+
+    pool.release("shop2", "user")
+    assert first.rate_limiter.rate == pytest.approx(60 / 60)
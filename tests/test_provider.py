@@ -105,3 +105,14 @@ async def test_provider_close(hass: HomeAssistant):
     await provider.close()
 
     assert provider.close_called is True
+
+
+@pytest.mark.unit
+async def test_provider_get_upcoming_deliveries_default(hass: HomeAssistant):
+    """Test the default get_upcoming_deliveries without a next delivery."""
+    provider = MockProvider(hass, "test_user", "test_pass")
+
+    deliveries = await provider.get_upcoming_deliveries(3)
+
+    assert provider.get_next_delivery_called is True
+    assert deliveries == []
@@ -0,0 +1,188 @@
+"""Tests for retries and the circuit breaker."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+from pyoekoboxonline.exceptions import (
+    OekoboxAPIError,
+    OekoboxAuthenticationError,
+    OekoboxConnectionError,
+)
+
+from custom_components.organic_box.resilience import (
+    UNDELIVERED_ERRORS,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ErrorKind,
+    async_call_with_retry,
+    classify_error,
+)
+
+
+def _wrapped(err: Exception) -> OekoboxConnectionError:
+    """Return an aiohttp error wrapped like pyoekoboxonline does."""
+    wrapped = OekoboxConnectionError(f"Request failed: {err}")
+    wrapped.__cause__ = err
+    return wrapped
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker(2, timedelta(minutes=10))
+
+
+async def _call(call, breaker: CircuitBreaker, **kwargs):
+    return await async_call_with_retry(
+        call,
+        name="test",
+        breaker=breaker,
+        attempts=3,
+        base_delay=1.0,
+        max_delay=5.0,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("err", "kind"),
+    [
+        (OekoboxAuthenticationError("denied"), ErrorKind.AUTH),
+        (OekoboxAPIError("conflict", status_code=409), ErrorKind.CONFLICT),
+        (OekoboxAPIError("unavailable", status_code=503), ErrorKind.SERVER),
+        (OekoboxAPIError("throttled", status_code=429), ErrorKind.SERVER),
+        (OekoboxAPIError("bad request", status_code=400), ErrorKind.CLIENT),
+        (OekoboxConnectionError("refused"), ErrorKind.CONNECTION),
+        (_wrapped(aiohttp.ConnectionTimeoutError()), ErrorKind.CONNECT),
+        (_wrapped(aiohttp.ServerTimeoutError()), ErrorKind.CONNECTION),
+        (_wrapped(aiohttp.ServerDisconnectedError()), ErrorKind.CONNECTION),
+        (aiohttp.ConnectionTimeoutError(), ErrorKind.CONNECT),
+        (TimeoutError(), ErrorKind.TIMEOUT),
+        (ValueError("parse"), ErrorKind.UNKNOWN),
+    ],
+)
+def test_classify_error(err: Exception, kind: ErrorKind):
+    """Test error classification."""
+    assert classify_error(err) is kind
+
+
+@pytest.mark.unit
+async def test_retry_recovers_from_transient_error():
+    """Test that a transient failure is retried after a delay."""
+    breaker = _breaker()
+    call = AsyncMock(side_effect=[TimeoutError(), "ok"])
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        assert await _call(call, breaker) == "ok"
+
+    assert call.await_count == 2
+    delay = mock_sleep.await_args.args[0]
+    assert 0 <= delay <= 1.0
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.unit
+async def test_retry_skips_non_retryable_errors():
+    """Test that auth errors and conflicts are raised immediately."""
+    breaker = _breaker()
+    call = AsyncMock(side_effect=OekoboxAPIError("conflict", status_code=409))
+
+    with pytest.raises(OekoboxAPIError):
+        await _call(call, breaker)
+
+    assert call.await_count == 1
+    assert breaker.as_dict()["consecutive_failures"] == 0
+
+
+@pytest.mark.unit
+async def test_retry_limits_kinds():
+    """Test that only the given error kinds are retried."""
+    breaker = _breaker()
+    call = AsyncMock(side_effect=OekoboxAPIError("unavailable", status_code=503))
+
+    with pytest.raises(OekoboxAPIError):
+        await _call(call, breaker, retry_on=UNDELIVERED_ERRORS)
+
+    assert call.await_count == 1
+    assert breaker.as_dict()["consecutive_failures"] == 1
+
+
+@pytest.mark.unit
+async def test_circuit_opens_and_recovers():
+    """Test opening, rejecting, half-opening and closing the circuit."""
+    breaker = _breaker()
+    failing = AsyncMock(side_effect=OekoboxConnectionError("refused"))
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        patch("custom_components.organic_box.resilience.time.monotonic") as clock,
+    ):
+        clock.return_value = 1000.0
+        for _ in range(2):
+            with pytest.raises(OekoboxConnectionError):
+                await _call(failing, breaker)
+
+        assert breaker.state is CircuitState.OPEN
+        assert failing.await_count == 6
+        with pytest.raises(CircuitOpenError):
+            await _call(failing, breaker)
+        assert failing.await_count == 6
+
+        # Past the jittered reset timeout a trial call is let through
+        clock.return_value = 1000.0 + 12 * 60 + 1
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert await _call(AsyncMock(return_value="ok"), breaker) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.open_count == 1
+
+
+@pytest.mark.unit
+async def test_half_open_circuit_lets_one_trial_through():
+    """Test that concurrent calls fail fast while the trial call is in flight."""
+    breaker = _breaker()
+    for _ in range(2):
+        breaker.record_failure(TimeoutError())
+    trial_started = asyncio.Event()
+    finish_trial = asyncio.Event()
+
+    async def _trial() -> str:
+        trial_started.set()
+        await finish_trial.wait()
+        return "ok"
+
+    with patch("custom_components.organic_box.resilience.time.monotonic") as clock:
+        clock.return_value = 1e9
+        assert breaker.state is CircuitState.HALF_OPEN
+        trial = asyncio.create_task(_call(_trial, breaker))
+        await trial_started.wait()
+
+        other = AsyncMock(return_value="ok")
+        with pytest.raises(CircuitOpenError):
+            await _call(other, breaker)
+        other.assert_not_awaited()
+
+        finish_trial.set()
+        assert await trial == "ok"
+        assert breaker.state is CircuitState.CLOSED
+        assert await _call(other, breaker) == "ok"
+
+
+@pytest.mark.unit
+async def test_failed_trial_reopens_without_retries():
+    """Test that a failing trial call reopens the circuit after one attempt."""
+    breaker = _breaker()
+    for _ in range(2):
+        breaker.record_failure(TimeoutError())
+    failing = AsyncMock(side_effect=TimeoutError())
+
+    with patch("custom_components.organic_box.resilience.time.monotonic") as clock:
+        clock.return_value = 1e9
+        with pytest.raises(TimeoutError):
+            await _call(failing, breaker)
+
+        assert failing.await_count == 1
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.open_count == 2
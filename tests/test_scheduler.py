@@ -0,0 +1,132 @@
+"""Tests for the adaptive polling scheduler."""
+
+from datetime import datetime, time, timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.organic_box.const import (
+    DEFAULT_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
+from custom_components.organic_box.models import DeliveryInfo
+from custom_components.organic_box.scheduler import (
+    compute_update_interval,
+    needs_fresh_data,
+)
+
+
+def _now() -> datetime:
+    """Return a fixed local noon."""
+    return datetime(2025, 11, 3, 12, 0, tzinfo=dt_util.get_default_time_zone())
+
+
+def _delivery(
+    delivery_in: timedelta,
+    deadline_in: timedelta | None = None,
+    order_state: int = 0,
+    now: datetime | None = None,
+) -> DeliveryInfo:
+    """Return a DeliveryInfo relative to now, defaulting to _now()."""
+    now = now or _now()
+    return DeliveryInfo(
+        delivery_date=(now + delivery_in).replace(tzinfo=None),
+        items=[],
+        last_order_change=now + deadline_in if deadline_in is not None else None,
+        order_state=order_state,
+    )
+
+
+@pytest.mark.unit
+async def test_interval_without_delivery(hass: HomeAssistant):
+    """Test the idle interval when no delivery is planned."""
+    assert compute_update_interval(None, _now()) == timedelta(
+        seconds=IDLE_SCAN_INTERVAL
+    )
+    assert compute_update_interval(
+        DeliveryInfo(delivery_date=None, items=[]), _now()
+    ) == timedelta(seconds=IDLE_SCAN_INTERVAL)
+
+
+@pytest.mark.unit
+async def test_interval_far_from_deadline(hass: HomeAssistant):
+    """Test that polling is rare while the deadline is days away."""
+    info = _delivery(timedelta(days=9), timedelta(days=7))
+
+    assert compute_update_interval(info, _now()) == timedelta(seconds=MAX_SCAN_INTERVAL)
+
+
+@pytest.mark.unit
+async def test_interval_does_not_skip_deadline_window(hass: HomeAssistant):
+    """Test that the interval ends when the deadline window starts."""
+    info = _delivery(timedelta(days=3), timedelta(minutes=70))
+
+    assert compute_update_interval(info, _now()) == timedelta(minutes=10)
+
+
+@pytest.mark.unit
+async def test_interval_close_to_deadline(hass: HomeAssistant):
+    """Test that polling tightens shortly before the deadline."""
+    info = _delivery(timedelta(days=2), timedelta(minutes=10))
+
+    assert compute_update_interval(info, _now()) == timedelta(seconds=MIN_SCAN_INTERVAL)
+
+
+@pytest.mark.unit
+async def test_interval_in_preparation(hass: HomeAssistant):
+    """Test the regular interval while the order is being prepared."""
+    info = _delivery(timedelta(days=2), timedelta(days=-1), order_state=1)
+
+    assert compute_update_interval(info, _now()) == timedelta(
+        seconds=DEFAULT_SCAN_INTERVAL
+    )
+
+
+@pytest.mark.unit
+async def test_interval_deferred_by_quiet_window(hass: HomeAssistant):
+    """Test that a poll inside the quiet window is moved to its end."""
+    info = _delivery(timedelta(hours=20), timedelta(days=-1), order_state=2)
+    now = _now().replace(hour=23, minute=0)
+
+    interval = compute_update_interval(info, now, time(22, 0), time(6, 0))
+
+    assert now + interval == (now + timedelta(days=1)).replace(hour=6, minute=0)
+
+
+@pytest.mark.unit
+async def test_quiet_window_keeps_deadline_polls(hass: HomeAssistant):
+    """Test that polls around a deadline inside the quiet window are kept."""
+    now = _now().replace(hour=22, minute=30)
+    info = _delivery(timedelta(days=2), timedelta(minutes=30), now=now)
+
+    interval = compute_update_interval(info, now, time(22, 0), time(6, 0))
+
+    assert interval == timedelta(seconds=MIN_SCAN_INTERVAL)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("delivery_in", "deadline_in", "order_state", "fresh"),
+    [
+        (timedelta(days=9), timedelta(days=7), 0, False),
+        (timedelta(days=2), timedelta(minutes=10), 0, True),
+        (timedelta(days=2), timedelta(days=-1), 1, True),
+        (timedelta(hours=20), timedelta(days=-1), 2, True),
+        (timedelta(days=3), timedelta(days=-1), 2, False),
+    ],
+)
+async def test_needs_fresh_data(
+    hass: HomeAssistant,
+    delivery_in: timedelta,
+    deadline_in: timedelta,
+    order_state: int,
+    fresh: bool,
+):
+    """Test that polls around the deadline and delivery bypass provider caches."""
+    info = _delivery(delivery_in, deadline_in, order_state)
+
+    assert needs_fresh_data(info, _now()) is fresh
+    assert needs_fresh_data(None, _now()) is False
@@ -0,0 +1,233 @@
+"""Test the organic_box services."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pyoekoboxonline.exceptions import OekoboxAPIError
+from pyoekoboxonline.models import Pause
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.organic_box.const import (
+    ATTR_BASKET_ITEM,
+    ATTR_END_DATE,
+    ATTR_FORCE,
+    ATTR_SHOPPING_ITEM,
+    ATTR_START_DATE,
+    DOMAIN,
+    SERVICE_FORGET_MATCH,
+    SERVICE_LEARN_MATCH,
+    SERVICE_PAUSE_RANGE,
+    SERVICE_UPDATE_BASKET,
+)
+from custom_components.organic_box.models import BasketItem, DeliveryInfo
+
+
+async def _setup_entry(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set up the integration with a config entry."""
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.integration
+async def test_update_basket_service(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that update_basket refreshes the coordinator."""
+    await _setup_entry(hass, mock_config_entry)
+    calls_before = mock_oekobox_client.get_dates.call_count
+
+    await hass.services.async_call(DOMAIN, SERVICE_UPDATE_BASKET, {}, blocking=True)
+    await hass.async_block_till_done()
+
+    assert mock_oekobox_client.get_dates.call_count == calls_before + 1
+
+
+@pytest.mark.integration
+async def test_update_basket_service_force(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that a forced update for an entity invalidates provider caches."""
+    await _setup_entry(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    coordinator.provider.invalidate_cache = MagicMock()
+
+    entity_registry = er.async_get(hass)
+    entity_id = er.async_entries_for_config_entry(
+        entity_registry, mock_config_entry.entry_id
+    )[0].entity_id
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_UPDATE_BASKET,
+        {"entity_id": entity_id, ATTR_FORCE: True},
+        blocking=True,
+    )
+
+    coordinator.provider.invalidate_cache.assert_called_once()
+
+
+@pytest.mark.integration
+async def test_pause_range_service(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that pause_range pauses each uncovered week and reports the outcome."""
+    await _setup_entry(hass, mock_config_entry)
+
+    # The second week is already paused, the third has a planned basket
+    mock_oekobox_client.get_dates.return_value = [
+        Pause(id=7, start_date=date(2030, 6, 10), end_date=date(2030, 6, 16))
+    ]
+
+    async def _add_pause(from_dt: datetime, to_dt: datetime, auto_cancel: bool):
+        if from_dt.date() == date(2030, 6, 17):
+            raise OekoboxAPIError("Conflict", status_code=409)
+
+    mock_oekobox_client.add_pause = AsyncMock(side_effect=_add_pause)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PAUSE_RANGE,
+        {ATTR_START_DATE: "2030-06-05", ATTR_END_DATE: "2030-06-20"},
+        blocking=True,
+        return_response=True,
+    )
+
+    weeks = response[mock_config_entry.entry_id]["weeks"]
+    assert [(week["week_start"], week["status"]) for week in weeks] == [
+        ("2030-06-03", "paused"),
+        ("2030-06-10", "already_paused"),
+        ("2030-06-17", "conflict"),
+    ]
+    assert mock_oekobox_client.add_pause.await_count == 2
+
+
+@pytest.mark.integration
+async def test_pause_range_service_rejects_inverted_range(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that an end date before the start date is rejected."""
+    await _setup_entry(hass, mock_config_entry)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PAUSE_RANGE,
+            {ATTR_START_DATE: "2030-06-20", ATTR_END_DATE: "2030-06-05"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+@pytest.mark.integration
+async def test_pause_range_service_rejects_past_weeks(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that only the current and later delivery weeks can be paused."""
+    await _setup_entry(hass, mock_config_entry)
+    mock_oekobox_client.add_pause = AsyncMock()
+    today = dt_util.now().date()
+    monday = today - timedelta(days=today.weekday())
+
+    with pytest.raises(ServiceValidationError, match="before the current"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PAUSE_RANGE,
+            {
+                ATTR_START_DATE: str(monday - timedelta(days=1)),
+                ATTR_END_DATE: str(monday + timedelta(days=6)),
+            },
+            blocking=True,
+            return_response=True,
+        )
+    assert mock_oekobox_client.add_pause.await_count == 0
+
+    # The Monday of the current week is accepted
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PAUSE_RANGE,
+        {ATTR_START_DATE: str(monday), ATTR_END_DATE: str(monday)},
+        blocking=True,
+        return_response=True,
+    )
+    assert [
+        week["status"] for week in response[mock_config_entry.entry_id]["weeks"]
+    ] == ["paused"]
+
+
+@pytest.mark.integration
+async def test_learn_and_forget_match_services(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that aliases can be learned and forgotten through services."""
+    await _setup_entry(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    coordinator.async_request_rematch = MagicMock()
+    item = BasketItem(name="Möhren Bund", quantity=0)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LEARN_MATCH,
+        {ATTR_BASKET_ITEM: "Möhren Bund", ATTR_SHOPPING_ITEM: "Carrots"},
+        blocking=True,
+    )
+    assert coordinator.alias_table.get(item) == "carrots"
+    coordinator.async_request_rematch.assert_called_once()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_FORGET_MATCH, {ATTR_BASKET_ITEM: "Möhren Bund"}, blocking=True
+    )
+    assert coordinator.alias_table.get(item) is None
+    assert coordinator.async_request_rematch.call_count == 2
+
+
+@pytest.mark.integration
+async def test_forget_match_resolves_product_of_past_basket(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_oekobox_client,
+    mock_oekobox_online,
+) -> None:
+    """Test that a product alias is forgotten once the item left the basket."""
+    await _setup_entry(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    item = BasketItem(name="Mangold Bund", quantity=1.0, product_id="123")
+    coordinator.data = DeliveryInfo(delivery_date=None, items=[item])
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LEARN_MATCH,
+        {ATTR_BASKET_ITEM: "Mangold Bund", ATTR_SHOPPING_ITEM: "Swiss Chard"},
+        blocking=True,
+    )
+    assert coordinator.alias_table.get(item) == "swiss chard"
+
+    coordinator.data = DeliveryInfo(delivery_date=None, items=[])
+    await hass.services.async_call(
+        DOMAIN, SERVICE_FORGET_MATCH, {ATTR_BASKET_ITEM: "Mangold Bund"}, blocking=True
+    )
+    assert coordinator.alias_table.get(item) is None
+    assert len(coordinator.alias_table) == 0
@@ -0,0 +1,73 @@
+"""Tests for the session manager."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.organic_box.session import SessionManager
+
+
+@pytest.mark.unit
+async def test_session_manager_records_logon():
+    """Test that a logon is counted and timed."""
+    session = SessionManager(timedelta(hours=1))
+    logon = AsyncMock()
+
+    assert session.needs_refresh is False
+    assert session.age is None
+
+    await session.async_logon(logon)
+
+    logon.assert_awaited_once()
+    assert session.logon_count == 1
+    assert session.last_logon_latency is not None
+    assert session.age is not None
+    assert session.needs_refresh is False
+
+
+@pytest.mark.unit
+async def test_session_manager_expires_after_max_age():
+    """Test that a session needs a refresh once it is older than max_age."""
+    session = SessionManager(timedelta(seconds=60))
+
+    with patch(
+        "custom_components.organic_box.session.time.monotonic", return_value=1000.0
+    ):
+        await session.async_logon(AsyncMock())
+
+    with patch(
+        "custom_components.organic_box.session.time.monotonic", return_value=1059.0
+    ):
+        assert session.needs_refresh is False
+
+    with patch(
+        "custom_components.organic_box.session.time.monotonic", return_value=1060.0
+    ):
+        assert session.needs_refresh is True
+
+
+@pytest.mark.unit
+async def test_session_manager_invalidate():
+    """Test that an invalidated session needs a refresh until the next logon."""
+    session = SessionManager(timedelta(hours=1))
+    await session.async_logon(AsyncMock())
+
+    session.invalidate()
+    assert session.needs_refresh is True
+
+    await session.async_logon(AsyncMock())
+    assert session.needs_refresh is False
+    assert session.logon_count == 2
+
+
+@pytest.mark.unit
+async def test_session_manager_failed_logon():
+    """Test that a failed logon is counted and leaves no session behind."""
+    session = SessionManager(timedelta(hours=1))
+
+    with pytest.raises(RuntimeError):
+        await session.async_logon(AsyncMock(side_effect=RuntimeError("boom")))
+
+    assert session.logon_count == 1
+    assert session.age is None
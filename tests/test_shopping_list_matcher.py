@@ -1,11 +1,25 @@
 """Tests for shopping list matcher."""
 
+import random
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from homeassistant.components.shopping_list import ShoppingData
+from homeassistant.components.shopping_list.const import EVENT_SHOPPING_LIST_UPDATED
+from pytest_homeassistant_custom_component.common import async_capture_events
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
+from custom_components.organic_box.const import (
+    MATCH_ENGINE_DIFFLIB,
+    MATCH_ENGINE_VECTOR,
+)
 from custom_components.organic_box.models import BasketItem
-from custom_components.organic_box.shopping_list_matcher import ShoppingListMatcher
+from custom_components.organic_box.shopping_list_matcher import (
+    PreparedShoppingList,
+    PreparedText,
+    ShoppingListMatcher,
+    _normalize,
+)
 
 
 @pytest.fixture
@@ -32,6 +46,14 @@ def test_normalize_text():
     assert ShoppingListMatcher.normalize_text("  Extra Spaces  ") == "extra spaces"
 
 
+def test_normalize_text_canonicalizes_produce():
+    """Test German and English produce names share a canonical name."""
+    assert ShoppingListMatcher.normalize_text("Bio Möhren 500g") == "carrots"
+    assert ShoppingListMatcher.get_similarity("Möhren", "Karotten") == 1.0
+    assert ShoppingListMatcher.get_similarity("Erdäpfel", "Kartoffeln") == 1.0
+    assert ShoppingListMatcher.get_similarity("Süßkartoffeln", "Sweet Potatoes") == 1.0
+
+
 def test_get_similarity():
     """Test similarity calculation."""
     # Exact match
@@ -222,3 +244,393 @@ async def test_match_items_threshold(mock_hass):
     low_threshold_matcher = ShoppingListMatcher(mock_hass, threshold=0.60)
     matches = await low_threshold_matcher.match_items(basket_items)
     assert "Organic Fresh Milk" in matches
+
+
+def test_normalize_text_is_cached():
+    """Test normalized forms are cached between calls."""
+    _normalize.cache_clear()
+    ShoppingListMatcher.normalize_text("Organic Tomatoes")
+    ShoppingListMatcher.normalize_text("Organic Tomatoes")
+    assert _normalize.cache_info().hits == 1
+
+
+def test_prepared_shopping_list_skips_unnamed_items():
+    """Test the prepared list normalizes names once and skips empty ones."""
+    prepared = PreparedShoppingList(
+        [
+            {"id": "1", "name": "Organic Tomatoes"},
+            {"id": "2", "name": ""},
+            {"id": "3"},
+        ]
+    )
+    assert len(prepared) == 1
+    item, text = prepared.entries[0]
+    assert item["id"] == "1"
+    assert text.normalized == "tomatoes"
+    assert text.tokens == frozenset({"tomatoes"})
+
+
+def test_match_prepared_keeps_first_best_match(matcher):
+    """Test the first of equally good list entries wins."""
+    prepared = PreparedShoppingList(
+        [
+            {"id": "1", "name": "Milk"},
+            {"id": "2", "name": "Bio Milk"},
+            {"id": "3", "name": "Bread"},
+        ]
+    )
+    basket_items = [
+        BasketItem(name="Fresh Milk", quantity=1.0, unit="L"),
+        BasketItem(name="Bananas", quantity=1.0, unit="kg"),
+    ]
+    matches = matcher.match_prepared(basket_items, prepared)
+    assert list(matches) == ["Fresh Milk"]
+    assert matches["Fresh Milk"]["shopping_list_item"]["id"] == "1"
+    assert matches["Fresh Milk"]["similarity"] == pytest.approx(1.0)
+
+
+def test_match_prepared_scores_like_get_similarity(matcher):
+    """Test prepared matching uses the same scores as get_similarity."""
+    names = ["Cherry Tomatoes", "Tomato", "Carrots 1kg", "Rye Bread"]
+    prepared = PreparedShoppingList([{"name": name} for name in names])
+    basket_items = [BasketItem(name="Tomatoes", quantity=1.0, unit="kg")]
+
+    low_matcher = ShoppingListMatcher(matcher._hass, threshold=0.0)
+    match = low_matcher.match_prepared(basket_items, prepared)["Tomatoes"]
+
+    expected = max(
+        names, key=lambda name: ShoppingListMatcher.get_similarity("Tomatoes", name)
+    )
+    assert match["shopping_list_item"]["name"] == expected
+    assert match["similarity"] == ShoppingListMatcher.get_similarity(
+        "Tomatoes", expected
+    )
+
+
+def _brute_force_match(names, basket_name, threshold):
+    """Return the best entry by scoring every pair with get_similarity."""
+    best_index, best_score = None, 0.0
+    for index, name in enumerate(names):
+        if not name:
+            continue
+        score = ShoppingListMatcher.get_similarity(basket_name, name)
+        if score > best_score and score >= threshold:
+            best_index, best_score = index, score
+    return best_index, best_score
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.65, 0.7, 0.8, 0.95])
+def test_match_prepared_matches_brute_force(mock_hass, threshold):
+    """Test the trigram index returns the same matches as scoring every pair."""
+    rng = random.Random(threshold)
+    words = ["tomato", "tomatoes", "milk", "oat", "oats", "rye", "bread", "kale"]
+    words += ["ab", "b", "cherry", "carrot", "pears", "pear"]
+    extras = ["", "Organic", "Bio", "1kg", "(bunch)"]
+
+    def name():
+        picked = rng.sample(words, rng.randint(0, 3))
+        return " ".join([rng.choice(extras), *picked, rng.choice(extras)]).strip()
+
+    names = [name() for _ in range(60)]
+    prepared = PreparedShoppingList([{"id": i, "name": n} for i, n in enumerate(names)])
+    basket_items = [
+        BasketItem(name=name() or "Organic", quantity=1.0, unit="pcs")
+        for _ in range(40)
+    ]
+    matcher = ShoppingListMatcher(mock_hass, threshold=threshold)
+    matches = matcher.match_prepared(basket_items, prepared)
+
+    for item in basket_items:
+        index, score = _brute_force_match(names, item.name, threshold)
+        if index is None:
+            assert item.name not in matches
+        else:
+            assert matches[item.name]["shopping_list_item"]["id"] == index
+            assert matches[item.name]["similarity"] == score
+
+
+def test_candidates_ranked_by_shared_trigrams():
+    """Test candidates sharing no trigram are left out above the bound."""
+    prepared = PreparedShoppingList(
+        [{"name": "Bananas"}, {"name": "Tomatoes"}, {"name": "Cherry Tomatoes"}]
+    )
+    basket = PreparedText.from_text("Cherry Tomatoes")
+    assert prepared.candidates(basket, include_all=False) == [2, 1]
+    assert prepared.candidates(basket, include_all=True) == [2, 1, 0]
+
+
+def test_vector_engine_matches(mock_hass):
+    """Test the NumPy engine finds the obvious matches."""
+    prepared = PreparedShoppingList(
+        [
+            {"id": "1", "name": "Bananas"},
+            {"id": "2", "name": "Milk"},
+            {"id": "3", "name": "Bio Milk"},
+            {"id": "4", "name": "Cherry Tomatoes"},
+        ]
+    )
+    basket_items = [
+        BasketItem(name="Organic Milk", quantity=1.0, unit="L"),
+        BasketItem(name="Cherry Tomatoes 500g", quantity=0.5, unit="kg"),
+        BasketItem(name="Carrots", quantity=1.0, unit="kg"),
+    ]
+    matcher = ShoppingListMatcher(mock_hass, 0.8, MATCH_ENGINE_VECTOR)
+    assert matcher.engine == MATCH_ENGINE_VECTOR
+
+    matches = matcher.match_prepared(basket_items, prepared)
+
+    assert set(matches) == {"Organic Milk", "Cherry Tomatoes 500g"}
+    # Identical names score 1.0 and ties go to the first entry
+    assert matches["Organic Milk"]["shopping_list_item"]["id"] == "2"
+    assert matches["Organic Milk"]["similarity"] == 1.0
+    assert matches["Cherry Tomatoes 500g"]["shopping_list_item"]["id"] == "4"
+
+
+def test_vector_engine_substring_bonus(mock_hass):
+    """Test the NumPy engine applies the substring bonus like get_similarity."""
+    prepared = PreparedShoppingList([{"name": "a"}, {"name": "Apple Juice"}])
+    basket_items = [BasketItem(name="Juice", quantity=1.0, unit="L")]
+    matcher = ShoppingListMatcher(mock_hass, 0.5, MATCH_ENGINE_VECTOR)
+
+    match = matcher.match_prepared(basket_items, prepared)["Juice"]
+
+    assert match["shopping_list_item"]["name"] == "Apple Juice"
+    assert match["similarity"] == pytest.approx(
+        ShoppingListMatcher.get_similarity("Juice", "Apple Juice")
+    )
+
+
+def test_vector_engine_falls_back_without_numpy(mock_hass):
+    """Test the difflib engine is used when NumPy is missing."""
+    with patch("custom_components.organic_box.shopping_list_matcher.HAS_NUMPY", False):
+        matcher = ShoppingListMatcher(mock_hass, 0.8, MATCH_ENGINE_VECTOR)
+    assert matcher.engine == MATCH_ENGINE_DIFFLIB
+
+
+@pytest.mark.parametrize("engine", [MATCH_ENGINE_DIFFLIB, MATCH_ENGINE_VECTOR])
+def test_one_to_one_uses_each_entry_once(mock_hass, engine):
+    """Test two basket items cannot claim the same list entry."""
+    prepared = PreparedShoppingList(
+        [{"id": "1", "name": "Möhren"}, {"id": "2", "name": "Möhren Bund"}]
+    )
+    basket_items = [
+        BasketItem(name="Möhren lose", quantity=1.0, unit="kg"),
+        BasketItem(name="Möhren Bund", quantity=1.0, unit="pcs"),
+        BasketItem(name="Möhren", quantity=1.0, unit="kg"),
+    ]
+
+    independent = ShoppingListMatcher(mock_hass, 0.6, engine)
+    matches = independent.match_prepared(basket_items, prepared)
+    claimed = [match["shopping_list_item"]["id"] for match in matches.values()]
+    assert len(claimed) > len(set(claimed))
+
+    matcher = ShoppingListMatcher(mock_hass, 0.6, engine, one_to_one=True)
+    matches = matcher.match_prepared(basket_items, prepared)
+    assert {
+        name: match["shopping_list_item"]["id"] for name, match in matches.items()
+    } == {"Möhren Bund": "2", "Möhren": "1"}
+
+
+def _subscribe(matcher, mock_hass):
+    """Subscribe the matcher and return the shopping list event handler."""
+    on_change = MagicMock()
+    matcher.async_subscribe(on_change)
+    handler = mock_hass.bus.async_listen.call_args.args[1]
+    return handler, on_change
+
+
+async def test_match_items_memoized_while_subscribed(matcher, mock_hass):
+    """Test matches are reused until the basket or shopping list changes."""
+    mock_hass.services.has_service.return_value = True
+    mock_hass.data = {
+        "shopping_list": {"items": [{"id": "1", "name": "Milk", "complete": False}]}
+    }
+    handler, on_change = _subscribe(matcher, mock_hass)
+    basket_items = [BasketItem(name="Organic Milk", quantity=1.0, unit="L")]
+
+    with patch.object(
+        matcher, "get_shopping_list_items", wraps=matcher.get_shopping_list_items
+    ) as get_items:
+        first = await matcher.match_items(basket_items)
+        second = await matcher.match_items(basket_items)
+        assert second is first
+        assert get_items.call_count == 1
+
+        handler(MagicMock())
+        on_change.assert_called_once()
+        await matcher.match_items(basket_items)
+        assert get_items.call_count == 2
+
+        # A different basket is matched again
+        await matcher.match_items([BasketItem(name="Milk", quantity=1.0, unit="L")])
+        assert get_items.call_count == 3
+
+
+async def test_match_items_not_memoized_while_unavailable(matcher, mock_hass):
+    """Test a shopping list set up after the first match is still matched."""
+    mock_hass.services.has_service.return_value = False
+    _subscribe(matcher, mock_hass)
+    basket_items = [BasketItem(name="Organic Milk", quantity=1.0, unit="L")]
+
+    assert await matcher.match_items(basket_items) == {}
+
+    # No update event announces the shopping list becoming ready
+    mock_hass.services.has_service.return_value = True
+    mock_hass.data = {
+        "shopping_list": {"items": [{"id": "1", "name": "Milk", "complete": False}]}
+    }
+    matches = await matcher.match_items(basket_items)
+    assert matches["Organic Milk"]["shopping_list_item"]["id"] == "1"
+
+
+@pytest.mark.parametrize("seed", range(10))
+async def test_incremental_rematch_matches_full_run(mock_hass, seed):
+    """Test rematching after list edits gives the same result as a full run."""
+    rng = random.Random(seed)
+    words = ["tomatoes", "milk", "oat", "rye", "bread", "kale", "carrots", "pear"]
+
+    def name():
+        return " ".join(rng.sample(words, rng.randint(1, 2)))
+
+    items = [{"id": str(i), "name": name(), "complete": False} for i in range(15)]
+    mock_hass.services.has_service.return_value = True
+    mock_hass.data = {"shopping_list": {"items": items}}
+    basket_items = [
+        BasketItem(name=name(), quantity=1.0, unit="pcs") for _ in range(10)
+    ]
+    matcher = ShoppingListMatcher(mock_hass, threshold=0.7)
+    handler, _ = _subscribe(matcher, mock_hass)
+    await matcher.match_items(basket_items)
+
+    for step in range(5):
+        action = rng.choice(["add", "remove", "rename"])
+        if action == "add" or not items:
+            items.append({"id": f"new{step}", "name": name(), "complete": False})
+        elif action == "remove":
+            items.pop(rng.randrange(len(items)))
+        else:
+            rng.choice(items)["name"] = name()
+        handler(MagicMock())
+
+        with patch.object(
+            matcher, "_match_best", wraps=matcher._match_best
+        ) as full_run:
+            matches = await matcher.match_items(basket_items)
+        full_run.assert_not_called()
+        fresh = ShoppingListMatcher(mock_hass, threshold=0.7)
+        assert matches == await fresh.match_items(basket_items)
+
+
+async def test_mark_items_as_delivered_by_id(hass):
+    """Test items are completed by id with a single save of the list."""
+    shopping_data = ShoppingData(hass)
+    shopping_data.items = [
+        {"id": "1", "name": "Milk", "complete": False},
+        {"id": "2", "name": "Milk", "complete": False},
+        {"id": "3", "name": "Bread", "complete": False},
+        {"id": "4", "name": "Eggs", "complete": True},
+    ]
+    hass.data["shopping_list"] = shopping_data
+    hass.services.async_register("shopping_list", "complete_item", AsyncMock())
+    events = async_capture_events(hass, EVENT_SHOPPING_LIST_UPDATED)
+    matches = {
+        "Organic Milk": {"shopping_list_item": shopping_data.items[0]},
+        "Fresh Milk": {"shopping_list_item": shopping_data.items[0]},
+        "Bread": {"shopping_list_item": shopping_data.items[2]},
+        "Eggs": {"shopping_list_item": shopping_data.items[3]},
+    }
+
+    with patch.object(ShoppingData, "save") as save:
+        completed = await ShoppingListMatcher(hass).mark_items_as_delivered(
+            matches, datetime(2025, 11, 10)
+        )
+        await hass.async_block_till_done()
+
+    save.assert_called_once()
+    assert sorted(completed) == ["1", "3", "4"]
+    # The duplicate name is left alone, unlike completion by name
+    assert [item["complete"] for item in shopping_data.items] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+    assert [event.data["item"]["id"] for event in events] == ["1", "3"]
+    assert {event.data["action"] for event in events} == {"complete"}
+
+
+async def test_mark_items_as_delivered_without_save_falls_back(hass):
+    """Test the service is called if the shopping list data cannot be saved."""
+    shopping_data = ShoppingData(hass)
+    shopping_data.items = [{"id": "1", "name": "Milk", "complete": False}]
+    hass.data["shopping_list"] = shopping_data
+    complete_item = AsyncMock()
+    hass.services.async_register("shopping_list", "complete_item", complete_item)
+    matches = {"Organic Milk": {"shopping_list_item": shopping_data.items[0]}}
+
+    with patch.object(ShoppingData, "_async_notify", None):
+        completed = await ShoppingListMatcher(hass).mark_items_as_delivered(
+            matches, None
+        )
+
+    assert completed == ["1"]
+    assert complete_item.call_args.args[0].data == {"name": "Milk"}
+
+
+@pytest.mark.asyncio
+async def test_mark_items_as_delivered_service_fallback(matcher, mock_hass):
+    """Test the service is called concurrently once per name as a fallback."""
+    mock_hass.data = {"shopping_list": {}}
+
+    async def complete_item(domain, service, data, blocking):
+        if data["name"] == "Bread":
+            raise ValueError("No matching item")
+
+    mock_hass.services.async_call.side_effect = complete_item
+    matches = {
+        "Organic Milk": {"shopping_list_item": {"id": "1", "name": "Milk"}},
+        "Fresh Milk": {"shopping_list_item": {"id": "2", "name": "Milk"}},
+        "Bread": {"shopping_list_item": {"id": "3", "name": "Bread"}},
+    }
+
+    completed = await matcher.mark_items_as_delivered(matches, None)
+
+    assert completed == ["1", "2"]
+    assert mock_hass.services.async_call.call_count == 2
+
+
+@pytest.mark.parametrize(("pair_limit", "in_executor"), [(4, True), (5, False)])
+async def test_match_items_offloads_large_jobs(
+    matcher, mock_hass, pair_limit, in_executor
+):
+    """Test scoring runs in the executor once the pair count reaches the limit."""
+    mock_hass.services.has_service.return_value = True
+    mock_hass.data = {
+        "shopping_list": {
+            "items": [
+                {"id": "1", "name": "Milk", "complete": False},
+                {"id": "2", "name": "Bread", "complete": False},
+            ]
+        }
+    }
+    mock_hass.async_add_executor_job = AsyncMock(
+        side_effect=lambda target, *args: target(*args)
+    )
+    basket_items = [
+        BasketItem(name="Organic Milk", quantity=1.0, unit="L"),
+        BasketItem(name="Rye Bread", quantity=1.0, unit="pcs"),
+    ]
+
+    with patch(
+        "custom_components.organic_box.shopping_list_matcher.MATCH_EXECUTOR_PAIRS",
+        pair_limit,
+    ):
+        matches = await matcher.match_items(basket_items)
+
+    assert matches["Organic Milk"]["shopping_list_item"]["id"] == "1"
+    assert mock_hass.async_add_executor_job.called is in_executor
+    diagnostics = matcher.diagnostics()
+    assert diagnostics["runs"] == 1
+    assert diagnostics["executor_runs"] == int(in_executor)
+    assert diagnostics["last_pairs"] == 4
+    assert diagnostics["last_duration"] >= 0
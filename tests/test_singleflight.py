@@ -0,0 +1,74 @@
+"""Tests for request coalescing."""
+
+import asyncio
+
+import pytest
+
+from custom_components.organic_box.singleflight import SingleFlight
+
+
+@pytest.mark.unit
+async def test_single_flight_shares_in_flight_call():
+    """Test that concurrent callers of one key share a single call."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def _call() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    first = asyncio.ensure_future(single_flight.run("key", _call))
+    second = asyncio.ensure_future(single_flight.run("key", _call))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, second) == [42, 42]
+    assert calls == 1
+    assert single_flight.calls == 1
+    assert single_flight.coalesced == 1
+
+    # Finished calls are not reused
+    assert await single_flight.run("key", _call) == 42
+    assert calls == 2
+
+
+@pytest.mark.unit
+async def test_single_flight_shares_exceptions():
+    """Test that all callers receive the exception of the shared call."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def _call() -> None:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    first = asyncio.ensure_future(single_flight.run("key", _call))
+    second = asyncio.ensure_future(single_flight.run("key", _call))
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.unit
+async def test_single_flight_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling one waiter keeps the shared call running."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def _call() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(single_flight.run("key", _call))
+    second = asyncio.ensure_future(single_flight.run("key", _call))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
@@ -0,0 +1,119 @@
+"""Tests for to-do lists as a shopping list matcher source."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.organic_box.models import BasketItem
+from custom_components.organic_box.shopping_list_matcher import ShoppingListMatcher
+
+LISTS = {
+    "todo.groceries": [
+        {"uid": "a1", "summary": "Milk", "status": "needs_action"},
+        {"uid": "a2", "summary": "Karotten", "status": "needs_action"},
+    ],
+    "todo.market": [
+        {"uid": "b1", "summary": "Rye Bread", "status": "needs_action"},
+        {"uid": "b2", "summary": "Eggs", "status": "needs_action"},
+    ],
+}
+
+
+@pytest.fixture
+def todo_calls(hass: HomeAssistant) -> list[dict]:
+    """Register fake to-do services and return the update_item calls."""
+    updates: list[dict] = []
+
+    async def get_items(call: ServiceCall) -> dict:
+        entity_id = call.data["entity_id"]
+        if entity_id == "todo.broken":
+            raise HomeAssistantError("List unavailable")
+        return {entity_id: {"items": LISTS[entity_id]}}
+
+    async def update_item(call: ServiceCall) -> None:
+        if call.data["item"] == "b2":
+            raise HomeAssistantError("Item is locked")
+        updates.append(dict(call.data))
+
+    hass.services.async_register(
+        "todo", "get_items", get_items, supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register("todo", "update_item", update_item)
+    return updates
+
+
+@pytest.mark.integration
+async def test_match_items_from_todo_lists(
+    hass: HomeAssistant, todo_calls: list[dict]
+) -> None:
+    """Test that the items of all readable lists are matched together."""
+    matcher = ShoppingListMatcher(
+        hass,
+        threshold=0.8,
+        todo_entities=["todo.groceries", "todo.broken", "todo.market"],
+    )
+    basket_items = [
+        BasketItem(name="Bio Möhren", quantity=1.0),
+        BasketItem(name="Organic Rye Bread", quantity=1.0),
+    ]
+
+    matches = await matcher.match_items(basket_items)
+
+    assert {
+        name: match["shopping_list_item"]["id"] for name, match in matches.items()
+    } == {"Bio Möhren": "todo.groceries/a2", "Organic Rye Bread": "todo.market/b1"}
+
+
+@pytest.mark.integration
+async def test_mark_items_as_delivered_updates_todo_items(
+    hass: HomeAssistant, todo_calls: list[dict]
+) -> None:
+    """Test that matches are completed in batches with todo.update_item."""
+    matcher = ShoppingListMatcher(
+        hass, threshold=0.8, todo_entities=["todo.groceries", "todo.market"]
+    )
+    items = await matcher.get_shopping_list_items()
+    matches = {
+        item["name"]: {"shopping_list_item": item, "similarity": 1.0} for item in items
+    }
+
+    with patch("custom_components.organic_box.todo_source.TODO_UPDATE_BATCH_SIZE", 1):
+        completed = await matcher.mark_items_as_delivered(
+            matches, datetime(2025, 11, 10)
+        )
+
+    assert sorted(completed) == [
+        "todo.groceries/a1",
+        "todo.groceries/a2",
+        "todo.market/b1",
+    ]
+    assert sorted((call["entity_id"], call["item"]) for call in todo_calls) == [
+        ("todo.groceries", "a1"),
+        ("todo.groceries", "a2"),
+        ("todo.market", "b1"),
+    ]
+    assert {call["status"] for call in todo_calls} == {"completed"}
+
+
+@pytest.mark.integration
+async def test_subscribe_follows_todo_list_writes(
+    hass: HomeAssistant, todo_calls: list[dict]
+) -> None:
+    """Test that changed and unchanged writes of a list invalidate matches."""
+    matcher = ShoppingListMatcher(hass, todo_entities=["todo.groceries"])
+    changes = []
+    unsubscribe = matcher.async_subscribe(lambda: changes.append(matcher.revision))
+
+    hass.states.async_set("todo.groceries", "2")
+    hass.states.async_set("todo.groceries", "2")
+    hass.states.async_set("todo.other", "1")
+    await hass.async_block_till_done()
+    assert changes == [1, 2]
+
+    unsubscribe()
+    hass.states.async_set("todo.groceries", "1")
+    await hass.async_block_till_done()
+    assert changes == [1, 2]